@@ -244,6 +244,9 @@ class WorkflowFileManager:
         if not workflow_data:
             return {'node_count': 0, 'connection_count': 0, 'node_types': []}
         
+        # Imported here: scripts.workflow_catalog imports this package at load time
+        from scripts.workflow_catalog import _is_connection
+        
         node_count = len(workflow_data)
         connection_count = 0
         node_types = set()
@@ -256,7 +259,7 @@ class WorkflowFileManager:
                 # Count connections
                 inputs = node_data.get('inputs', {})
                 for param_value in inputs.values():
-                    if isinstance(param_value, list) and len(param_value) == 2:
+                    if _is_connection(param_value):
                         connection_count += 1
         
         return {
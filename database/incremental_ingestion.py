@@ -24,7 +24,7 @@ from .database import get_database_manager, WorkflowFileManager, initialize_data
 from .models import WorkflowFile
 from scripts.workflow_catalog import (
     scan_directory_for_images, extract_workflow_from_image, 
-    extract_image_metadata, analyze_workflow
+    extract_image_metadata, analyze_workflow, _is_connection
 )
 
 
@@ -320,7 +320,7 @@ class IncrementalIngestionManager:
                 # Count connections
                 inputs = node_data.get('inputs', {})
                 for param_value in inputs.values():
-                    if isinstance(param_value, list) and len(param_value) == 2:
+                    if _is_connection(param_value):
                         connection_count += 1
         
         return {
@@ -0,0 +1 @@
+"""ComfyREST command-line scripts; also imported by the web interface."""
@@ -15,16 +15,30 @@ Note: For the most advanced features, use enhanced_workflow_catalog.py instead.
 """
 
 import argparse
+import base64
+import gzip
+import html as _html
+import io
 import json
 import sys
 import os
+import threading
+import time
 import mimetypes
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
-from dataclasses import dataclass
+from string import Template
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, NamedTuple, Tuple, Optional, Union
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import hashlib
 
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
 # Import image processing if available
 try:
     from PIL import Image
@@ -32,6 +46,38 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+# Import orjson for faster workflow JSON loading if available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The stdlib parser also accepts NaN/Infinity, which json.dumps-written metadata can contain
+            return json.loads(data)
+
+    def _load(f):
+        return _loads(f.read())
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _loads, _load = json.loads, json.load
+
+# Import ijson for streaming very large workflow JSON if available
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Import brotli for precompressed catalog pages if available
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 # Import database functionality if available
 try:
     # Add parent directory to path to import database package
@@ -42,6 +88,130 @@ try:
 except ImportError:
     DATABASE_AVAILABLE = False
 
+# Catalog page templates are compiled once at import (bytecode cached across runs); cards
+# and filter options are pre-rendered HTML fragments, so autoescaping stays off.
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(str(Path(__file__).parent / "templates")),
+    autoescape=False,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+_MASTER_CATALOG_TEMPLATE = _TEMPLATE_ENV.get_template("master_catalog.html.j2")
+_COMPREHENSIVE_CATALOG_TEMPLATE = _TEMPLATE_ENV.get_template("comprehensive_catalog.html.j2")
+
+# Catalog thumbnails are downscaled before embedding and cached across runs
+THUMBNAIL_MAX_SIZE = (256, 256)
+THUMBNAIL_CACHE_DIR = Path.home() / ".cache" / "comfyrest" / "thumbs"
+THUMBNAIL_CACHE_MAX_ENTRIES = 5000
+
+# Workflow JSON files above this size are parsed incrementally when ijson is available
+STREAMING_JSON_THRESHOLD = 50 * 1024 * 1024
+
+# /object_info responses only change when the ComfyUI server restarts with new nodes
+OBJECT_INFO_CACHE_DIR = Path.home() / ".cache" / "comfyrest" / "object_info"
+OBJECT_INFO_CACHE_TTL = 3600  # seconds
+
+# Node types that terminate a workflow (save/preview/display results)
+OUTPUT_NODE_TYPES = frozenset(map(sys.intern, ("SaveImage", "PreviewImage", "Griptape Display: Text")))
+
+# Image types the catalogs render as thumbnails, and their MIME types
+_MIME_BY_EXT = MappingProxyType({
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg'
+})
+_IMAGE_EXTS = frozenset(_MIME_BY_EXT)
+
+# Display icons for non-image files in the comprehensive catalog
+_FILE_TYPE_ICONS = MappingProxyType({
+    'workflow_json': '⚙️',
+    'json_other': '📄',
+    'json_invalid': '❌',
+    'text_file': '📝',
+    'markdown_file': '📖',
+    'python_file': '🐍',
+    'javascript_file': '📜',
+    'html_file': '🌐',
+    'css_file': '🎨',
+    'yaml_file': '⚙️',
+    'xml_file': '📋',
+    'other_file': '📄',
+    'no_extension': '❓',
+    'error': '💥'
+})
+
+# Per-node fragments of the single-workflow HTML page; only the holes change per node
+_NODE_CARD_HEAD = Template('''
+            <div class="bg-white rounded-lg shadow-sm border p-4 hover:shadow-md transition-shadow">
+                <div class="flex items-center gap-2 mb-3">
+                    <span class="text-2xl">⚙️</span>
+                    <div>
+                        <h3 class="font-bold text-lg text-gray-900">Node $node_id</h3>
+                        <p class="text-sm text-gray-600">$class_type</p>
+                    </div>
+                </div>
+                
+                <h4 class="font-medium text-gray-800 mb-2">$title</h4>
+                
+                <div class="text-xs text-gray-500 mb-3">
+                    🔗 $connection_count inputs • ⚙️ $param_count params
+                </div>
+                ''')
+_CONNECTION_ROW = Template(
+    '                        <div class="bg-blue-50 p-1 rounded flex justify-between"><span class="text-blue-700 font-medium">$param_name:</span><span class="text-blue-600">→ Node $source</span></div>\n'
+)
+_PARAM_ROW = Template('''                        <div class="bg-gray-50 p-1 rounded">
+                            <div class="flex justify-between items-center">
+                                <span class="font-medium">$param_name:</span>
+                                <div class="flex items-center gap-1">
+                                    <span class="text-gray-600 break-all" title="$full_value">$value</span>$dropdown_hint
+                                    <button class="copy-btn ml-1 px-1 py-0.5 text-xs bg-gray-200 rounded hover:bg-blue-500 hover:text-white transition-colors" 
+                                            data-copy-text="$copy_command"
+                                            id="$copy_id"
+                                            aria-label="Copy command line argument">
+                                        📋
+                                    </button>
+                                </div>
+                            </div>
+                        </div>
+''')
+
+# Titles, class types and parameter names repeat across nodes and workflows
+_esc = lru_cache(maxsize=4096)(_html.escape)
+
+# Offline dropdown hints: known dropdown inputs, and suffixes that usually mean a fixed option list
+_KNOWN_DROPDOWNS = frozenset({'sampler_name', 'model_name', 'vae_name', 'lora_name'})
+_HINT_SUFFIXES = ('_mode', '_method', '_type')
+
+# Markdown catalogs skip the mermaid diagram above this many nodes; it would not render usefully
+MERMAID_MAX_NODES = 80
+
+# Mermaid node labels: spaces become underscores, label-breaking punctuation is dropped
+_MERMAID_TRANS = str.maketrans({" ": "_", ":": None, "(": None, ")": None})
+
+
+_LINK_SOURCE_TYPES = (str, int)
+
+
+class Connection(NamedTuple):
+    """A node input linked to another node's output (API format [source, output_index])."""
+    src: Union[str, int]
+    idx: int
+
+
+def _is_connection(value: Any) -> bool:
+    """Whether an input value is a link: a Connection or a raw [source_node, output_index] list.
+
+    The source is a str or int node ID and the output index an int; other two-item
+    lists (sizes, nested pairs) are plain parameters.
+    """
+    value_type = type(value)
+    if value_type is Connection:
+        return True
+    return (value_type is list and len(value) == 2
+            and type(value[0]) in _LINK_SOURCE_TYPES and type(value[1]) is int)
+
 
 @dataclass
 class WorkflowImageData:
@@ -50,6 +220,8 @@ class WorkflowImageData:
     workflow: Dict  # API format (for compatibility)
     metadata: Dict
     original_workflow: Optional[Dict] = None  # UI format (for model extraction)
+    models: Optional[Dict[str, List[str]]] = field(default=None, repr=False)  # Cached extract_models_from_workflow result
+    analysis: Optional[Dict] = field(default=None, repr=False)  # Cached analyze_workflow result
     
     @property
     def workflow_summary(self) -> Dict:
@@ -57,11 +229,13 @@ class WorkflowImageData:
         if not self.workflow:
             return {"total_nodes": 0, "node_types": [], "connections": 0}
             
-        analysis = analyze_workflow(self.workflow)
+        if self.analysis is None:
+            self.analysis = analyze_workflow(self.workflow)
+        analysis = self.analysis
         return {
             "total_nodes": analysis["total_nodes"],
             "node_types": list(analysis["node_types"].keys()),
-            "connections": len(analysis["connections"])
+            "connections": analysis["connections_count"]
         }
     
     @property
@@ -71,7 +245,7 @@ class WorkflowImageData:
         return {
             "filename": self.image_path.name,
             "size_mb": round(stat.st_size / (1024 * 1024), 2),
-            "modified": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
+            "modified": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime)),
             "relative_path": str(self.image_path.resolve())
         }
 
@@ -85,11 +259,13 @@ class FileAnalysisResult:
     metadata: Optional[Dict] = None
     error_message: Optional[str] = None
     file_size: Optional[int] = None
+    modified_time: Optional[float] = None  # st_mtime captured during analysis
     file_type: Optional[str] = None
     thumbnail_path: Optional[Path] = None
     catalog_path: Optional[Path] = None
     models: Optional[Dict[str, List[str]]] = None
     node_types: Optional[List[str]] = None
+    analysis: Optional[Dict] = field(default=None, repr=False)  # Cached analyze_workflow result
     
     def __post_init__(self):
         """Clean up file_type and extract workflow metadata."""
@@ -119,8 +295,9 @@ class FileAnalysisResult:
         # Extract models and node types from workflow if present
         if self.workflow:
             self.models = extract_models_from_workflow(self.workflow)
-            analysis = analyze_workflow(self.workflow)
-            self.node_types = list(analysis["node_types"].keys())
+            if self.analysis is None:
+                self.analysis = analyze_workflow(self.workflow)
+            self.node_types = list(self.analysis["node_types"].keys())
     
     @property
     def workflow_summary(self) -> Dict:
@@ -132,7 +309,7 @@ class FileAnalysisResult:
         return {
             "total_nodes": analysis["total_nodes"],
             "node_types": list(analysis["node_types"].keys()),
-            "connections": len(analysis["connections"])
+            "connections": analysis["connections_count"]
         }
     
     @property
@@ -142,7 +319,7 @@ class FileAnalysisResult:
         return {
             "filename": self.image_path.name,
             "size_mb": round(stat.st_size / (1024 * 1024), 2),
-            "modified": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
+            "modified": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime)),
             "relative_path": str(self.image_path.relative_to(self.image_path.parent.parent))
         }
 
@@ -165,11 +342,13 @@ class FileAnalysisResult:
         if not self.has_workflow:
             return {"total_nodes": 0, "node_types": {}, "connections": 0}
             
-        analysis = analyze_workflow(self.workflow)
+        if self.analysis is None:
+            self.analysis = analyze_workflow(self.workflow)
+        analysis = self.analysis
         return {
             "total_nodes": analysis["total_nodes"],
             "node_types": list(analysis["node_types"].keys()),
-            "connections": len(analysis["connections"])
+            "connections": analysis["connections_count"]
         }
     
     @property
@@ -179,7 +358,7 @@ class FileAnalysisResult:
         return {
             "filename": self.file_path.name,
             "size_mb": round(stat.st_size / (1024 * 1024), 2),
-            "modified": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
+            "modified": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime)),
             "relative_path": str(self.file_path.relative_to(self.file_path.parent.parent))
         }
     
@@ -280,7 +459,6 @@ def analyze_all_files(file_paths: List[Path]) -> List[FileAnalysisResult]:
     results = []
     
     # Categorize files by type
-    image_extensions = {'.png', '.webp', '.jpg', '.jpeg'}
     json_extensions = {'.json'}
     
     print(f"🔬 Analyzing {len(file_paths)} files...")
@@ -293,7 +471,7 @@ def analyze_all_files(file_paths: List[Path]) -> List[FileAnalysisResult]:
         
         try:
             # Determine file type and process accordingly
-            if suffix in image_extensions:
+            if suffix in _IMAGE_EXTS:
                 result = analyze_image_file(file_path, error_info)
             elif suffix in json_extensions:
                 result = analyze_json_file(file_path, error_info)
@@ -369,8 +547,8 @@ def analyze_image_file(file_path: Path, error_info: Dict) -> FileAnalysisResult:
 def analyze_json_file(file_path: Path, error_info: Dict) -> FileAnalysisResult:
     """Analyze a JSON file to see if it's a ComfyUI workflow."""
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = _load(f)
         
         # Check if it looks like a ComfyUI workflow
         if isinstance(data, dict):
@@ -567,9 +745,9 @@ def extract_from_png(image_path: Path) -> Optional[Dict]:
                 if key in img.info:
                     try:
                         if isinstance(img.info[key], str):
-                            return json.loads(img.info[key])
+                            return _loads(img.info[key])
                         elif isinstance(img.info[key], bytes):
-                            return json.loads(img.info[key].decode('utf-8'))
+                            return _loads(img.info[key].decode('utf-8'))
                     except (json.JSONDecodeError, UnicodeDecodeError):
                         continue
             
@@ -578,7 +756,7 @@ def extract_from_png(image_path: Path) -> Optional[Dict]:
                 if isinstance(value, (str, bytes)):
                     try:
                         text = value.decode('utf-8') if isinstance(value, bytes) else value
-                        data = json.loads(text)
+                        data = _loads(text)
                         # Check if it looks like a ComfyUI workflow
                         if isinstance(data, dict) and ('nodes' in data or 'class_type' in str(data)):
                             return data
@@ -603,7 +781,7 @@ def extract_from_webp(image_path: Path) -> Optional[Dict]:
                     if isinstance(value, (str, bytes)):
                         try:
                             text = value.decode('utf-8') if isinstance(value, bytes) else value
-                            data = json.loads(text)
+                            data = _loads(text)
                             if isinstance(data, dict) and ('nodes' in data or 'class_type' in str(data)):
                                 return data
                         except (json.JSONDecodeError, UnicodeDecodeError):
@@ -627,14 +805,14 @@ def extract_with_exiftool(image_path: Path) -> Optional[Dict]:
         )
         
         if result.returncode == 0:
-            exiftool_data = json.loads(result.stdout)
+            exiftool_data = _loads(result.stdout)
             if exiftool_data:
                 # Scan all string fields for JSON
                 for item in exiftool_data:
                     for key, value in item.items():
                         if isinstance(value, str):
                             try:
-                                data = json.loads(value)
+                                data = _loads(value)
                                 if isinstance(data, dict) and ('nodes' in data or 'class_type' in str(data)):
                                     return data
                             except json.JSONDecodeError:
@@ -788,8 +966,9 @@ def store_workflow_in_database(workflow_manager: WorkflowFileManager,
     
     try:
         # Extract models from workflow for auto-tagging
-        analysis = analyze_workflow(workflow_data.workflow)
-        models_info = analysis.get('models', {})
+        if workflow_data.analysis is None:
+            workflow_data.analysis = analyze_workflow(workflow_data.workflow)
+        models_info = workflow_data.analysis.get('models', {})
         
         # Auto-generate tags from models - DISABLED to avoid tag clutter
         # auto_tags = []
@@ -823,6 +1002,28 @@ def store_workflow_in_database(workflow_manager: WorkflowFileManager,
         return False
 
 
+def _normalize_workflow(workflow: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a freshly loaded API-format workflow in place.
+    
+    Interns class_type values and input names, which repeat across nodes, and
+    turns [source_node, output_index] links into Connection tuples.
+    """
+    intern = sys.intern
+    for node_data in workflow.values():
+        if not isinstance(node_data, dict):
+            continue
+        class_type = node_data.get("class_type")
+        if isinstance(class_type, str):
+            node_data["class_type"] = intern(class_type)
+        inputs = node_data.get("inputs")
+        if isinstance(inputs, dict):
+            node_data["inputs"] = {
+                intern(k): Connection(v[0], v[1]) if _is_connection(v) else v
+                for k, v in inputs.items()
+            }
+    return workflow
+
+
 def extract_workflow_from_image(image_path: Path, preserve_original_format: bool = False) -> Optional[Dict[str, Any]]:
     """Extract ComfyUI workflow from image based on file extension."""
     if not PIL_AVAILABLE:
@@ -845,19 +1046,39 @@ def extract_workflow_from_image(image_path: Path, preserve_original_format: bool
             return raw_workflow
         else:
             # Convert UI format to API format that ComfyREST expects
-            return ui_to_api_format(raw_workflow)
+            return _normalize_workflow(ui_to_api_format(raw_workflow))
     
     return None
 
 
+def _node_sort_key(node_id) -> Tuple[int, Any]:
+    """Sort key placing numeric node IDs first, in numeric order."""
+    try:
+        return (0, int(node_id))
+    except (TypeError, ValueError):
+        return (1, str(node_id))
+
+
+def _sorted_node_ids(node_ids) -> List[str]:
+    """Sort node IDs with _node_sort_key, using a plain int key when every ID is numeric."""
+    node_ids = list(node_ids)
+    if all(type(k) is str and k.isdecimal() for k in node_ids):
+        return sorted(node_ids, key=int)
+    return sorted(node_ids, key=_node_sort_key)
+
+
 def analyze_workflow(workflow: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze workflow structure and extract metadata."""
     analysis = {
         "total_nodes": len(workflow),
         "node_types": {},
         "connections": [],
+        "connections_count": 0,
+        "out_edges": {},  # source node -> [(target, input_param, output_index)]
+        "in_edges": {},  # target node -> [(source, input_param, output_index)]
         "input_nodes": [],
         "output_nodes": [],
+        "dangling": [],  # (node, input_param, missing source node)
         "parameters": {}
     }
     
@@ -871,6 +1092,20 @@ def analyze_workflow(workflow: Dict[str, Any]) -> Dict[str, Any]:
         nodes_dict = {k: v for k, v in workflow.items() if isinstance(v, dict)}
         nodes = [(node_id, node_data) for node_id, node_data in nodes_dict.items()]
     
+    # Nodes whose outputs feed another node, and output-type nodes to check against them
+    has_consumers = set()
+    output_candidates = []
+    class_types = []  # Counted in one C-level pass after the loop
+    out_edges = analysis["out_edges"]
+    in_edges = analysis["in_edges"]
+    valid_ids = workflow.keys()
+    
+    # UI format keeps links in a top-level array: [id, origin_id, origin_slot, target_id, target_slot, type]
+    if isinstance(workflow.get('links'), list):
+        for link in workflow['links']:
+            if isinstance(link, list) and len(link) >= 4:
+                has_consumers.add(link[1])
+    
     # Count node types and analyze connections
     for item in nodes:
         if isinstance(item, tuple):
@@ -883,7 +1118,7 @@ def analyze_workflow(workflow: Dict[str, Any]) -> Dict[str, Any]:
             node_id = node_data.get("id", "unknown")
             class_type = node_data.get("type", node_data.get("class_type", "Unknown"))
             
-        analysis["node_types"][class_type] = analysis["node_types"].get(class_type, 0) + 1
+        class_types.append(class_type)
         
         # Check inputs for connections (handle both formats)
         inputs = node_data.get("inputs", {})
@@ -902,24 +1137,41 @@ def analyze_workflow(workflow: Dict[str, Any]) -> Dict[str, Any]:
             
             for param_name, param_value in inputs.items():
                 # Check if this is a connection (array with node_id and output_index)
-                if isinstance(param_value, list) and len(param_value) == 2:
-                    source_node = param_value[0]
-                    output_index = param_value[1]
+                if _is_connection(param_value):
+                    source_node, output_index = param_value
+                    if source_node not in valid_ids:
+                        if str(source_node) not in valid_ids:
+                            # Link to a node that is not in the workflow
+                            analysis["dangling"].append((node_id, param_name, source_node))
+                            has_connections = True
+                            continue
+                        # Integer source IDs name the same node as its string key
+                        source_node = str(source_node)
+                    has_connections = True
+                    has_consumers.add(source_node)
+                    out_edges.setdefault(source_node, []).append((node_id, param_name, output_index))
+                    in_edges.setdefault(node_id, []).append((source_node, param_name, output_index))
                     analysis["connections"].append({
                         "from": source_node,
                         "to": node_id,
                         "output_index": output_index,
                         "input_param": param_name
                     })
-                    has_connections = True
             
             # Identify input/output nodes (only for old format)
             if not has_connections:
                 analysis["input_nodes"].append(node_id)
         
         # Identify common output node types
-        if class_type in ["SaveImage", "PreviewImage", "Griptape Display: Text"]:
-            analysis["output_nodes"].append(node_id)
+        if class_type in OUTPUT_NODE_TYPES:
+            output_candidates.append(node_id)
+    
+    analysis["node_types"] = Counter(class_types)
+    
+    # Output nodes are output-type nodes nothing else consumes
+    analysis["output_nodes"] = [node_id for node_id in output_candidates if node_id not in has_consumers]
+    analysis["connections_count"] = len(analysis["connections"])
+    analysis["sorted_node_ids"] = _sorted_node_ids(workflow)
     
     return analysis
 
@@ -1009,39 +1261,103 @@ def extract_models_from_workflow(workflow: Dict[str, Any]) -> Dict[str, List[str
     return {k: v for k, v in models.items() if v}
 
 
+def _title_of(node_data: Dict[str, Any], class_type: str) -> str:
+    """Node display title from _meta, falling back to its class type."""
+    meta = node_data.get("_meta")
+    return meta.get("title", class_type) if meta else class_type
+
+
+# Shared read-only stand-in for nodes without inputs
+_NO_INPUTS = MappingProxyType({})
+
+
+def _node_view(node_data: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+    """(class_type, title, inputs) of an API-format node, looked up once per node."""
+    class_type = node_data.get("class_type", "Unknown")
+    return class_type, _title_of(node_data, class_type), node_data.get("inputs") or _NO_INPUTS
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Shorten text to at most limit characters, ending in '...' when cut."""
+    return text if len(text) <= limit else f"{text[:limit - 3]}..."
+
+
+def _format_list_value(value: list, indent: int) -> str:
+    if _is_connection(value):
+        # This is a connection
+        return f"**→ Node {value[0]}** (output {value[1]})"
+    # Regular list
+    if len(value) <= 5:
+        return f"[{', '.join(str(v) for v in value)}]"
+    return f"[{', '.join(str(v) for v in value[:3])}, ... (+{len(value)-3} more)]"
+
+
+def _format_connection_value(value: Connection, indent: int) -> str:
+    return f"**→ Node {value.src}** (output {value.idx})"
+
+
+def _format_dict_value(value: dict, indent: int) -> str:
+    if not value:
+        return "{}"
+    spaces = "  " * indent
+    lines = [f"{spaces}  - **{k}**: {format_parameter_value(v, indent+1)}" for k, v in value.items()]
+    return "\n" + "\n".join(lines)
+
+
+def _format_str_value(value: str, indent: int) -> str:
+    return f'"{_trunc(value, 100)}"'
+
+
+def _format_scalar_value(value: Any, indent: int) -> str:
+    return str(value)
+
+
+# Formatters keyed by exact type; one dict probe instead of an isinstance chain
+_PARAMETER_FORMATTERS = {
+    Connection: _format_connection_value,
+    list: _format_list_value,
+    dict: _format_dict_value,
+    str: _format_str_value,
+    int: _format_scalar_value,
+    float: _format_scalar_value,
+    bool: _format_scalar_value,
+    type(None): _format_scalar_value,
+}
+
+
 def format_parameter_value(value: Any, indent: int = 0) -> str:
     """Format parameter values for display."""
-    spaces = "  " * indent
-    
-    if isinstance(value, list):
-        if len(value) == 2 and isinstance(value[0], str) and isinstance(value[1], int):
-            # This is a connection
-            return f"**→ Node {value[0]}** (output {value[1]})"
-        else:
-            # Regular list
-            if len(value) <= 5:
-                return f"[{', '.join(str(v) for v in value)}]"
-            else:
-                return f"[{', '.join(str(v) for v in value[:3])}, ... (+{len(value)-3} more)]"
-    elif isinstance(value, dict):
-        if not value:
-            return "{}"
-        lines = [f"{spaces}  - **{k}**: {format_parameter_value(v, indent+1)}" for k, v in value.items()]
-        return "\n" + "\n".join(lines)
-    elif isinstance(value, str):
-        if len(value) > 100:
-            return f'"{value[:97]}..."'
+    formatter = _PARAMETER_FORMATTERS.get(type(value))
+    if formatter is None:
+        # Subclasses (e.g. OrderedDict) fall back to the isinstance checks
+        if isinstance(value, list):
+            formatter = _format_list_value
+        elif isinstance(value, dict):
+            formatter = _format_dict_value
+        elif isinstance(value, str):
+            formatter = _format_str_value
         else:
-            return f'"{value}"'
-    else:
-        return str(value)
+            formatter = _format_scalar_value
+    return formatter(value, indent)
+
+
+@lru_cache(maxsize=64)
+def _image_dir_index(dir_path: str, dir_mtime_ns: int) -> Tuple[Tuple[str, str, str], ...]:
+    """(name, lowercase stem, path) of each image in a directory, in scandir order.
+    
+    Keyed by the directory mtime so added or removed files invalidate the entry.
+    """
+    image_suffixes = tuple(_IMAGE_EXTS)
+    with os.scandir(dir_path) as it:
+        return tuple(
+            (entry.name, os.path.splitext(entry.name)[0].lower(), entry.path)
+            for entry in it
+            if entry.name.lower().endswith(image_suffixes)
+        )
 
 
 def find_associated_image(json_path: str, search_dirs: List[str] = None, explicit_image: str = None) -> Optional[str]:
     """Find image associated with workflow JSON file."""
-    import os
-    from pathlib import Path
-    
     # If explicit image provided, use it
     if explicit_image and os.path.exists(explicit_image):
         return explicit_image
@@ -1050,44 +1366,122 @@ def find_associated_image(json_path: str, search_dirs: List[str] = None, explici
         search_dirs = [os.path.dirname(json_path)]
     
     json_stem = Path(json_path).stem
-    image_extensions = ['.png', '.webp', '.jpg', '.jpeg']
+    json_stem_lower = json_stem.lower()
+    exact_name = f"{json_stem}.png"
     
     for search_dir in search_dirs:
-        if not os.path.exists(search_dir):
+        try:
+            index = _image_dir_index(search_dir, os.stat(search_dir).st_mtime_ns)
+        except OSError:
             continue
-            
-        for ext in image_extensions:
-            # Try exact match
-            candidate = os.path.join(search_dir, f"{json_stem}{ext}")
-            if os.path.exists(candidate):
-                return candidate
-            
-            # Try pattern matching
-            try:
-                for img_file in os.listdir(search_dir):
-                    if img_file.lower().endswith(tuple(image_extensions)):
-                        img_stem = Path(img_file).stem
-                        if json_stem.lower() in img_stem.lower() or img_stem.lower() in json_stem.lower():
-                            return os.path.join(search_dir, img_file)
-            except (OSError, PermissionError):
-                continue
+        
+        # Try exact match
+        for name, _, path in index:
+            if name == exact_name:
+                return path
+        
+        # Try pattern matching
+        for _, img_stem, path in index:
+            if json_stem_lower in img_stem or img_stem in json_stem_lower:
+                return path
     
     return None
 
 
+@lru_cache(maxsize=1)
+def _object_info_session():
+    """Shared keep-alive HTTP session for ComfyUI server queries."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _fetch_object_info(server_address: str) -> Optional[Dict]:
+    """Fetch a server's /object_info, reusing an on-disk copy younger than OBJECT_INFO_CACHE_TTL."""
+    cache_path = OBJECT_INFO_CACHE_DIR / f"{hashlib.sha1(server_address.encode('utf-8')).hexdigest()}.json"
+    try:
+        if time.time() - cache_path.stat().st_mtime < OBJECT_INFO_CACHE_TTL:
+            return _loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    
+    try:
+        response = _object_info_session().get(f"{server_address}/object_info", timeout=5)
+        if response.status_code != 200:
+            return None
+        object_info = _loads(response.content)
+        print(f"✓ Retrieved object info from {server_address}")
+    except Exception as e:
+        print(f"⚠️ Could not query server {server_address}: {e}")
+        return None
+    
+    try:
+        OBJECT_INFO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        tmp_path.write_bytes(response.content)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+    return object_info
+
+
+# Flattened dropdown options per server: server -> (built_at, {(class_type, param_name): options})
+_DROPDOWN_TABLES: Dict[str, Tuple[float, Dict[Tuple[str, str], list]]] = {}
+
+
+def _dropdown_table(server_address: str) -> Dict[Tuple[str, str], list]:
+    """(class_type, param_name) -> dropdown options from a server's object info.
+    
+    Built once per server and reused until OBJECT_INFO_CACHE_TTL expires.
+    """
+    entry = _DROPDOWN_TABLES.get(server_address)
+    if entry and time.time() - entry[0] < OBJECT_INFO_CACHE_TTL:
+        return entry[1]
+    
+    object_info = _fetch_object_info(server_address)
+    if object_info is None:
+        return {}
+    
+    table = {}
+    for class_type, node_info in object_info.items():
+        input_info = node_info.get("input") if isinstance(node_info, dict) else None
+        if not input_info:
+            continue
+        required_inputs = input_info.get("required") or {}
+        optional_inputs = input_info.get("optional") or {}
+        for param_name in {**optional_inputs, **required_inputs}:
+            param_info = required_inputs.get(param_name) or optional_inputs.get(param_name)
+            # A list as the first element holds the dropdown options
+            if isinstance(param_info, list) and param_info and isinstance(param_info[0], list):
+                table[(class_type, param_name)] = param_info[0]
+    
+    _DROPDOWN_TABLES[server_address] = (time.time(), table)
+    return table
+
+
 def generate_html_visual(workflow: Dict[str, Any], workflow_name: str = "Unknown Workflow", 
-                        server_address: str = None, image_path: str = None) -> str:
+                        server_address: str = None, image_path: str = None,
+                        timestamp: str = None) -> str:
     """Generate an interactive HTML visualization of the workflow using Tailwind CSS."""
+    return ''.join(_iter_html_visual(workflow, workflow_name, server_address, image_path, timestamp))
+
+
+def _iter_html_visual(workflow: Dict[str, Any], workflow_name: str = "Unknown Workflow",
+                      server_address: str = None, image_path: str = None,
+                      timestamp: str = None) -> Iterator[str]:
+    """Yield the fragments of generate_html_visual's page in order, for streaming writes."""
     # Sort nodes by ID for consistent layout
-    sorted_nodes = sorted(workflow.keys(), key=lambda x: int(x) if x.isdigit() else float('inf'))
+    sorted_nodes = _sorted_node_ids(workflow)
     
-    # Generate timestamp
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Generate timestamp (batch runs pass one shared value)
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Prepare image section if image is provided
-    import os
-    import base64
     image_section = ""
     if image_path and os.path.exists(image_path):
         try:
@@ -1096,12 +1490,7 @@ def generate_html_visual(workflow: Dict[str, Any], workflow_name: str = "Unknown
             
             # Determine MIME type
             ext = os.path.splitext(image_path)[1].lower()
-            mime_type = {
-                '.png': 'image/png',
-                '.webp': 'image/webp', 
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg'
-            }.get(ext, 'image/png')
+            mime_type = _MIME_BY_EXT.get(ext, 'image/png')
             
             image_data_url = f"data:{mime_type};base64,{image_data}"
             image_filename = os.path.basename(image_path)
@@ -1149,45 +1538,14 @@ def generate_html_visual(workflow: Dict[str, Any], workflow_name: str = "Unknown
             '''
     
     # Try to get real dropdown values from server if available
-    server_object_info = None
-    if server_address:
-        try:
-            import requests
-            response = requests.get(f"{server_address}/object_info", timeout=5)
-            if response.status_code == 200:
-                server_object_info = response.json()
-                print(f"✓ Retrieved object info from {server_address}")
-        except Exception as e:
-            print(f"⚠️ Could not query server {server_address}: {e}")
+    dropdown_table = _dropdown_table(server_address) if server_address else {}
     
     def get_dropdown_values(class_type: str, param_name: str) -> list:
         """Get actual dropdown values from server object info if available"""
-        if not server_object_info:
-            return []
-        
-        node_info = server_object_info.get(class_type, {})
-        if not node_info:
-            return []
-            
-        input_info = node_info.get("input", {})
-        if not input_info:
-            return []
-            
-        required_inputs = input_info.get("required", {})
-        optional_inputs = input_info.get("optional", {})
-        
-        param_info = required_inputs.get(param_name) or optional_inputs.get(param_name)
-        if not param_info or not isinstance(param_info, list) or len(param_info) == 0:
-            return []
-            
-        # Check if first element is a list (dropdown options)
-        if isinstance(param_info[0], list):
-            return param_info[0]
-            
-        return []
+        return dropdown_table.get((class_type, param_name), ())
     
-    # Build HTML using simple string concatenation
-    html = f'''<!DOCTYPE html>
+    params_by_node: Dict[str, List[str]] = {}
+    yield f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1233,72 +1591,52 @@ def generate_html_visual(workflow: Dict[str, Any], workflow_name: str = "Unknown
 '''
     
     for node_id in sorted_nodes:
-        node_data = workflow[node_id]
-        class_type = node_data.get("class_type", "Unknown")
-        title = node_data.get("_meta", {}).get("title", class_type)
-        inputs = node_data.get("inputs", {})
+        class_type, title, inputs = _node_view(workflow[node_id])
         
-        # Count parameters
-        params = [k for k, v in inputs.items() if not (isinstance(v, list) and len(v) == 2)]
-        connections = [k for k, v in inputs.items() if isinstance(v, list) and len(v) == 2]
+        # Classify inputs once; the counts, preview, details and command reference all reuse it
+        params, connections, all_entries = [], [], []
+        for k, v in inputs.items():
+            is_conn = _is_connection(v)
+            (connections if is_conn else params).append(k)
+            all_entries.append((k, v, is_conn))
+        params_by_node[node_id] = params
         
         # Get key params for preview
         key_params = []
         for param in params[:3]:
-            if param in inputs:
-                value = str(inputs[param])
-                if len(value) > 20:
-                    value = value[:17] + "..."
-                key_params.append(f"{param}: {value}")
-        
-        html += f'''
-            <div class="bg-white rounded-lg shadow-sm border p-4 hover:shadow-md transition-shadow">
-                <div class="flex items-center gap-2 mb-3">
-                    <span class="text-2xl">⚙️</span>
-                    <div>
-                        <h3 class="font-bold text-lg text-gray-900">Node {node_id}</h3>
-                        <p class="text-sm text-gray-600">{class_type}</p>
-                    </div>
-                </div>
-                
-                <h4 class="font-medium text-gray-800 mb-2">{title}</h4>
-                
-                <div class="text-xs text-gray-500 mb-3">
-                    🔗 {len(connections)} inputs • ⚙️ {len(params)} params
-                </div>
-                '''
+            key_params.append(f"{param}: {_trunc(str(inputs[param]), 20)}")
+        
+        yield _NODE_CARD_HEAD.substitute(
+            node_id=_esc(node_id),
+            class_type=_esc(class_type),
+            title=_esc(title),
+            connection_count=len(connections),
+            param_count=len(params),
+        )
                 
         if key_params:
-            html += '<div class="bg-gray-50 rounded p-2 text-xs"><div class="font-medium mb-1">Key Parameters:</div>'
-            for kp in key_params:
-                html += f'<div>{kp}</div>'
-            html += '</div>'
+            yield '<div class="bg-gray-50 rounded p-2 text-xs"><div class="font-medium mb-1">Key Parameters:</div>'
+            yield from (f'<div>{_html.escape(kp)}</div>' for kp in key_params)
+            yield '</div>'
         
-        html += '''
+        yield '''
                 <details class="mt-3">
                     <summary class="text-xs text-gray-600 cursor-pointer">All parameters</summary>
                     <div class="mt-2 text-xs space-y-1">
 '''
         
         # Add all parameters with enhanced features
-        for param_name, param_value in inputs.items():
-            if isinstance(param_value, list) and len(param_value) == 2:
+        for param_name, param_value, is_conn in all_entries:
+            if is_conn:
                 # Connection parameter
-                html += f'                        <div class="bg-blue-50 p-1 rounded flex justify-between"><span class="text-blue-700 font-medium">{param_name}:</span><span class="text-blue-600">→ Node {param_value[0]}</span></div>\n'
+                yield _CONNECTION_ROW.substitute(param_name=_esc(param_name), source=_html.escape(str(param_value[0])))
             else:
                 # Direct parameter - add copy functionality
-                value_str = str(param_value)
-                full_value_str = value_str
-                if len(value_str) > 30:
-                    value_str = value_str[:27] + "..."
+                full_value_str = str(param_value)
+                value_str = _trunc(full_value_str, 30)
 
-                # Escape display value for HTML attributes
-                escaped_value = str(full_value_str).replace('"', '&quot;').replace("'", '&#39;')
-
-                # Build the CLI copy command and ensure it is HTML-escaped for safe insertion
+                # Build the CLI copy command; it is HTML-escaped on substitution
                 copy_command = f'--node {node_id} --param {param_name} "{full_value_str}"'
-                import html as _html
-                escaped_copy_command = _html.escape(copy_command, quote=True)
 
                 # Get real dropdown values from server if available
                 dropdown_hint = ""
@@ -1309,36 +1647,29 @@ def generate_html_visual(workflow: Dict[str, Any], workflow_name: str = "Unknown
                     values_preview = ', '.join(str(v) for v in dropdown_values[:5])
                     if len(dropdown_values) > 5:
                         values_preview += f', ... ({len(dropdown_values)} total)'
-                    dropdown_hint = f' <span class="text-xs text-green-600 cursor-help" title="Valid options: {values_preview}">🔽</span>'
-                elif param_name.endswith('_name') and param_name in ['sampler_name', 'scheduler', 'model_name', 'vae_name', 'lora_name']:
+                    dropdown_hint = f' <span class="text-xs text-green-600 cursor-help" title="Valid options: {_html.escape(values_preview)}">🔽</span>'
+                elif param_name in _KNOWN_DROPDOWNS:
                     dropdown_hint = ' <span class="text-xs text-orange-600 cursor-help" title="Dropdown parameter - server query needed for valid options">⚠️</span>'
-                elif param_name.endswith('_mode') or param_name.endswith('_method') or param_name.endswith('_type'):
+                elif param_name.endswith(_HINT_SUFFIXES):
                     dropdown_hint = ' <span class="text-xs text-orange-600 cursor-help" title="Parameter likely has predefined options">⚠️</span>'
                 
                 # Use data attributes instead of inline JavaScript to avoid quote issues
                 copy_id = f"copy_{node_id}_{param_name.replace(' ', '_')}"
-                html += f'''                        <div class="bg-gray-50 p-1 rounded">
-                            <div class="flex justify-between items-center">
-                                <span class="font-medium">{param_name}:</span>
-                                <div class="flex items-center gap-1">
-                                    <span class="text-gray-600 break-all" title="{escaped_value}">{value_str}</span>{dropdown_hint}
-                                    <button class="copy-btn ml-1 px-1 py-0.5 text-xs bg-gray-200 rounded hover:bg-blue-500 hover:text-white transition-colors" 
-                                            data-copy-text="{escaped_copy_command}"
-                                            id="{copy_id}"
-                                            aria-label="Copy command line argument">
-                                        📋
-                                    </button>
-                                </div>
-                            </div>
-                        </div>
-'''
+                yield _PARAM_ROW.substitute(
+                    param_name=_esc(param_name),
+                    full_value=_html.escape(full_value_str),
+                    value=_html.escape(value_str),
+                    dropdown_hint=dropdown_hint,
+                    copy_command=_html.escape(copy_command),
+                    copy_id=_html.escape(copy_id),
+                )
         
-        html += '''                    </div>
+        yield '''                    </div>
                 </details>
             </div>
 '''
     
-    html += f'''
+    yield '''
         </div>
         
         <div class="mt-8 p-6 bg-white rounded-lg shadow-sm border">
@@ -1358,20 +1689,18 @@ def generate_html_visual(workflow: Dict[str, Any], workflow_name: str = "Unknown
     
     # Add command reference
     for node_id in sorted_nodes[:10]:  # Show first 10 nodes
-        node_data = workflow[node_id]
-        class_type = node_data.get("class_type", "Unknown")
-        inputs = node_data.get("inputs", {})
-        params = [k for k, v in inputs.items() if not (isinstance(v, list) and len(v) == 2)]
+        class_type = workflow[node_id].get("class_type", "Unknown")
+        params = params_by_node[node_id]
         
         if params:
-            html += f'''
+            yield f'''
                 <div class="bg-gray-50 p-3 rounded">
                     <div class="text-gray-900 font-bold mb-1">Node {node_id} ({class_type})</div>
                     <div class="text-blue-600">--node {node_id} --param {params[0]} value</div>
                     <div class="text-xs text-gray-500 mt-1">Available: {', '.join(params[:3])}</div>
                 </div>'''
     
-    html += '''
+    yield '''
             </div>
         </div>
     </div>
@@ -1494,148 +1823,157 @@ def generate_html_visual(workflow: Dict[str, Any], workflow_name: str = "Unknown
     </footer>
 </body>
 </html>'''
-    
-    return html
 
 
-def generate_markdown_catalog(workflow: Dict[str, Any], output_format: str = "detailed") -> str:
-    """Generate a Markdown catalog of the workflow."""
+def generate_markdown_catalog(workflow: Dict[str, Any], output_format: str = "detailed",
+                              out: Optional[io.TextIOBase] = None) -> Optional[str]:
+    """Generate a Markdown catalog of the workflow.
+
+    Lines are written to ``out`` as they are produced; without ``out`` the
+    catalog is returned as a string.
+    """
     analysis = analyze_workflow(workflow)
+    buffer = io.StringIO() if out is None else out
+    write = buffer.write
+    
+    def emit(line: str = ""):
+        write(line)
+        write("\n")
     
     # Header
-    md = ["# ComfyUI Workflow Catalog\n"]
+    emit("# ComfyUI Workflow Catalog\n")
     
     # Overview section
-    md.append("## Overview\n")
-    md.append(f"- **Total Nodes**: {analysis['total_nodes']}")
-    md.append(f"- **Input Nodes**: {len(analysis['input_nodes'])} ({', '.join(analysis['input_nodes'])})")
-    md.append(f"- **Output Nodes**: {len(analysis['output_nodes'])} ({', '.join(analysis['output_nodes'])})")
-    md.append(f"- **Connections**: {len(analysis['connections'])}")
-    md.append("")
+    emit("## Overview\n")
+    emit(f"- **Total Nodes**: {analysis['total_nodes']}")
+    emit(f"- **Input Nodes**: {len(analysis['input_nodes'])} ({', '.join(analysis['input_nodes'])})")
+    emit(f"- **Output Nodes**: {len(analysis['output_nodes'])} ({', '.join(analysis['output_nodes'])})")
+    emit(f"- **Connections**: {analysis['connections_count']}")
+    if analysis["dangling"]:
+        emit(f"- **Dangling References**: {len(analysis['dangling'])} (inputs pointing at missing nodes)")
+    emit()
     
     # Node types summary
-    md.append("### Node Types\n")
+    emit("### Node Types\n")
     for node_type, count in sorted(analysis["node_types"].items()):
-        md.append(f"- **{node_type}**: {count} node{'s' if count > 1 else ''}")
-    md.append("")
+        emit(f"- **{node_type}**: {count} node{'s' if count > 1 else ''}")
+    emit()
     
     if output_format == "table":
         # Table format
-        md.append("## Nodes (Table Format)\n")
-        md.append("| Node ID | Type | Title | Key Parameters |")
-        md.append("|---------|------|-------|----------------|")
+        emit("## Nodes (Table Format)\n")
+        emit("| Node ID | Type | Title | Key Parameters |")
+        emit("|---------|------|-------|----------------|")
         
-        for node_id in sorted(workflow.keys(), key=lambda x: int(x) if x.isdigit() else float('inf')):
-            node_data = workflow[node_id]
-            class_type = node_data.get("class_type", "Unknown")
-            title = node_data.get("_meta", {}).get("title", class_type)
+        for node_id in analysis["sorted_node_ids"]:
+            class_type, title, inputs = _node_view(workflow[node_id])
             
             # Get key parameters (non-connection inputs)
-            inputs = node_data.get("inputs", {})
             key_params = []
             for param_name, param_value in inputs.items():
-                if not (isinstance(param_value, list) and len(param_value) == 2):
-                    if isinstance(param_value, str) and len(param_value) > 50:
-                        key_params.append(f"{param_name}: {param_value[:47]}...")
-                    else:
-                        key_params.append(f"{param_name}: {param_value}")
+                if not _is_connection(param_value):
+                    if isinstance(param_value, str):
+                        param_value = _trunc(param_value, 50)
+                    key_params.append(f"{param_name}: {param_value}")
             
             params_str = "; ".join(key_params[:3])  # Limit to first 3 params
             if len(key_params) > 3:
                 params_str += f" (+{len(key_params)-3} more)"
             
-            md.append(f"| {node_id} | {class_type} | {title} | {params_str} |")
+            emit(f"| {node_id} | {class_type} | {title} | {params_str} |")
         
-        md.append("")
+        emit()
     
     else:
         # Detailed format
-        md.append("## Node Details\n")
-        
-        # Sort nodes by ID (numeric first, then others)
-        sorted_nodes = sorted(workflow.keys(), key=lambda x: int(x) if x.isdigit() else float('inf'))
+        emit("## Node Details\n")
         
-        for node_id in sorted_nodes:
-            node_data = workflow[node_id]
-            class_type = node_data.get("class_type", "Unknown")
-            title = node_data.get("_meta", {}).get("title", class_type)
+        # Nodes in ID order (numeric first, then others)
+        for node_id in analysis["sorted_node_ids"]:
+            class_type, title, inputs = _node_view(workflow[node_id])
             
-            md.append(f"### Node {node_id}: {title}")
-            md.append(f"**Type**: `{class_type}`\n")
+            emit(f"### Node {node_id}: {title}")
+            emit(f"**Type**: `{class_type}`\n")
             
             # Inputs section
-            inputs = node_data.get("inputs", {})
             if inputs:
-                md.append("**Inputs**:")
+                emit("**Inputs**:")
                 
                 # Separate connections from parameters
                 connections = []
                 parameters = []
                 
                 for param_name, param_value in inputs.items():
-                    if isinstance(param_value, list) and len(param_value) == 2:
+                    if _is_connection(param_value):
                         connections.append((param_name, param_value))
                     else:
                         parameters.append((param_name, param_value))
                 
                 # Show connections first
                 if connections:
-                    md.append("  - *Connections*:")
+                    emit("  - *Connections*:")
                     for param_name, param_value in connections:
-                        md.append(f"    - **{param_name}**: {format_parameter_value(param_value)}")
+                        emit(f"    - **{param_name}**: {format_parameter_value(param_value)}")
                 
                 # Then show parameters
                 if parameters:
                     if connections:
-                        md.append("  - *Parameters*:")
+                        emit("  - *Parameters*:")
                     for param_name, param_value in parameters:
                         formatted_value = format_parameter_value(param_value)
-                        md.append(f"    - **{param_name}**: {formatted_value}")
+                        emit(f"    - **{param_name}**: {formatted_value}")
             else:
-                md.append("**Inputs**: None")
+                emit("**Inputs**: None")
             
-            md.append("")
+            emit()
     
     # Connection flow section
-    if analysis["connections"]:
-        md.append("## Data Flow\n")
-        md.append("```mermaid")
-        md.append("graph TD")
-        
-        # Add nodes
-        for node_id, node_data in workflow.items():
-            class_type = node_data.get("class_type", "Unknown")
-            title = node_data.get("_meta", {}).get("title", class_type)
-            # Simplify title for mermaid
-            simple_title = title.replace(" ", "_").replace(":", "").replace("(", "").replace(")", "")
-            md.append(f"    {node_id}[\"{node_id}: {simple_title}\"]")
-        
-        # Add connections
-        for conn in analysis["connections"]:
-            md.append(f"    {conn['from']} -->|{conn['input_param']}| {conn['to']}")
-        
-        md.append("```\n")
+    if analysis["connections_count"]:
+        emit("## Data Flow\n")
+        if analysis["total_nodes"] > MERMAID_MAX_NODES:
+            emit(f"_Workflow too large for inline diagram ({analysis['total_nodes']} nodes); see HTML visualization._\n")
+        else:
+            emit("```mermaid")
+            emit("graph TD")
+            
+            # Add nodes
+            node_lines = []
+            for node_id, node_data in workflow.items():
+                _, title, _ = _node_view(node_data)
+                # Simplify title for mermaid
+                node_lines.append(f"    {node_id}[\"{node_id}: {title.translate(_MERMAID_TRANS)}\"]\n")
+            write("".join(node_lines))
+            
+            # Add connections
+            write("".join(
+                f"    {source_node} -->|{input_param}| {target_node}\n"
+                for source_node, targets in analysis["out_edges"].items()
+                for target_node, input_param, _ in targets
+            ))
+            
+            emit("```\n")
     
     # Quick reference section
-    md.append("## Quick Reference\n")
-    md.append("### Parameterizable Nodes\n")
-    md.append("Nodes that can be modified via command line:\n")
+    emit("## Quick Reference\n")
+    emit("### Parameterizable Nodes\n")
+    emit("Nodes that can be modified via command line:\n")
     
-    for node_id in sorted(workflow.keys(), key=lambda x: int(x) if x.isdigit() else float('inf')):
-        node_data = workflow[node_id]
-        class_type = node_data.get("class_type", "Unknown")
-        inputs = node_data.get("inputs", {})
+    for node_id in analysis["sorted_node_ids"]:
+        class_type, _, inputs = _node_view(workflow[node_id])
         
         # Find non-connection parameters
         params = []
         for param_name, param_value in inputs.items():
-            if not (isinstance(param_value, list) and len(param_value) == 2):
+            if not _is_connection(param_value):
                 params.append(param_name)
         
         if params:
-            md.append(f"- **Node {node_id}** ({class_type}): `{', '.join(params)}`")
+            emit(f"- **Node {node_id}** ({class_type}): `{', '.join(params)}`")
     
-    return "\n".join(md)
+    if out is None:
+        # Drop the final newline so the string matches the old join-based output
+        return buffer.getvalue()[:-1]
+    return None
 
 
 def main():
@@ -1683,6 +2021,8 @@ Examples:
     parser.add_argument('--tags', help='Comma-separated tags to add to database entries')
     parser.add_argument('--collections', help='Comma-separated collections to add to database entries')
     parser.add_argument('--notes', help='Notes to add to database entries')
+    parser.add_argument('--streaming', action='store_true',
+                       help='Parse workflow JSON incrementally with ijson (automatic above 50 MB when ijson is installed)')
     
     args = parser.parse_args()
     
@@ -1704,8 +2044,8 @@ def load_workflow_cache(output_dir: Path) -> Dict:
     cache_file = output_dir / ".workflow_cache.json"
     if cache_file.exists():
         try:
-            with open(cache_file, 'r') as f:
-                return json.load(f)
+            with open(cache_file, 'rb') as f:
+                return _load(f)
         except Exception as e:
             print(f"⚠️ Could not load cache: {e}")
     return {}
@@ -1818,13 +2158,15 @@ def comprehensive_batch_analysis(image_paths: List[Path], cache: Dict) -> Tuple[
         progress = (i / len(image_paths)) * 100
         print(f"  📊 Processing ({i}/{len(image_paths)} - {progress:.1f}%): {image_path.name}")
         
+        stat = None  # Kept for the error path when a later step fails
         try:
-            file_size = image_path.stat().st_size
+            stat = image_path.stat()
+            file_size = stat.st_size
             file_type = mimetypes.guess_type(str(image_path))[0] or "unknown"
             
             # Check cache first
             image_key = f"{image_path}:{file_size}"
-            image_mtime = image_path.stat().st_mtime
+            image_mtime = stat.st_mtime
             
             workflow = None
             metadata = None
@@ -1874,6 +2216,7 @@ def comprehensive_batch_analysis(image_paths: List[Path], cache: Dict) -> Tuple[
                 metadata=metadata,
                 error_message=error_message,
                 file_size=file_size,
+                modified_time=image_mtime,
                 file_type=file_type
             )
             analysis_results.append(analysis_result)
@@ -1889,7 +2232,8 @@ def comprehensive_batch_analysis(image_paths: List[Path], cache: Dict) -> Tuple[
                 file_path=image_path,
                 success=False,
                 error_message=error_message,
-                file_size=0,
+                file_size=stat.st_size if stat else 0,
+                modified_time=stat.st_mtime if stat else None,
                 file_type="unknown"
             )
             analysis_results.append(analysis_result)
@@ -1995,7 +2339,8 @@ def directory_scan_mode(args):
                 workflow_data = WorkflowImageData(
                     image_path=result.file_path,
                     workflow=result.workflow,
-                    metadata=result.metadata or {}
+                    metadata=result.metadata or {},
+                    analysis=result.analysis
                 )
                 workflow_images.append(workflow_data)
         
@@ -2060,12 +2405,73 @@ def directory_scan_mode(args):
     return 0
 
 
+# Bump when the individual page markup changes so cached pages are rebuilt
+CATALOG_PAGE_VERSION = "2"
+CATALOG_PAGE_CACHE_MAX_ENTRIES = 2000
+
+# Cached pages hold this in place of the "Generated" time, filled in each time a page is written
+_TIMESTAMP_SLOT = "<!--catalog-timestamp-->"
+
+
+# Batches with at least this many pages to render use a process pool
+PARALLEL_RENDER_MIN_JOBS = 8
+
+
+def _render_one(job: Tuple) -> str:
+    """Render one workflow page from a picklable (workflow, name, format, server, image, timestamp) job."""
+    workflow, workflow_name, output_format, server_address, image_path, timestamp = job
+    if output_format == 'html':
+        return generate_html_visual(workflow, workflow_name, server_address, image_path, timestamp=timestamp)
+    return generate_markdown_catalog(workflow, output_format)
+
+
+def _catalog_page_cache_key(workflow_data: WorkflowImageData, workflow_name: str) -> str:
+    """Content key for an individual page: workflow, source image, page name and markup version."""
+    try:
+        image_mtime = workflow_data.image_path.stat().st_mtime_ns
+    except OSError:
+        image_mtime = 0
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(workflow_data.workflow, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+    digest.update(f"|{workflow_data.image_path}|{image_mtime}|{workflow_name}|{CATALOG_PAGE_VERSION}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _evict_lru_files(cache_dir: Path, suffix: str, max_entries: int):
+    """Drop the least recently used files ending in suffix beyond max_entries.
+    
+    Cache hits touch their file with os.utime so its atime reflects last use.
+    """
+    with os.scandir(cache_dir) as it:
+        entries = [(e.stat().st_atime, e.path) for e in it if e.name.endswith(suffix)]
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
 def generate_individual_catalogs(workflow_images: List[WorkflowImageData], output_dir: Path, server_address: str = None) -> List[str]:
-    """Generate individual HTML catalog pages for each workflow."""
+    """Generate individual HTML catalog pages for each workflow.
+    
+    Pages are cached under ``output_dir/.cache`` by content key and copied into
+    place when nothing has changed. Pages built with live ``server_address``
+    dropdown data are always regenerated.
+    """
     workflows_dir = output_dir / "workflows"
     workflows_dir.mkdir(exist_ok=True)
+    cache_dir = output_dir / ".cache"
+    use_cache = server_address is None
+    if use_cache:
+        cache_dir.mkdir(exist_ok=True)
     
     individual_pages = []
+    pending = []  # (catalog_path, cached_page, render job) for pages that need rendering
+    reused_count = 0
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # Shared by every page in this run
     
     print(f"📄 Generating individual workflow catalogs...")
     
@@ -2081,27 +2487,49 @@ def generate_individual_catalogs(workflow_images: List[WorkflowImageData], outpu
         # Generate workflow name
         workflow_name = base_name.replace('_', ' ').replace('-', ' ').title()
         
-        # Generate HTML catalog
-        html_content = generate_html_visual(
-            workflow_data.workflow,
-            workflow_name,
-            server_address,
-            str(workflow_data.image_path)
-        )
-        
-        # Add navigation back to master catalog
-        html_content = add_navigation_to_catalog(html_content)
-        
-        # Write to file
-        with open(catalog_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        cached_page = cache_dir / f"{_catalog_page_cache_key(workflow_data, workflow_name)}.html" if use_cache else None
+        if cached_page is not None and cached_page.exists():
+            # Unchanged since the last run; reuse the stored page with this run's timestamp
+            with open(cached_page, 'r', encoding='utf-8') as f:
+                html_content = f.read()
+            with open(catalog_path, 'w', encoding='utf-8') as f:
+                f.write(html_content.replace(_TIMESTAMP_SLOT, timestamp, 1))
+            os.utime(cached_page)
+            reused_count += 1
+        else:
+            job = (workflow_data.workflow, workflow_name, 'html', server_address,
+                   str(workflow_data.image_path), _TIMESTAMP_SLOT if use_cache else timestamp)
+            pending.append((catalog_path, cached_page, job))
         
         # Store relative path for master catalog
         relative_path = f"workflows/{catalog_filename}"
         individual_pages.append(relative_path)
         workflow_data.catalog_path = catalog_path
     
-    print(f"✅ Generated {len(individual_pages)} individual catalogs")
+    # Render the changed pages; larger batches fan out across processes
+    jobs = [job for _, _, job in pending]
+    executor = ProcessPoolExecutor(max_workers=os.cpu_count()) if len(jobs) >= PARALLEL_RENDER_MIN_JOBS else None
+    try:
+        rendered = executor.map(_render_one, jobs, chunksize=8) if executor else map(_render_one, jobs)
+        for (catalog_path, cached_page, _), html_content in zip(pending, rendered):
+            # Add navigation back to master catalog
+            html_content = add_navigation_to_catalog(html_content)
+            
+            # Cache the page with its timestamp slot, then write it with this run's time
+            if cached_page is not None:
+                with open(cached_page, 'w', encoding='utf-8') as f:
+                    f.write(html_content)
+                html_content = html_content.replace(_TIMESTAMP_SLOT, timestamp, 1)
+            with open(catalog_path, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+    finally:
+        if executor:
+            executor.shutdown()
+    
+    if use_cache:
+        _evict_lru_files(cache_dir, '.html', CATALOG_PAGE_CACHE_MAX_ENTRIES)
+    
+    print(f"✅ Generated {len(individual_pages)} individual catalogs ({reused_count} unchanged, reused from cache)")
     return individual_pages
 
 
@@ -2140,12 +2568,11 @@ def generate_master_catalog(workflow_images: List[WorkflowImageData], individual
     
     print(f"🏗️ Generating master catalog: {master_catalog_name}")
     
-    # Generate HTML content
-    html_content = generate_master_catalog_html(workflow_images, individual_pages)
-    
-    # Write to file
+    # Stream the rendered template straight to disk
+    context = _master_catalog_context(workflow_images, individual_pages, output_dir / "thumbs")
     with open(master_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        _MASTER_CATALOG_TEMPLATE.stream(context).dump(f)
+    _write_precompressed(master_path)
     
     print(f"✅ Master catalog created: {master_path}")
     return master_path
@@ -2158,262 +2585,123 @@ def generate_comprehensive_master_catalog(analysis_results: List[FileAnalysisRes
     
     print(f"🏗️ Generating comprehensive master catalog: {master_catalog_name}")
     
-    # Generate HTML content
-    html_content = generate_comprehensive_master_catalog_html(analysis_results, individual_pages)
-    
-    # Write to file
+    # Stream the rendered template straight to disk
+    context = _comprehensive_catalog_context(analysis_results, individual_pages, output_dir / "thumbs")
     with open(master_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        _COMPREHENSIVE_CATALOG_TEMPLATE.stream(context).dump(f)
+    _write_precompressed(master_path)
     
     print(f"✅ Comprehensive master catalog created: {master_path}")
     return master_path
 
 
-def generate_master_catalog_html(workflow_images: List[WorkflowImageData], individual_pages: List[str]) -> str:
-    """Generate the HTML content for the master catalog."""
-    from datetime import datetime
+_FILTER_OPTION_FORMAT = '<option value="{0}">{0}</option>'.format
+
+
+def _render_filter_options(values) -> str:
+    """Render sorted, HTML-escaped <option> tags for a catalog filter dropdown."""
+    return ''.join(map(_FILTER_OPTION_FORMAT, map(_html.escape, sorted(values))))
+
+
+def _write_precompressed(page_path: Path) -> threading.Thread:
+    """Write .gz (and .br when brotli is installed) copies of a page in the background.
+    
+    Static file servers can then serve the precompressed bytes directly. The
+    thread is non-daemon, so the process waits for it before exiting.
+    """
+    def compress():
+        try:
+            data = page_path.read_bytes()
+            page_path.with_name(page_path.name + '.gz').write_bytes(gzip.compress(data, compresslevel=9))
+            if BROTLI_AVAILABLE:
+                page_path.with_name(page_path.name + '.br').write_bytes(brotli.compress(data, quality=11))
+        except OSError as e:
+            print(f"⚠️ Could not write precompressed copies of {page_path}: {e}")
+    
+    thread = threading.Thread(target=compress, name=f"precompress-{page_path.name}")
+    thread.start()
+    return thread
+
+
+def generate_master_catalog_html(workflow_images: List[WorkflowImageData], individual_pages: List[str],
+                                 thumbs_dir: Optional[Path] = None) -> str:
+    """Generate the HTML content for the master catalog.
+    
+    Thumbnails are written to thumbs_dir when given (expected to be the
+    "thumbs" directory next to the catalog page), otherwise embedded inline.
+    """
+    return _MASTER_CATALOG_TEMPLATE.render(_master_catalog_context(workflow_images, individual_pages, thumbs_dir))
+
+
+def _master_catalog_context(workflow_images: List[WorkflowImageData], individual_pages: List[str],
+                            thumbs_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Build the template context for the master catalog page."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    # Collect all unique models, LoRAs, and node types for filter dropdowns
-    all_checkpoints = set()
-    all_loras = set()
-    all_node_types = set()
+    # Collect per-workflow models, LoRAs, and node types for filter dropdowns
+    checkpoint_lists = []
+    lora_lists = []
+    node_type_lists = []
+    
+    # Dashboard totals, accumulated in the same pass
+    total_nodes = 0
+    total_connections = 0
     
     for workflow_data in workflow_images:
         if workflow_data.workflow:
-            # Extract models and node types (use same logic as card generation)
-            if hasattr(workflow_data, 'original_workflow') and workflow_data.original_workflow:
-                workflow_for_models = workflow_data.original_workflow
-            else:
-                workflow_for_models = extract_workflow_from_image(workflow_data.image_path, preserve_original_format=True)
-                if not workflow_for_models:
-                    workflow_for_models = workflow_data.workflow
-            
-            models = extract_models_from_workflow(workflow_for_models)
-            analysis = analyze_workflow(workflow_data.workflow)
+            # Extract models and node types once; the cards reuse the cached results
+            models = _workflow_models(workflow_data)
+            if workflow_data.analysis is None:
+                workflow_data.analysis = analyze_workflow(workflow_data.workflow)
+            analysis = workflow_data.analysis
             
             # Separate checkpoints and LoRAs
-            all_checkpoints.update(models.get('checkpoints', []))
-            all_loras.update(models.get('loras', []))
+            checkpoint_lists.append(models.get('checkpoints', []))
+            lora_lists.append(models.get('loras', []))
             
             # Add all node types
-            all_node_types.update(analysis["node_types"].keys())
+            node_type_lists.append(analysis["node_types"].keys())
+            
+            total_nodes += len(workflow_data.workflow)
+            total_connections += analysis["connections_count"]
     
-    # Sort for consistent display
-    sorted_models = sorted(all_checkpoints)
-    sorted_loras = sorted(all_loras)
-    sorted_node_types = sorted(all_node_types)
+    # Build each unique set in one sweep
+    all_checkpoints = set(chain.from_iterable(checkpoint_lists))
+    all_loras = set(chain.from_iterable(lora_lists))
+    all_node_types = set(chain.from_iterable(node_type_lists))
     
-    # Pre-generate filter options to avoid nested f-string issues
-    checkpoint_options = ''.join(f'<option value="{model}">{model}</option>' for model in sorted_models)
-    lora_options = ''.join(f'<option value="{lora}">{lora}</option>' for lora in sorted_loras)
-    node_type_options = ''.join(f'<option value="{node_type}">{node_type}</option>' for node_type in sorted_node_types)
+    # Pre-generate filter options (sorted for consistent display)
+    checkpoint_options = _render_filter_options(all_checkpoints)
+    lora_options = _render_filter_options(all_loras)
+    node_type_options = _render_filter_options(all_node_types)
     
     # Generate cards HTML with model and node type data
-    cards_html = ""
-    for workflow_data, page_path in zip(workflow_images, individual_pages):
-        cards_html += generate_master_catalog_card(workflow_data, page_path)
-    
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ComfyUI Workflow Catalog</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        .masonry-grid {{
-            column-count: 4;
-            column-gap: 1.5rem;
-            column-fill: balance;
-        }}
-        
-        .masonry-item {{
-            break-inside: avoid;
-            margin-bottom: 1.5rem;
-        }}
-        
-        @media (max-width: 1024px) {{
-            .masonry-grid {{ column-count: 3; }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .masonry-grid {{ column-count: 2; }}
-        }}
-        
-        @media (max-width: 640px) {{
-            .masonry-grid {{ column-count: 1; }}
-        }}
-        
-        .card-hover {{
-            transition: all 0.3s ease;
-        }}
-        
-        .card-hover:hover {{
-            transform: translateY(-4px);
-            box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
-        }}
-    </style>
-</head>
-<body class="bg-gray-50 p-6">
-    <div class="max-w-7xl mx-auto">
-        <!-- Header -->
-        <header class="mb-8 text-center">
-            <h1 class="text-4xl font-bold text-gray-900 mb-2">ComfyUI Workflow Catalog</h1>
-            <div class="flex justify-center items-center gap-6 text-sm text-gray-500">
-                <div class="flex items-center gap-2">
-                    <span class="text-2xl">🖼️</span>
-                    <span>{len(workflow_images)} Workflows</span>
-                </div>
-                <div class="flex items-center gap-2">
-                    <span class="text-2xl">📅</span>
-                    <span>Generated: {timestamp}</span>
-                </div>
-            </div>
-        </header>
-        
-        <!-- Statistics Dashboard -->
-        <div class="mb-6 grid grid-cols-1 md:grid-cols-4 gap-4">
-            <div class="bg-white rounded-lg shadow-sm border p-4 text-center">
-                <div class="text-2xl font-bold text-blue-600">{len(workflow_images)}</div>
-                <div class="text-sm text-gray-600">Workflows</div>
-            </div>
-            <div class="bg-white rounded-lg shadow-sm border p-4 text-center">
-                <div class="text-2xl font-bold text-green-600">{sum(len(w.workflow) for w in workflow_images)}</div>
-                <div class="text-sm text-gray-600">Total Nodes</div>
-            </div>
-            <div class="bg-white rounded-lg shadow-sm border p-4 text-center">
-                <div class="text-2xl font-bold text-purple-600">{len(set(nt for w in workflow_images for nt in w.workflow_summary["node_types"]))}</div>
-                <div class="text-sm text-gray-600">Node Types</div>
-            </div>
-            <div class="bg-white rounded-lg shadow-sm border p-4 text-center">
-                <div class="text-2xl font-bold text-orange-600">{sum(w.workflow_summary["connections"] for w in workflow_images)}</div>
-                <div class="text-sm text-gray-600">Connections</div>
-            </div>
-        </div>
+    thumbnails = _prefetch_thumbnails([w.image_path for w in workflow_images], thumbs_dir)
+    cards = [generate_master_catalog_card(workflow_data, page_path, thumbnails.get(workflow_data.image_path))
+             for workflow_data, page_path in zip(workflow_images, individual_pages)]
+    
+    return {
+        "workflow_count": len(workflow_images),
+        "timestamp": timestamp,
+        "total_nodes": total_nodes,
+        "node_type_count": len(all_node_types),
+        "connection_count": total_connections,
+        "checkpoint_options": checkpoint_options,
+        "lora_options": lora_options,
+        "node_type_options": node_type_options,
+        "cards": cards,
+    }
 
-        <!-- Search and Filter Bar -->
-        <div class="mb-8 bg-white rounded-lg shadow-sm border p-4">
-            <div class="flex flex-wrap gap-4 items-center">
-                <div class="flex-1 min-w-64">
-                    <input type="text" id="searchInput" placeholder="Search workflows by name or node type..." 
-                           class="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-blue-500">
-                </div>
-                <div class="flex gap-2">
-                    <select id="checkpointFilter" class="px-4 py-2 border border-gray-300 rounded-lg">
-                        <option value="">All Checkpoints</option>
-                        {checkpoint_options}
-                    </select>
-                    <select id="loraFilter" class="px-4 py-2 border border-gray-300 rounded-lg">
-                        <option value="">All LoRAs</option>
-                        {lora_options}
-                    </select>
-                    <select id="nodeTypeFilter" class="px-4 py-2 border border-gray-300 rounded-lg">
-                        <option value="">All Node Types</option>
-                        {node_type_options}
-                    </select>
-                    <button onclick="resetFilters()" class="px-4 py-2 bg-gray-100 text-gray-700 rounded-lg hover:bg-gray-200">
-                        Reset
-                    </button>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Masonry Grid -->
-        <div class="masonry-grid" id="workflowGrid">
-            {cards_html}
-        </div>
-        
-        <!-- No Results Message -->
-        <div id="noResults" class="hidden text-center py-12">
-            <div class="text-gray-400 text-6xl mb-4">🔍</div>
-            <h3 class="text-xl font-semibold text-gray-600 mb-2">No workflows found</h3>
-            <p class="text-gray-500">Try adjusting your search terms or filters</p>
-        </div>
-    </div>
 
-    <script>
-        // Search and filter functionality
-        const searchInput = document.getElementById('searchInput');
-        const checkpointFilter = document.getElementById('checkpointFilter');
-        const loraFilter = document.getElementById('loraFilter');
-        const nodeTypeFilter = document.getElementById('nodeTypeFilter');
-        const workflowGrid = document.getElementById('workflowGrid');
-        const noResults = document.getElementById('noResults');
-        
-        let allCards = Array.from(document.querySelectorAll('.masonry-item'));
-        
-        function filterCards() {{
-            const searchTerm = searchInput.value.toLowerCase();
-            const checkpointFilter_value = checkpointFilter.value;
-            const loraFilter_value = loraFilter.value;
-            const nodeTypeFilter_value = nodeTypeFilter.value;
-            
-            // Filter cards
-            let visibleCards = allCards.filter(card => {{
-                const text = card.textContent.toLowerCase();
-                const cardCheckpoints = (card.dataset.checkpoints || '').split(',').filter(c => c.trim());
-                const cardLoras = (card.dataset.loras || '').split(',').filter(l => l.trim());
-                const cardNodeTypes = (card.dataset.nodeTypes || '').split(',');
-                
-                const matchesSearch = text.includes(searchTerm);
-                const matchesCheckpoint = !checkpointFilter_value || cardCheckpoints.includes(checkpointFilter_value);
-                const matchesLora = !loraFilter_value || cardLoras.includes(loraFilter_value);
-                const matchesNodeType = !nodeTypeFilter_value || cardNodeTypes.includes(nodeTypeFilter_value);
-                
-                return matchesSearch && matchesCheckpoint && matchesLora && matchesNodeType;
-            }});
-            
-            // Update display (no sorting needed)
-            allCards.forEach(card => card.style.display = 'none');
-            visibleCards.forEach(card => card.style.display = 'block');
-            
-            // Show/hide no results message
-            if (visibleCards.length === 0) {{
-                noResults.classList.remove('hidden');
-                workflowGrid.style.display = 'none';
-            }} else {{
-                noResults.classList.add('hidden');
-                workflowGrid.style.display = 'block';
-            }}
-        }}
-        
-        function resetFilters() {{
-            searchInput.value = '';
-            checkpointFilter.value = '';
-            loraFilter.value = '';
-            nodeTypeFilter.value = '';
-            filterCards();
-        }}
-        
-        // Event listeners
-        searchInput.addEventListener('input', filterCards);
-        checkpointFilter.addEventListener('change', filterCards);
-        loraFilter.addEventListener('change', filterCards);
-        nodeTypeFilter.addEventListener('change', filterCards);
-    </script>
-    
-    <!-- Footer -->
-    <footer class="mt-16 py-8 border-t border-gray-200 text-center text-gray-500">
-        <div class="flex items-center justify-center space-x-2">
-            <span class="text-xl">💡</span>
-            <span class="font-medium">Comfy Light Table</span>
-            <span>•</span>
-            <span class="text-sm">Quality of Life Improvements</span>
-        </div>
-        <div class="mt-2 text-xs">
-            Built In Venice Beach • Workflow Analysis
-        </div>
-    </footer>
-</body>
-</html>'''
-    
-    return html
+def generate_comprehensive_master_catalog_html(analysis_results: List[FileAnalysisResult], individual_pages: List[str],
+                                              thumbs_dir: Optional[Path] = None) -> str:
+    """Generate comprehensive HTML content showing all files with diagnostics."""
+    return _COMPREHENSIVE_CATALOG_TEMPLATE.render(_comprehensive_catalog_context(analysis_results, individual_pages, thumbs_dir))
 
 
-def generate_comprehensive_master_catalog_html(analysis_results: List[FileAnalysisResult], individual_pages: List[str]) -> str:
-    """Generate comprehensive HTML content showing all files with diagnostics."""
-    from datetime import datetime
+def _comprehensive_catalog_context(analysis_results: List[FileAnalysisResult], individual_pages: List[str],
+                                   thumbs_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Build the template context for the comprehensive catalog page."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     # Categorize results
@@ -2421,255 +2709,185 @@ def generate_comprehensive_master_catalog_html(analysis_results: List[FileAnalys
     image_no_workflow = [r for r in analysis_results if r.is_image and not r.has_workflow]
     other_files = [r for r in analysis_results if not r.is_image]
     
+    # Encode image thumbnails concurrently before assembling cards
+    thumbnails = _prefetch_thumbnails([r.file_path for r in analysis_results
+                                       if r.file_path.suffix.lower() in _IMAGE_EXTS],
+                                      thumbs_dir)
+    
     # Generate cards HTML for all files
-    all_cards_html = ""
+    cards: List[str] = []
     
     # Add workflow files first (with links to individual pages)
     for i, result in enumerate(workflow_files):
         page_path = individual_pages[i] if i < len(individual_pages) else "#"
-        all_cards_html += generate_comprehensive_catalog_card(result, page_path, 'workflow')
+        cards.append(generate_comprehensive_catalog_card(result, page_path, 'workflow', thumbnails.get(result.file_path)))
     
     # Add images without workflows (with diagnostic info)
     for result in image_no_workflow:
-        all_cards_html += generate_comprehensive_catalog_card(result, None, 'image_no_workflow')
+        cards.append(generate_comprehensive_catalog_card(result, None, 'image_no_workflow', thumbnails.get(result.file_path)))
     
     # Add other files
     for result in other_files:
-        all_cards_html += generate_comprehensive_catalog_card(result, None, 'other_file')
+        cards.append(generate_comprehensive_catalog_card(result, None, 'other_file'))
     
     # Collect all models and node types from workflow files for filtering
-    all_checkpoints = set()
-    all_loras = set()
-    all_node_types = set()
-    
-    for result in workflow_files:
-        if result.models:
-            all_checkpoints.update(result.models.get('checkpoints', []))
-            all_loras.update(result.models.get('loras', []))
-        
-        if result.node_types:
-            all_node_types.update(result.node_types)
+    with_models = [r.models for r in workflow_files if r.models]
+    all_checkpoints = set(chain.from_iterable(m.get('checkpoints', []) for m in with_models))
+    all_loras = set(chain.from_iterable(m.get('loras', []) for m in with_models))
+    all_node_types = set(chain.from_iterable(r.node_types for r in workflow_files if r.node_types))
     
     # Generate filter options HTML
-    checkpoint_options = ''.join([f'<option value="{model}">{model}</option>' for model in sorted(all_checkpoints)])
-    lora_options = ''.join([f'<option value="{lora}">{lora}</option>' for lora in sorted(all_loras)])
-    node_options = ''.join([f'<option value="{node_type}">{node_type}</option>' for node_type in sorted(all_node_types)])
+    checkpoint_options = _render_filter_options(all_checkpoints)
+    lora_options = _render_filter_options(all_loras)
+    node_options = _render_filter_options(all_node_types)
+    
+    return {
+        "workflow_count": len(workflow_files),
+        "image_count": len(image_no_workflow),
+        "other_count": len(other_files),
+        "timestamp": timestamp,
+        "checkpoint_options": checkpoint_options,
+        "lora_options": lora_options,
+        "node_options": node_options,
+        "cards": cards,
+    }
+
+
+def _encode_thumbnail(image_path: Path) -> str:
+    """Encode an image as a data: URI, downscaled to THUMBNAIL_MAX_SIZE when Pillow is available."""
+    if PIL_AVAILABLE:
+        try:
+            with Image.open(image_path) as img:
+                img.thumbnail(THUMBNAIL_MAX_SIZE)
+                if img.mode not in ('RGB', 'RGBA'):
+                    img = img.convert('RGBA')
+                buffer = io.BytesIO()
+                img.save(buffer, format='WEBP', quality=80)
+            image_data = base64.b64encode(buffer.getvalue()).decode('utf-8')
+            return f"data:image/webp;base64,{image_data}"
+        except Exception:
+            pass  # Fall back to embedding the original bytes
+    
+    with open(image_path, 'rb') as f:
+        image_data = base64.b64encode(f.read()).decode('utf-8')
+    
+    mime_type = _MIME_BY_EXT.get(image_path.suffix.lower(), 'image/png')
+    return f"data:{mime_type};base64,{image_data}"
+
+
+def _thumb_data_uri(path_str: str, mtime: Optional[float], size: Optional[int]) -> str:
+    """Thumbnail data URI for an image, memoized in-process and on disk.
+    
+    mtime and size are part of the key so edited images are re-encoded; when
+    either is unknown they are read from the file.
+    """
+    if mtime is None or size is None:
+        stat = os.stat(path_str)
+        mtime, size = stat.st_mtime, stat.st_size
+    return _cached_thumb_data_uri(path_str, mtime, size)
+
+
+@lru_cache(maxsize=4096)
+def _cached_thumb_data_uri(path_str: str, mtime: float, size: int) -> str:
+    """_thumb_data_uri for a known mtime and size."""
+    cache_key = hashlib.sha1(f"{path_str}|{mtime}|{size}".encode('utf-8')).hexdigest()
+    cache_file = THUMBNAIL_CACHE_DIR / f"{cache_key}.txt"
+    try:
+        data_uri = cache_file.read_text(encoding='utf-8')
+        os.utime(cache_file)  # Mark as recently used for _evict_lru_files
+        return data_uri
+    except OSError:
+        pass
     
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ComfyUI Light Table</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        .masonry-grid {{
-            column-count: 4;
-            column-gap: 1.5rem;
-            column-fill: balance;
-        }}
-        
-        .masonry-item {{
-            break-inside: avoid;
-            margin-bottom: 1.5rem;
-        }}
-        
-        @media (max-width: 1024px) {{
-            .masonry-grid {{ column-count: 3; }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .masonry-grid {{ column-count: 2; }}
-        }}
-        
-        @media (max-width: 640px) {{
-            .masonry-grid {{ column-count: 1; }}
-        }}
-        
-        .card-hover {{
-            transition: all 0.3s ease;
-        }}
-        
-        .card-hover:hover {{
-            transform: translateY(-4px);
-            box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
-        }}
-        
-        .diagnostic-tooltip {{
-            max-width: 300px;
-        }}
-    </style>
-</head>
-<body class="bg-gray-50 p-6">
-    <div class="max-w-7xl mx-auto">
-        <!-- Header -->
-        <header class="mb-8 text-center">
-            <h1 class="text-4xl font-bold text-gray-900 mb-2">ComfyUI Light Table</h1>
-            <p class="text-lg text-gray-600 mb-4">Complete analysis of all files with diagnostic information</p>
-            <div class="grid grid-cols-2 md:grid-cols-4 gap-4 text-sm text-gray-600 max-w-2xl mx-auto">
-                <div class="flex items-center gap-2 justify-center">
-                    <span class="w-3 h-3 bg-green-500 rounded-full"></span>
-                    <span>{len(workflow_files)} With Workflows</span>
-                </div>
-                <div class="flex items-center gap-2 justify-center">
-                    <span class="w-3 h-3 bg-yellow-500 rounded-full"></span>
-                    <span>{len(image_no_workflow)} Images (No Workflow)</span>
-                </div>
-                <div class="flex items-center gap-2 justify-center">
-                    <span class="w-3 h-3 bg-blue-500 rounded-full"></span>
-                    <span>{len(other_files)} Other Files</span>
-                </div>
-                <div class="flex items-center gap-2 justify-center">
-                    <span class="text-2xl">📅</span>
-                    <span>Generated: {timestamp}</span>
-                </div>
-            </div>
-        </header>
-        
-        <!-- Filter and Search -->
-        <div class="mb-8 bg-white rounded-lg shadow-sm border p-4">
-            <div class="flex flex-wrap gap-4 items-center">
-                <div class="flex-1 min-w-64">
-                    <input type="text" id="searchInput" placeholder="Search files..." 
-                           class="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-blue-500">
-                </div>
-                <div class="flex gap-2">
-                    <select id="checkpointFilter" class="px-4 py-2 border border-gray-300 rounded-lg">
-                        <option value="">All Checkpoints</option>
-                        {checkpoint_options}
-                    </select>
-                    <select id="loraFilter" class="px-4 py-2 border border-gray-300 rounded-lg">
-                        <option value="">All LoRAs</option>
-                        {lora_options}
-                    </select>
-                    <select id="nodeFilter" class="px-4 py-2 border border-gray-300 rounded-lg">
-                        <option value="">All Node Types</option>
-                        {node_options}
-                    </select>
-                    <select id="typeFilter" class="px-4 py-2 border border-gray-300 rounded-lg">
-                        <option value="">All Types</option>
-                        <option value="workflow">With Workflows</option>
-                        <option value="image_no_workflow">Images (No Workflow)</option>
-                        <option value="other_file">Other Files</option>
-                    </select>
-                    <button onclick="resetFilters()" class="px-4 py-2 bg-gray-100 text-gray-700 rounded-lg hover:bg-gray-200">
-                        Reset
-                    </button>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Masonry Grid -->
-        <div class="masonry-grid" id="fileGrid">
-            {all_cards_html}
-        </div>
-        
-        <!-- No Results Message -->
-        <div id="noResults" class="hidden text-center py-12">
-            <div class="text-gray-400 text-6xl mb-4">🔍</div>
-            <h3 class="text-xl font-semibold text-gray-600 mb-2">No files found</h3>
-            <p class="text-gray-500">Try adjusting your search terms or filters</p>
-        </div>
-    </div>
+    data_uri = _encode_thumbnail(Path(path_str))
+    try:
+        THUMBNAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(data_uri, encoding='utf-8')
+    except OSError:
+        pass  # Cache is best-effort
+    return data_uri
 
-    <script>
-        // Search and filter functionality
-        const searchInput = document.getElementById('searchInput');
-        const checkpointFilter = document.getElementById('checkpointFilter');
-        const loraFilter = document.getElementById('loraFilter');
-        const nodeFilter = document.getElementById('nodeFilter');
-        const typeFilter = document.getElementById('typeFilter');
-        const fileGrid = document.getElementById('fileGrid');
-        const noResults = document.getElementById('noResults');
-        
-        let allCards = Array.from(document.querySelectorAll('.masonry-item'));
-        
-        function filterCards() {{
-            const searchTerm = searchInput.value.toLowerCase();
-            const checkpointFilter_value = checkpointFilter.value;
-            const loraFilter_value = loraFilter.value;
-            const nodeFilter_value = nodeFilter.value;
-            const typeFilterValue = typeFilter.value;
-            
-            // Filter cards (no sorting needed)
-            let visibleCards = allCards.filter(card => {{
-                const text = card.textContent.toLowerCase();
-                const matchesSearch = text.includes(searchTerm);
-                
-                const cardCheckpoints = (card.dataset.checkpoints || '').split(',').filter(c => c.trim());
-                const cardLoras = (card.dataset.loras || '').split(',').filter(l => l.trim());
-                const cardNodeTypes = (card.dataset.nodeTypes || '').split(',').filter(n => n.trim());
-                
-                const matchesCheckpoint = !checkpointFilter_value || cardCheckpoints.includes(checkpointFilter_value);
-                const matchesLora = !loraFilter_value || cardLoras.includes(loraFilter_value);
-                const matchesNodeType = !nodeFilter_value || cardNodeTypes.includes(nodeFilter_value);
-                const matchesType = !typeFilterValue || card.dataset.type === typeFilterValue;
-                
-                return matchesSearch && matchesCheckpoint && matchesLora && matchesNodeType && matchesType;
-            }});
-            
-            // Update display
-            allCards.forEach(card => card.style.display = 'none');
-            visibleCards.forEach(card => card.style.display = 'block');
-            
-            // Show/hide no results message
-            if (visibleCards.length === 0) {{
-                noResults.classList.remove('hidden');
-                fileGrid.style.display = 'none';
-            }} else {{
-                noResults.classList.add('hidden');
-                fileGrid.style.display = 'block';
-            }}
-        }}
-        
-        function resetFilters() {{
-            searchInput.value = '';
-            checkpointFilter.value = '';
-            loraFilter.value = '';
-            nodeFilter.value = '';
-            typeFilter.value = '';
-            filterCards();
-        }}
-        
-        // Event listeners
-        searchInput.addEventListener('input', filterCards);
-        checkpointFilter.addEventListener('change', filterCards);
-        loraFilter.addEventListener('change', filterCards);
-        nodeFilter.addEventListener('change', filterCards);
-        typeFilter.addEventListener('change', filterCards);
-    </script>
+
+def _write_thumbnail(image_path: Path, thumbs_dir: Path) -> str:
+    """Write a WebP thumbnail for an image into thumbs_dir and return its relative src.
     
-    <!-- Footer -->
-    <footer class="mt-16 py-8 border-t border-gray-200 text-center text-gray-500">
-        <div class="flex items-center justify-center space-x-2">
-            <span class="text-xl">💡</span>
-            <span class="font-medium">Comfy Light Table</span>
-            <span>•</span>
-            <span class="text-sm">Quality of Life Improvements</span>
-        </div>
-        <div class="mt-2 text-xs">
-            Built In Venice Beach • Workflow Analysis
-        </div>
-    </footer>
-</body>
-</html>'''
+    Existing thumbnails are reused unless the source image is newer. Falls back
+    to an inline data URI when Pillow is unavailable.
+    """
+    if not PIL_AVAILABLE:
+        stat = image_path.stat()
+        return _thumb_data_uri(str(image_path), stat.st_mtime, stat.st_size)
     
-    return html
+    thumb_path = thumbs_dir / f"{hashlib.sha1(str(image_path).encode('utf-8')).hexdigest()}.webp"
+    if not thumb_path.exists() or thumb_path.stat().st_mtime < image_path.stat().st_mtime:
+        with Image.open(image_path) as img:
+            img.thumbnail(THUMBNAIL_MAX_SIZE)
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA')
+            img.save(thumb_path, format='WEBP', quality=80)
+    return f"{thumbs_dir.name}/{thumb_path.name}"
 
 
-def generate_comprehensive_catalog_card(file_result: FileAnalysisResult, page_path: Optional[str], card_type: str) -> str:
-    """Generate HTML card for comprehensive catalog showing all file types."""
-    import base64
-    from datetime import datetime
+def _thumbnail_img_tag(src: str, alt: str, height_class: str) -> str:
+    """<img> tag for a catalog card thumbnail.
     
-    # Generate file info from available data
-    try:
-        stat = file_result.file_path.stat()
-        file_size_mb = round(stat.st_size / (1024 * 1024), 2)
-        modified_time = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
-    except Exception:
-        file_size_mb = file_result.file_size / (1024 * 1024) if file_result.file_size else 0
-        file_size_mb = round(file_size_mb, 2)
+    Thumbnail files use native lazy loading; inline data URIs are deferred
+    through the catalog's IntersectionObserver via data-src.
+    """
+    if src.startswith('data:'):
+        return f'<img data-src="{src}" alt="{alt}" class="lazy-thumb cat-card__thumb {height_class}">'
+    return f'<img src="{src}" alt="{alt}" loading="lazy" decoding="async" class="cat-card__thumb {height_class}">'
+
+
+def _json_data_attr(values) -> str:
+    """Encode a list as a JSON array for a single-quoted card data-* attribute.
+    
+    JSON keeps names containing commas intact; the filter script parses it once.
+    """
+    return _html.escape(json.dumps(list(values), separators=(',', ':')), quote=False).replace("'", '&#39;')
+
+
+def _prefetch_thumbnails(image_paths: List[Path], thumbs_dir: Optional[Path] = None) -> Dict[Path, str]:
+    """Prepare thumbnails for many images on a thread pool so disk reads overlap.
+    
+    Returns image path -> img src: a file under thumbs_dir when given,
+    otherwise an inline data URI. Images that fail are left out; the card
+    generators retry them and render their usual error placeholder.
+    """
+    def encode(image_path: Path) -> Optional[str]:
+        try:
+            if thumbs_dir is not None:
+                return _write_thumbnail(image_path, thumbs_dir)
+            stat = image_path.stat()
+            return _thumb_data_uri(str(image_path), stat.st_mtime, stat.st_size)
+        except Exception:
+            return None
+    
+    if not image_paths:
+        return {}
+    
+    if thumbs_dir is not None:
+        thumbs_dir.mkdir(parents=True, exist_ok=True)
+    
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+        encoded = executor.map(encode, image_paths)
+        thumbnails = {path: uri for path, uri in zip(image_paths, encoded) if uri}
+    
+    # Data URIs go through the shared on-disk cache; keep it bounded
+    if thumbs_dir is None and THUMBNAIL_CACHE_DIR.is_dir():
+        _evict_lru_files(THUMBNAIL_CACHE_DIR, '.txt', THUMBNAIL_CACHE_MAX_ENTRIES)
+    return thumbnails
+
+
+def generate_comprehensive_catalog_card(file_result: FileAnalysisResult, page_path: Optional[str], card_type: str,
+                                        thumbnail_src: Optional[str] = None) -> str:
+    """Generate HTML card for comprehensive catalog showing all file types."""
+    # Generate file info from the stat taken during analysis
+    file_size_mb = file_result.file_size / (1024 * 1024) if file_result.file_size else 0
+    file_size_mb = round(file_size_mb, 2)
+    if file_result.modified_time is not None:
+        modified_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(file_result.modified_time))
+    else:
         modified_time = "Unknown"
     
     file_info = {
@@ -2701,24 +2919,14 @@ def generate_comprehensive_catalog_card(file_result: FileAnalysisResult, page_pa
     thumbnail_html = ""
     
     # Check if it's an image file by extension
-    is_image_file = file_result.file_path.suffix.lower() in ['.png', '.webp', '.jpg', '.jpeg']
+    is_image_file = file_result.file_path.suffix.lower() in _IMAGE_EXTS
     
     if is_image_file:
         # For image files, always show the actual image
         try:
-            with open(file_result.file_path, 'rb') as f:
-                image_data = base64.b64encode(f.read()).decode('utf-8')
-            
-            ext = file_result.file_path.suffix.lower()
-            mime_type = {
-                '.png': 'image/png',
-                '.webp': 'image/webp', 
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg'
-            }.get(ext, 'image/png')
-            
-            thumbnail_data = f"data:{mime_type};base64,{image_data}"
-            thumbnail_html = f'<img src="{thumbnail_data}" alt="{file_result.file_path.name}" class="w-full h-32 object-cover bg-gray-100">'
+            if thumbnail_src is None:
+                thumbnail_src = _thumb_data_uri(str(file_result.file_path), file_result.modified_time, file_result.file_size)
+            thumbnail_html = _thumbnail_img_tag(thumbnail_src, file_result.file_path.name, 'h-32')
         except Exception as e:
             # If image loading fails, show error icon
             thumbnail_html = f'<div class="w-full h-32 bg-red-100 flex items-center justify-center"><span class="text-red-400 text-4xl">❌</span><div class="text-xs text-red-600 mt-1">Image Error</div></div>'
@@ -2745,13 +2953,13 @@ def generate_comprehensive_catalog_card(file_result: FileAnalysisResult, page_pa
     # Add model data attributes for workflow files
     model_attributes = ""
     if card_type == 'workflow' and file_result.workflow and file_result.models:
-        checkpoints_json = ','.join(file_result.models.get('checkpoints', []))
-        loras_json = ','.join(file_result.models.get('loras', []))
-        node_types_json = ','.join(file_result.node_types or [])
-        model_attributes = f'''data-checkpoints="{checkpoints_json}" data-loras="{loras_json}" data-node-types="{node_types_json}"'''
+        checkpoints_json = _json_data_attr(file_result.models.get('checkpoints', []))
+        loras_json = _json_data_attr(file_result.models.get('loras', []))
+        node_types_json = _json_data_attr(file_result.node_types or [])
+        model_attributes = f"data-checkpoints='{checkpoints_json}' data-loras='{loras_json}' data-node-types='{node_types_json}'"
 
     card_html = f'''
-    <div class="masonry-item {card_class} bg-white rounded-lg shadow-sm border {border_color} overflow-hidden"
+    <div class="masonry-item {card_class} cat-card {border_color}"
          data-type="{card_type}" 
          data-size="{file_info['size_mb']}" 
          data-date="{file_info['modified']}"
@@ -2764,7 +2972,7 @@ def generate_comprehensive_catalog_card(file_result: FileAnalysisResult, page_pa
                 <div class="flex items-start gap-2 mb-2">
                     <span class="text-lg">{icon}</span>
                     <div class="flex-1">
-                        <h3 class="font-bold text-sm text-gray-900 line-clamp-2">
+                        <h3 class="cat-card__title">
                             {file_result.file_path.name}
                         </h3>
                         <div class="text-xs {status_color} mt-1">
@@ -2788,51 +2996,39 @@ def generate_comprehensive_catalog_card(file_result: FileAnalysisResult, page_pa
 
 def get_file_type_icon(file_type: str) -> str:
     """Get appropriate icon for file type."""
-    icons = {
-        'workflow_json': '⚙️',
-        'json_other': '📄',
-        'json_invalid': '❌',
-        'text_file': '📝',
-        'markdown_file': '📖',
-        'python_file': '🐍',
-        'javascript_file': '📜',
-        'html_file': '🌐',
-        'css_file': '🎨',
-        'yaml_file': '⚙️',
-        'xml_file': '📋',
-        'other_file': '📄',
-        'no_extension': '❓',
-        'error': '💥'
-    }
-    return icons.get(file_type, '📄')
+    return _FILE_TYPE_ICONS.get(file_type, '📄')
 
 
-def generate_master_catalog_card(workflow_data: WorkflowImageData, page_path: str) -> str:
+def _workflow_models(workflow_data: WorkflowImageData) -> Dict[str, List[str]]:
+    """Models referenced by a workflow, extracted once and cached on workflow_data."""
+    if workflow_data.models is None:
+        # Use original workflow format for model extraction (preserves widget_values)
+        if workflow_data.original_workflow:
+            workflow_for_models = workflow_data.original_workflow
+        else:
+            # Fallback: re-extract original format from image
+            workflow_for_models = extract_workflow_from_image(workflow_data.image_path, preserve_original_format=True)
+            if not workflow_for_models:
+                workflow_for_models = workflow_data.workflow
+        workflow_data.models = extract_models_from_workflow(workflow_for_models)
+    return workflow_data.models
+
+
+def generate_master_catalog_card(workflow_data: WorkflowImageData, page_path: str,
+                                 thumbnail_src: Optional[str] = None) -> str:
     """Generate HTML card for masonry grid."""
-    import base64
-    
     # Get workflow summary
     summary = workflow_data.workflow_summary
     file_info = workflow_data.file_info
     
-    # Generate thumbnail (base64 encoded)
-    thumbnail_data = ""
-    try:
-        with open(workflow_data.image_path, 'rb') as f:
-            image_data = base64.b64encode(f.read()).decode('utf-8')
-        
-        # Determine MIME type
-        ext = workflow_data.image_path.suffix.lower()
-        mime_type = {
-            '.png': 'image/png',
-            '.webp': 'image/webp', 
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg'
-        }.get(ext, 'image/png')
-        
-        thumbnail_data = f"data:{mime_type};base64,{image_data}"
-    except Exception as e:
-        print(f"Warning: Could not encode image {workflow_data.image_path}: {e}")
+    # Generate thumbnail (inline data URI) unless it was prefetched
+    if thumbnail_src is None:
+        thumbnail_src = ""
+        try:
+            stat = workflow_data.image_path.stat()
+            thumbnail_src = _thumb_data_uri(str(workflow_data.image_path), stat.st_mtime, stat.st_size)
+        except Exception as e:
+            print(f"Warning: Could not encode image {workflow_data.image_path}: {e}")
     
     # Generate node types badge
     node_types_display = ", ".join(summary["node_types"][:3])
@@ -2840,21 +3036,12 @@ def generate_master_catalog_card(workflow_data: WorkflowImageData, page_path: st
         node_types_display += f" (+{len(summary['node_types']) - 3} more)"
     
     # Extract models and node types for filtering
-    # Use original workflow format for model extraction (preserves widget_values)
-    if hasattr(workflow_data, 'original_workflow') and workflow_data.original_workflow:
-        workflow_for_models = workflow_data.original_workflow
-    else:
-        # Fallback: re-extract original format from image
-        workflow_for_models = extract_workflow_from_image(workflow_data.image_path, preserve_original_format=True)
-        if not workflow_for_models:
-            workflow_for_models = workflow_data.workflow
-    
-    models = extract_models_from_workflow(workflow_for_models)
+    models = _workflow_models(workflow_data)
     
     # Separate checkpoints and LoRAs
-    checkpoints_json = ','.join(models.get('checkpoints', []))
-    loras_json = ','.join(models.get('loras', []))
-    node_types_json = ','.join(summary["node_types"])
+    checkpoints_json = _json_data_attr(models.get('checkpoints', []))
+    loras_json = _json_data_attr(models.get('loras', []))
+    node_types_json = _json_data_attr(summary["node_types"])
     
     # Get relative file path for display
     try:
@@ -2863,20 +3050,20 @@ def generate_master_catalog_card(workflow_data: WorkflowImageData, page_path: st
         relative_path = str(workflow_data.image_path)
     
     card_html = f'''
-    <div class="masonry-item card-hover bg-white rounded-lg shadow-sm border overflow-hidden"
+    <div class="masonry-item card-hover cat-card"
          data-nodes="{summary['total_nodes']}" 
          data-date="{file_info['modified']}"
          data-size="{file_info['size_mb']}"
-         data-checkpoints="{checkpoints_json}"
-         data-loras="{loras_json}"
-         data-node-types="{node_types_json}">
+         data-checkpoints='{checkpoints_json}'
+         data-loras='{loras_json}'
+         data-node-types='{node_types_json}'>
         <a href="{page_path}" class="block">
             <!-- Image -->
-            {f'<img src="{thumbnail_data}" alt="Generated Image" class="w-full h-48 object-cover bg-gray-100">' if thumbnail_data else '<div class="w-full h-48 bg-gray-100 flex items-center justify-center"><span class="text-gray-400 text-4xl">🖼️</span></div>'}
+            {_thumbnail_img_tag(thumbnail_src, 'Generated Image', 'h-48') if thumbnail_src else '<div class="w-full h-48 bg-gray-100 flex items-center justify-center"><span class="text-gray-400 text-4xl">🖼️</span></div>'}
             
             <!-- Content -->
             <div class="p-4">
-                <h3 class="font-bold text-lg text-gray-900 mb-2 line-clamp-2">
+                <h3 class="cat-card__title cat-card__title--lg">
                     {workflow_data.image_path.stem.replace('_', ' ').replace('-', ' ').title()}
                 </h3>
                 
@@ -2909,36 +3096,67 @@ def generate_master_catalog_card(workflow_data: WorkflowImageData, page_path: st
     return card_html
 
 
+def _load_workflow_from_image(input_path: Path, streaming: bool = False) -> Tuple[Dict, str]:
+    """Extract the workflow embedded in an image; the image doubles as the associated image."""
+    print(f"Extracting workflow from image: {input_path}")
+    workflow = extract_workflow_from_image(input_path)
+    if not workflow:
+        raise ValueError(f"Error: No ComfyUI workflow found in image {input_path}")
+    return workflow, str(input_path)
+
+
+def _load_workflow_from_json(input_path: Path, streaming: bool = False) -> Tuple[Dict, None]:
+    """Load a workflow JSON file.
+    
+    With ``streaming`` (or for files above STREAMING_JSON_THRESHOLD) and ijson
+    installed, the top-level node entries are parsed one at a time instead of
+    holding the whole token stream in memory.
+    """
+    try:
+        if not streaming and input_path.stat().st_size > STREAMING_JSON_THRESHOLD:
+            streaming = True
+        if streaming and not IJSON_AVAILABLE:
+            print("⚠️ ijson not installed; loading workflow JSON without streaming", file=sys.stderr)
+            streaming = False
+        with open(input_path, 'rb') as f:
+            if streaming:
+                workflow = dict(ijson.kvitems(f, '', use_float=True))
+            else:
+                workflow = _load(f)
+        return _normalize_workflow(workflow), None
+    except Exception as e:
+        raise ValueError(f"Error loading workflow JSON: {e}") from e
+
+
+# single_file_mode input loaders keyed by lowercase suffix
+_SINGLE_FILE_LOADERS = MappingProxyType({
+    **{suffix: _load_workflow_from_image for suffix in _IMAGE_EXTS},
+    '.json': _load_workflow_from_json,
+})
+
+
 def single_file_mode(args):
     """Handle single file processing (existing functionality)."""
     
     # Determine input type and load workflow
     input_path = Path(args.input)
-    workflow = None
-    source_image_path = None
-    
-    if input_path.suffix.lower() in {'.png', '.webp', '.jpg', '.jpeg'}:
-        # Extract workflow from image
-        print(f"Extracting workflow from image: {input_path}")
-        workflow = extract_workflow_from_image(input_path)
-        source_image_path = str(input_path)
-        
-        if not workflow:
-            print(f"Error: No ComfyUI workflow found in image {input_path}", file=sys.stderr)
-            return 1
-            
-    elif input_path.suffix.lower() == '.json':
-        # Load workflow from JSON
-        try:
-            with open(input_path, 'r') as f:
-                workflow = json.load(f)
-        except Exception as e:
-            print(f"Error loading workflow JSON: {e}", file=sys.stderr)
-            return 1
-    else:
+    loader = _SINGLE_FILE_LOADERS.get(input_path.suffix.lower())
+    if loader is None:
         print(f"Error: Unsupported file type {input_path.suffix}. Use .json, .png, or .webp files.", file=sys.stderr)
         return 1
     
+    try:
+        workflow, source_image_path = loader(input_path, streaming=getattr(args, 'streaming', False))
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    
+    # analyze_workflow only records links to missing nodes; report them here
+    dangling = analyze_workflow(workflow)["dangling"]
+    if dangling:
+        print(f"⚠️ Workflow references {len(dangling)} missing source node(s): "
+              f"{', '.join(sorted({str(src) for _, _, src in dangling}))}", file=sys.stderr)
+    
     # Find associated image
     import os
     associated_image = None
@@ -3015,27 +3233,29 @@ def single_file_mode(args):
     # Generate catalog
     try:
         if args.format == 'html':
+            # HTML fragments are written as they are produced
             workflow_name = input_path.stem.replace('-', ' ').replace('_', ' ').title()
-            catalog = generate_html_visual(workflow, workflow_name, args.server, associated_image)
+            fragments = _iter_html_visual(workflow, workflow_name, args.server, associated_image)
+            if args.output:
+                with open(args.output, 'w') as f:
+                    f.writelines(fragments)
+                print(f"✓ Catalog written to {args.output}")
+            else:
+                sys.stdout.writelines(fragments)
+                sys.stdout.write("\n")
+            return 0
+        elif args.output:
+            # Markdown streams straight into the output file
+            with open(args.output, 'w') as f:
+                generate_markdown_catalog(workflow, args.format, out=f)
+            print(f"✓ Catalog written to {args.output}")
+            return 0
         else:
-            catalog = generate_markdown_catalog(workflow, args.format)
+            generate_markdown_catalog(workflow, args.format, out=sys.stdout)
+            return 0
     except Exception as e:
         print(f"Error generating catalog: {e}", file=sys.stderr)
         return 1
-    
-    # Write output
-    if args.output:
-        try:
-            with open(args.output, 'w') as f:
-                f.write(catalog)
-            print(f"✓ Catalog written to {args.output}")
-        except Exception as e:
-            print(f"Error writing output: {e}", file=sys.stderr)
-            return 1
-    else:
-        print(catalog)
-    
-    return 0
 
 
 if __name__ == '__main__':
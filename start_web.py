@@ -6,6 +6,7 @@ Checks dependencies and starts the Comfy Light Table web interface server.
 Quality of Life Improvements with drag-and-drop processing.
 """
 
+import importlib.util
 import sys
 import subprocess
 from pathlib import Path
@@ -16,14 +17,14 @@ def check_dependencies():
         'fastapi',
         'uvicorn',
         'websockets',
-        'multipart'
+        'multipart',
+        'jinja2'
     ]
     
     missing = []
     for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+        # find_spec only locates the package; the server process does the real import
+        if importlib.util.find_spec(package) is None:
             missing.append(package)
     
     if missing:
@@ -33,7 +34,7 @@ def check_dependencies():
         print("\n📦 Install with:")
         print("   pip install -r web_requirements.txt")
         print("   # OR")
-        print("   pip install fastapi uvicorn[standard] websockets python-multipart")
+        print("   pip install fastapi uvicorn[standard] websockets python-multipart jinja2")
         return False
     
     return True
@@ -0,0 +1,736 @@
+// Copy functionality
+document.addEventListener('DOMContentLoaded', function() {
+    // Delegated, since copy buttons arrive with each node's lazily loaded parameters
+    document.addEventListener('click', function(event) {
+        const button = event.target.closest('.copy-btn');
+        if (!button) return;
+
+        let copyText;
+        let copyMode;
+
+        if (event.shiftKey) {
+            // SHIFT + Click: Copy full CLI command
+            copyText = button.getAttribute('data-copy-text');
+            copyMode = 'command';
+        } else {
+            // Normal Click: Copy just the value
+            copyText = button.getAttribute('data-value') || button.getAttribute('data-copy-text');
+            copyMode = 'value';
+        }
+
+        copyToClipboard(copyText, button, copyMode);
+    });
+
+    // Fetch a node's parameter rows the first time its <details> is opened
+    // (toggle does not bubble, so listen in the capture phase)
+    document.addEventListener('toggle', async function(event) {
+        const details = event.target;
+        if (!details.matches('details[data-node-id]') || !details.open) return;
+
+        const slot = details.querySelector('.params-slot');
+        if (slot.dataset.loaded) return;
+        slot.dataset.loaded = 'true';
+
+        try {
+            const digest = details.closest('[data-workflow-digest]')?.dataset.workflowDigest || '';
+            const response = await fetch(`/api/workflows/${workflowId}/nodes/${encodeURIComponent(details.dataset.nodeId)}/params-html?v=${digest}`);
+            if (!response.ok) throw new Error('Failed to load parameters');
+            slot.innerHTML = await response.text();
+        } catch (error) {
+            delete slot.dataset.loaded;
+            console.error('Error loading node parameters:', error);
+            slot.textContent = 'Failed to load parameters';
+        }
+    }, true);
+
+    // Hide delete confirmations when clicking outside
+    document.addEventListener('click', function(event) {
+        if (!event.target.closest('.tag-item-wrapper')) {
+            document.querySelectorAll('.delete-confirm').forEach(confirm => {
+                confirm.classList.add('hidden');
+            });
+        }
+    });
+
+    // One delegated listener serves every tag chip, including ones added later
+    document.getElementById('tags-container').addEventListener('click', function(event) {
+        const control = event.target.closest('[data-action]');
+        if (!control) return;
+
+        const tagValue = control.closest('.tag-item-wrapper').dataset.tag;
+        switch (control.dataset.action) {
+            case 'edit':
+                editTag(control, tagValue);
+                break;
+            case 'delete-ask':
+                showDeleteConfirm(control, tagValue);
+                break;
+            case 'delete-confirm':
+                confirmDelete(control, tagValue);
+                break;
+            case 'cancel':
+                cancelDelete(control);
+                break;
+        }
+    });
+
+    // Shift key detection for copy buttons hover state
+    document.addEventListener('keydown', function(event) {
+        if (event.key === 'Shift') {
+            document.querySelectorAll('.copy-btn').forEach(button => {
+                button.classList.add('shift-hover');
+            });
+        }
+    });
+
+    document.addEventListener('keyup', function(event) {
+        if (event.key === 'Shift') {
+            document.querySelectorAll('.copy-btn').forEach(button => {
+                button.classList.remove('shift-hover');
+            });
+        }
+    });
+});
+
+function copyToClipboard(text, button, copyMode) {
+    if (navigator.clipboard && navigator.clipboard.writeText) {
+        navigator.clipboard.writeText(text).then(() => {
+            showCopySuccess(button, copyMode);
+        }).catch((err) => {
+            console.error('Clipboard API failed:', err);
+            fallbackCopy(text, button, copyMode);
+        });
+    } else {
+        fallbackCopy(text, button, copyMode);
+    }
+}
+
+function fallbackCopy(text, button, copyMode) {
+    const textArea = document.createElement('textarea');
+    textArea.value = text;
+    textArea.style.position = 'fixed';
+    textArea.style.left = '-999999px';
+    textArea.style.top = '-999999px';
+    document.body.appendChild(textArea);
+    textArea.focus();
+    textArea.select();
+
+    try {
+        const successful = document.execCommand('copy');
+        if (successful) {
+            showCopySuccess(button, copyMode);
+        } else {
+            showCopyError(button);
+        }
+    } catch (err) {
+        console.error('Fallback copy failed:', err);
+        showCopyError(button);
+    }
+
+    document.body.removeChild(textArea);
+}
+
+function showCopySuccess(button, copyMode) {
+    const originalText = button.innerHTML;
+    const originalClass = button.className;
+
+    button.innerHTML = '✓';
+    button.className = button.className.replace('bg-gray-200', 'bg-green-500 text-white');
+
+    // Show toast with different messages based on copy mode
+    const toast = document.getElementById('copyToast');
+    if (toast) {
+        const messageSpan = toast.querySelector('span:last-child');
+        if (copyMode === 'command') {
+            messageSpan.textContent = 'CLI command copied!';
+        } else if (copyMode === 'value') {
+            messageSpan.textContent = 'Parameter value copied!';
+        } else {
+            messageSpan.textContent = 'Copied to clipboard!';
+        }
+
+        toast.style.transform = 'translateX(0)';
+        setTimeout(() => {
+            toast.style.transform = 'translateX(100%)';
+        }, 2000);
+    }
+
+    setTimeout(() => {
+        button.innerHTML = originalText;
+        button.className = originalClass;
+    }, 2000);
+}
+
+function showCopyError(button) {
+    const originalText = button.innerHTML;
+    const originalClass = button.className;
+
+    button.innerHTML = '✗';
+    button.className = button.className.replace('bg-gray-200', 'bg-red-500 text-white');
+
+    setTimeout(() => {
+        button.innerHTML = originalText;
+        button.className = originalClass;
+    }, 2000);
+}
+
+// Save description functionality  
+async function saveDescription() {
+    const description = document.getElementById('description').value;
+    await updateWorkflowField('description', description, event.target);
+}
+
+// Tag management functions
+function addNewTag() {
+    document.getElementById('add-tag-form').classList.remove('hidden');
+    document.getElementById('new-tag-input').focus();
+}
+
+function cancelAddTag() {
+    document.getElementById('add-tag-form').classList.add('hidden');
+    document.getElementById('new-tag-input').value = '';
+}
+
+async function saveNewTag() {
+    const tagInput = document.getElementById('new-tag-input');
+    const tagValue = tagInput.value.trim();
+
+    if (!tagValue) return;
+
+    try {
+        const response = await fetch(`/api/workflows/${workflowId}/tags`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ tag: tagValue })
+        });
+
+        if (response.ok) {
+            // Add tag to UI
+            addTagToUI(tagValue);
+            cancelAddTag();
+            showSuccessToast('Tag added successfully');
+        } else {
+            alert('Failed to add tag');
+        }
+    } catch (error) {
+        console.error('Error adding tag:', error);
+        alert('Error adding tag');
+    }
+}
+
+function showDeleteConfirm(button, tagValue) {
+    // Hide any other open confirmations
+    document.querySelectorAll('.delete-confirm').forEach(confirm => {
+        confirm.classList.add('hidden');
+    });
+
+    // Show confirmation for this tag
+    const tagWrapper = button.closest('.tag-item-wrapper');
+    const confirmDiv = tagWrapper.querySelector('.delete-confirm');
+    confirmDiv.classList.remove('hidden');
+}
+
+function cancelDelete(button) {
+    const confirmDiv = button.closest('.delete-confirm');
+    confirmDiv.classList.add('hidden');
+}
+
+async function confirmDelete(button, tagValue) {
+    try {
+        const response = await fetch(`/api/workflows/${workflowId}/tags`, {
+            method: 'DELETE',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ tag: tagValue })
+        });
+
+        if (response.ok) {
+            // Remove tag from UI
+            removeTagFromUI(button.closest('.tag-item-wrapper'));
+            showSuccessToast('Tag deleted successfully');
+        } else {
+            alert('Failed to delete tag');
+        }
+    } catch (error) {
+        console.error('Error deleting tag:', error);
+        alert('Error deleting tag');
+    }
+}
+
+function editTag(tagElement, originalTag) {
+    const input = document.createElement('input');
+    input.type = 'text';
+    input.value = originalTag;
+    input.className = 'px-1 text-xs border border-gray-300 rounded';
+    input.style.width = Math.max(50, originalTag.length * 8) + 'px';
+
+    const saveEdit = async () => {
+        const newTag = input.value.trim();
+        if (newTag && newTag !== originalTag) {
+            try {
+                const response = await fetch(`/api/workflows/${workflowId}/tags`, {
+                    method: 'PUT',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ oldTag: originalTag, newTag: newTag })
+                });
+
+                if (response.ok) {
+                    const tagWrapper = tagElement.closest('.tag-item-wrapper');
+                    tagElement.textContent = newTag;
+                    tagWrapper.dataset.tag = newTag;
+                    tagWrapper.querySelector('.delete-confirm-tag').textContent = newTag;
+                    showSuccessToast('Tag updated successfully');
+                } else {
+                    alert('Failed to update tag');
+                    tagElement.textContent = originalTag;
+                }
+            } catch (error) {
+                console.error('Error updating tag:', error);
+                alert('Error updating tag');
+                tagElement.textContent = originalTag;
+            }
+        } else {
+            tagElement.textContent = originalTag;
+        }
+        tagElement.style.display = 'inline';
+    };
+
+    input.addEventListener('blur', saveEdit);
+    input.addEventListener('keypress', (e) => {
+        if (e.key === 'Enter') {
+            e.preventDefault();
+            saveEdit();
+        }
+    });
+
+    tagElement.style.display = 'none';
+    tagElement.parentNode.insertBefore(input, tagElement.nextSibling);
+    input.focus();
+    input.select();
+}
+
+// Project info saving
+async function saveProjectInfo() {
+    const clientName = document.getElementById('client-name').value.trim();
+    const projectName = document.getElementById('project-name').value.trim();
+
+    try {
+        const response = await fetch(`/api/workflows/${workflowId}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                client_name: clientName,
+                project_name: projectName
+            })
+        });
+
+        if (response.ok) {
+            showSuccessMessage('Project information saved successfully');
+        } else {
+            alert('Failed to save project information');
+        }
+    } catch (error) {
+        console.error('Error saving project info:', error);
+        alert('Error saving project information');
+    }
+}
+
+// Workflow execution (placeholder)
+function runWorkflow() {
+    alert('🚀 Workflow execution feature coming soon!\n\nThis will integrate with ComfyUI API to run the workflow with current parameters.');
+}
+
+// Remove workflow from database
+async function removeWorkflow() {
+    const workflowName = document.querySelector('h1').textContent;
+
+    if (!confirm(`Remove "${workflowName}" from the database?\n\nThis will delete the catalog entry but preserve all original files.`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/workflows/${workflowId}`, {
+            method: 'DELETE'
+        });
+
+        if (response.ok) {
+            const result = await response.json();
+            alert(result.message + '\n\n' + result.note);
+            // Redirect to catalog
+            window.location.href = '/catalog';
+        } else {
+            const error = await response.json();
+            alert('Failed to remove workflow: ' + (error.detail || 'Unknown error'));
+        }
+    } catch (error) {
+        console.error('Error removing workflow:', error);
+        alert('Failed to remove workflow: Network error');
+    }
+}
+
+// Utility functions
+async function updateWorkflowField(field, value, button) {
+    try {
+        const response = await fetch(`/api/workflows/${workflowId}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ [field]: value })
+        });
+
+        if (response.ok) {
+            showSuccessMessage('Saved successfully', button);
+        } else {
+            alert(`Failed to save ${field}`);
+        }
+    } catch (error) {
+        console.error(`Error saving ${field}:`, error);
+        alert(`Error saving ${field}`);
+    }
+}
+
+function showSuccessMessage(message, button = null) {
+    if (button) {
+        const originalText = button.textContent;
+        const originalClass = button.className;
+        button.textContent = '✓ Saved!';
+        button.className = button.className.replace('bg-blue-500', 'bg-green-500');
+
+        setTimeout(() => {
+            button.textContent = originalText;
+            button.className = originalClass;
+        }, 2000);
+    } else {
+        showSuccessToast(message);
+    }
+}
+
+function showSuccessToast(message) {
+    const toast = document.getElementById('copyToast');
+    const messageSpan = toast.querySelector('span:last-child');
+    messageSpan.textContent = message;
+    toast.style.transform = 'translateX(0)';
+    setTimeout(() => {
+        toast.style.transform = 'translateX(100%)';
+    }, 2000);
+}
+
+function addTagToUI(tagValue) {
+    const chip = document.getElementById('tag-template').content.cloneNode(true);
+    chip.querySelector('.tag-item-wrapper').dataset.tag = tagValue;
+    chip.querySelector('.tag-text').textContent = tagValue;
+    chip.querySelector('.delete-confirm-tag').textContent = tagValue;
+    document.getElementById('tags-container').appendChild(chip);
+}
+
+function removeTagFromUI(tagWrapper) {
+    tagWrapper.remove();
+}
+
+function openFileLocation(filePath) {
+    if (!filePath) {
+        const toast = document.createElement('div');
+        toast.style.cssText = 'position:fixed;top:20px;right:20px;background:var(--nasa-orange);color:white;padding:8px 16px;border-radius:4px;z-index:1000;font-size:12px;';
+        toast.textContent = 'No file path available';
+        document.body.appendChild(toast);
+        setTimeout(() => document.body.removeChild(toast), 2000);
+        return;
+    }
+
+    // Try different methods based on platform/browser
+    if (navigator.platform.indexOf('Mac') !== -1) {
+        // macOS - try to open in Finder
+        fetch('/api/open-file-location', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ file_path: filePath })
+        }).then(response => {
+            if (response.ok) {
+                const toast = document.createElement('div');
+                toast.style.cssText = 'position:fixed;top:20px;right:20px;background:var(--nasa-blue);color:white;padding:8px 16px;border-radius:4px;z-index:1000;font-size:12px;';
+                toast.textContent = 'Opening file location...';
+                document.body.appendChild(toast);
+                setTimeout(() => document.body.removeChild(toast), 2000);
+            } else {
+                throw new Error('Failed to open file location');
+            }
+        }).catch(error => {
+            // Fallback: copy path to clipboard
+            copyToClipboard(filePath);
+            const toast = document.createElement('div');
+            toast.style.cssText = 'position:fixed;top:20px;right:20px;background:var(--nasa-orange);color:white;padding:8px 16px;border-radius:4px;z-index:1000;font-size:12px;';
+            toast.textContent = 'Could not open location, path copied instead';
+            document.body.appendChild(toast);
+            setTimeout(() => document.body.removeChild(toast), 3000);
+        });
+    } else {
+        // For other platforms, just copy to clipboard for now
+        copyToClipboard(filePath);
+        const toast = document.createElement('div');
+        toast.style.cssText = 'position:fixed;top:20px;right:20px;background:var(--nasa-blue);color:white;padding:8px 16px;border-radius:4px;z-index:1000;font-size:12px;';
+        toast.textContent = 'File path copied to clipboard';
+        document.body.appendChild(toast);
+        setTimeout(() => document.body.removeChild(toast), 2000);
+    }
+}
+
+function addToCollections() {
+    // Open collection picker for this single workflow
+    openCollectionPicker([workflowId]);
+}
+
+async function removeFromCollection(collectionId, collectionName) {
+    if (!confirm(`Remove this workflow from collection "${collectionName}"?`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/workflows/${workflowId}/collections/${encodeURIComponent(collectionId)}`, {
+            method: 'DELETE'
+        });
+
+        // 404 means the link is already gone; drop the stale chip either way
+        if (!response.ok && response.status !== 404) throw new Error('Failed to update collections');
+
+        const chip = document.querySelector(`#workflow-collections [data-collection-id="${CSS.escape(String(collectionId))}"]`);
+        if (chip) chip.remove();
+        if (!document.querySelector('#workflow-collections [data-collection-id]')) {
+            renderWorkflowCollections([]);
+        }
+        invalidateFetchCache('/api/collections');
+
+    } catch (error) {
+        console.error('Error removing from collection:', error);
+        alert('Failed to remove from collection');
+    }
+}
+
+// Redraw the collection chips without reloading the page
+function renderWorkflowCollections(collections) {
+    const container = document.getElementById('workflow-collections');
+    container.replaceChildren();
+
+    if (collections.length === 0) {
+        const empty = document.createElement('span');
+        empty.className = 'text-xs';
+        empty.style.color = 'var(--nasa-gray)';
+        empty.textContent = 'No collections assigned';
+        container.appendChild(empty);
+        return;
+    }
+
+    collections.forEach(collection => {
+        const chip = document.createElement('span');
+        chip.className = 'tag-collection';
+        chip.setAttribute('data-collection-id', collection.id);
+        chip.style.cssText = 'margin-right: 0.25rem; margin-bottom: 0.25rem; display: inline-flex; align-items: center; gap: 4px;';
+        chip.append(collection.name);
+
+        const button = document.createElement('button');
+        button.className = 'text-xs';
+        button.style.cssText = 'color: var(--nasa-white); background: transparent; border: none; cursor: pointer;';
+        button.title = 'Remove from collection';
+        button.textContent = '×';
+        button.addEventListener('click', () => removeFromCollection(collection.id, collection.name));
+        chip.appendChild(button);
+
+        container.appendChild(chip);
+    });
+}
+
+// Share identical in-flight GETs and reuse recent responses for a short TTL
+const _inflightRequests = new Map();
+const _responseCache = new Map();
+
+function fetchCached(url, ttl = 5000) {
+    const hit = _responseCache.get(url);
+    if (hit && Date.now() - hit.time < ttl) return Promise.resolve(hit.response.clone());
+
+    if (!_inflightRequests.has(url)) {
+        const request = fetch(url).then(response => {
+            if (response.ok) _responseCache.set(url, { time: Date.now(), response: response.clone() });
+            return response;
+        }).finally(() => _inflightRequests.delete(url));
+        _inflightRequests.set(url, request);
+    }
+    return _inflightRequests.get(url).then(response => response.clone());
+}
+
+function invalidateFetchCache(url) {
+    _responseCache.delete(url);
+}
+
+// Collection Picker Functions (same as catalog page)
+let collectionPickerWorkflows = [];
+
+function openCollectionPicker(workflowIds) {
+    collectionPickerWorkflows = workflowIds;
+
+    // Create modal if it doesn't exist
+    if (!document.getElementById('collection-picker-modal')) {
+        const modal = document.createElement('div');
+        modal.id = 'collection-picker-modal';
+        modal.className = 'fixed inset-0 z-50 hidden';
+        modal.innerHTML = `
+            <div class="fixed inset-0 bg-black bg-opacity-50" onclick="closeCollectionPicker()"></div>
+            <div class="fixed top-1/2 left-1/2 transform -translate-x-1/2 -translate-y-1/2 w-full max-w-lg">
+                <div class="confirmation-dialog p-6 m-4">
+                    <div class="flex justify-between items-center mb-4">
+                        <h2 class="text-xl font-bold" style="color: var(--nasa-dark);">📚 ADD TO COLLECTIONS</h2>
+                        <button onclick="closeCollectionPicker()" class="text-gray-500 hover:text-gray-700 text-2xl">&times;</button>
+                    </div>
+
+                    <div class="mb-4 p-3 border border-gray-200 rounded" style="border-color: var(--nasa-gray);">
+                        <div class="flex space-x-2">
+                            <input type="text" id="quick-collection-name" class="search-input flex-1" placeholder="Create new collection...">
+                            <button onclick="createQuickCollection()" class="btn-primary" style="padding: 0.5rem;">➕</button>
+                        </div>
+                    </div>
+
+                    <div class="mb-4">
+                        <div id="collection-picker-list" class="space-y-2 max-h-60 overflow-y-auto">
+                            <!-- Collections will be loaded here -->
+                        </div>
+                    </div>
+
+                    <div class="flex justify-end space-x-2">
+                        <button onclick="closeCollectionPicker()" class="btn-secondary">Cancel</button>
+                        <button onclick="saveCollectionAssignments()" class="btn-primary">Save</button>
+                    </div>
+                </div>
+            </div>
+        `;
+        document.body.appendChild(modal);
+    }
+
+    document.getElementById('collection-picker-modal').classList.remove('hidden');
+    loadCollectionPickerList();
+}
+
+function closeCollectionPicker() {
+    const modal = document.getElementById('collection-picker-modal');
+    if (modal) {
+        modal.classList.add('hidden');
+        const quickName = document.getElementById('quick-collection-name');
+        if (quickName) quickName.value = '';
+    }
+    collectionPickerWorkflows = [];
+}
+
+async function loadCollectionPickerList() {
+    try {
+        const response = await fetchCached('/api/collections');
+        if (!response.ok) return;
+
+        const data = await response.json();
+        const collections = data.collections || [];
+
+        const container = document.getElementById('collection-picker-list');
+        if (!container) return;
+
+        container.innerHTML = '';
+
+        if (collections.length === 0) {
+            container.innerHTML = '<p class="filter-label text-center py-4">No collections yet. Create one above.</p>';
+            return;
+        }
+
+        collections.forEach(collection => {
+            const item = document.createElement('div');
+            item.className = 'collection-picker-item';
+            item.setAttribute('data-collection-id', collection.id);
+
+            item.innerHTML = `
+                <div class="collection-color-dot" style="background-color: ${collection.color || '#105bd8'}"></div>
+                <div class="flex-1">
+                    <div class="filter-label">${collection.name}</div>
+                    ${collection.description ? `<div class="text-xs" style="color: var(--nasa-gray);">${collection.description}</div>` : ''}
+                </div>
+                <div class="text-xs" style="color: var(--nasa-gray);">${collection.file_count || 0} workflows</div>
+            `;
+
+            item.addEventListener('click', function() {
+                item.classList.toggle('selected');
+            });
+
+            container.appendChild(item);
+        });
+
+    } catch (error) {
+        console.error('Error loading collections:', error);
+    }
+}
+
+async function createQuickCollection() {
+    const nameInput = document.getElementById('quick-collection-name');
+    if (!nameInput) return;
+
+    const name = nameInput.value.trim();
+    if (!name) return;
+
+    try {
+        const response = await fetch('/api/collections', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ 
+                name: name,
+                description: '',
+                color: '#105bd8'
+            })
+        });
+
+        if (!response.ok) {
+            const error = await response.json();
+            alert(error.detail || 'Failed to create collection');
+            return;
+        }
+
+        nameInput.value = '';
+        invalidateFetchCache('/api/collections');
+        await loadCollectionPickerList();
+
+    } catch (error) {
+        console.error('Error creating collection:', error);
+        alert('Failed to create collection');
+    }
+}
+
+async function saveCollectionAssignments() {
+    const selectedCollectionIds = Array.from(
+        document.querySelectorAll('.collection-picker-item.selected')
+    ).map(item => item.getAttribute('data-collection-id'));
+
+    if (collectionPickerWorkflows.length === 0) {
+        closeCollectionPicker();
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/workflows/collections/bulk', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                workflow_ids: collectionPickerWorkflows,
+                collection_ids: selectedCollectionIds
+            })
+        });
+
+        if (!response.ok) {
+            console.error('Failed to update workflow collections');
+            alert('Failed to update collections');
+            return;
+        }
+
+        const result = await response.json();
+        if (collectionPickerWorkflows.includes(workflowId)) {
+            renderWorkflowCollections(result.collections);
+        }
+        invalidateFetchCache('/api/collections');
+
+        closeCollectionPicker();
+
+    } catch (error) {
+        console.error('Error saving collection assignments:', error);
+        alert('Failed to update collections');
+    }
+}
@@ -0,0 +1,143 @@
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("sqlalchemy")
+
+from fastapi.testclient import TestClient
+
+import web_interface
+from database import database
+from database.models import Collection, Tag, WorkflowFile
+
+SAMPLE_WORKFLOW = Path(__file__).resolve().parent.parent / "McMaster-Carr-Futures.json"
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    # Point the app at a throwaway SQLite file with one tagged, collected workflow
+    manager = database.DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}")
+    manager.create_tables()
+    monkeypatch.setattr(database, "db_manager", manager)
+    monkeypatch.setattr(web_interface, "_DETAIL_PAGE_CACHE", {})
+    with manager.get_session() as session:
+        workflow = WorkflowFile(
+            id="w1", file_path="/x/w1.json", filename="w1.png", file_size=1,
+            workflow_data=json.loads(SAMPLE_WORKFLOW.read_text()),
+        )
+        workflow.tags = [Tag(name="alpha")]
+        workflow.collections = [Collection(id="c1", name="First")]
+        session.add_all([workflow, Collection(id="c2", name="Second")])
+        session.commit()
+    yield manager
+    manager.engine.dispose()
+
+
+@pytest.fixture
+def client(db):
+    return TestClient(web_interface.app)
+
+
+def test_detail_page_etag_and_not_modified(client):
+    response = client.get("/workflows/w1")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "no-cache"
+
+    response = client.get("/workflows/w1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_detail_page_rerenders_after_tag_and_collection_change(client, db):
+    etag = client.get("/workflows/w1").headers["etag"]
+
+    with db.get_session() as session:
+        workflow = session.get(WorkflowFile, "w1")
+        workflow.tags.append(Tag(name="gamma"))
+        session.commit()
+    response = client.get("/workflows/w1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "gamma" in response.text
+    etag = response.headers["etag"]
+
+    with db.get_session() as session:
+        session.get(Collection, "c1").name = "Renamed"
+        session.commit()
+    response = client.get("/workflows/w1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "Renamed" in response.text
+
+
+def test_detail_page_cache_evicts_least_recently_used(client, db, monkeypatch):
+    monkeypatch.setattr(web_interface, "DETAIL_PAGE_CACHE_MAX_ENTRIES", 2)
+    with db.get_session() as session:
+        for workflow_id in ("w2", "w3"):
+            session.add(WorkflowFile(id=workflow_id, file_path=f"/x/{workflow_id}.json",
+                                     filename=f"{workflow_id}.png", workflow_data={}))
+        session.commit()
+
+    client.get("/workflows/w1")
+    client.get("/workflows/w2")
+    client.get("/workflows/w1")  # hit keeps w1 warm
+    client.get("/workflows/w3")
+    assert list(web_interface._DETAIL_PAGE_CACHE) == ["w1", "w3"]
+
+
+def _collection_ids(db, workflow_id):
+    with db.get_session() as session:
+        return sorted(collection.id for collection in session.get(WorkflowFile, workflow_id).collections)
+
+
+def test_remove_workflow_from_collection(client, db):
+    response = client.delete("/api/workflows/w1/collections/c1")
+    assert response.status_code == 200
+    assert response.json() == {"success": True}
+    assert _collection_ids(db, "w1") == []
+
+
+@pytest.mark.parametrize("path", [
+    "/api/workflows/w1/collections/c2",
+    "/api/workflows/w1/collections/nope",
+    "/api/workflows/nope/collections/c1",
+])
+def test_remove_workflow_from_collection_without_link_is_404(client, db, path):
+    assert client.delete(path).status_code == 404
+    assert _collection_ids(db, "w1") == ["c1"]
+
+
+def test_bulk_assign_replaces_collections(client, db):
+    with db.get_session() as session:
+        session.add(WorkflowFile(id="w2", file_path="/x/w2.json", filename="w2.png", workflow_data={}))
+        session.commit()
+
+    response = client.post("/api/workflows/collections/bulk",
+                           json={"workflow_ids": ["w1", "w2"], "collection_ids": ["c2"]})
+    assert response.status_code == 200
+    assert response.json() == {
+        "success": True, "updated": 2, "missing": [],
+        "collections": [{"id": "c2", "name": "Second"}],
+    }
+    assert _collection_ids(db, "w1") == ["c2"]
+    assert _collection_ids(db, "w2") == ["c2"]
+
+
+def test_bulk_assign_reports_unknown_ids(client, db):
+    response = client.post("/api/workflows/collections/bulk",
+                           json={"workflow_ids": ["w1", "nope"], "collection_ids": ["c2", "missing"]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["updated"] == 1
+    assert body["missing"] == ["nope"]
+    # Unknown collection ids are dropped rather than linked
+    assert body["collections"] == [{"id": "c2", "name": "Second"}]
+    assert _collection_ids(db, "w1") == ["c2"]
+
+
+def test_bulk_assign_with_no_collections_clears_them(client, db):
+    response = client.post("/api/workflows/collections/bulk",
+                           json={"workflow_ids": ["w1"], "collection_ids": []})
+    assert response.json()["collections"] == []
+    assert _collection_ids(db, "w1") == []
@@ -0,0 +1,141 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.workflow_catalog import (
+    Connection,
+    _normalize_workflow,
+    analyze_workflow,
+    extract_workflow_from_image,
+    format_parameter_value,
+)
+
+SAMPLE_WORKFLOW = Path(__file__).resolve().parent.parent / "McMaster-Carr-Futures.json"
+
+
+def _node(class_type, **inputs):
+    return {"class_type": class_type, "inputs": inputs}
+
+
+def test_consumed_output_node_is_not_an_output():
+    workflow = {
+        "1": _node("PreviewImage", images=["3", 0]),
+        "2": _node("SaveImage", images=["1", 0]),
+        "3": _node("VAEDecode"),
+    }
+    analysis = analyze_workflow(workflow)
+    assert analysis["output_nodes"] == ["2"]
+    assert analysis["connections_count"] == 2
+
+
+def test_dangling_link_is_reported_not_connected(capsys):
+    analysis = analyze_workflow({"1": _node("KSampler", model=["99", 0])})
+    assert analysis["dangling"] == [("1", "model", "99")]
+    assert analysis["connections_count"] == 0
+    assert analysis["input_nodes"] == []
+    # Library callers (web UI, ingestion) get the data, not console noise
+    assert capsys.readouterr().err == ""
+
+
+@pytest.mark.parametrize("value", [
+    [1.5, 2.0],
+    ["a", "b"],
+    ["1", "0"],
+    [{"a": 1}, 0],
+    [[1, 2], [3, 4]],
+])
+def test_two_item_list_parameters_are_not_links(value):
+    workflow = {"1": _node("EmptyLatentImage"), "2": _node("KSampler", size=value)}
+    analysis = analyze_workflow(workflow)
+    assert analysis["connections_count"] == 0
+    assert analysis["dangling"] == []
+    assert sorted(analysis["input_nodes"]) == ["1", "2"]
+
+
+
+@pytest.mark.parametrize("value, is_link", [
+    (["3", 0], True),
+    ([3, 0], True),
+    (["x", True], False),
+    ([1.5, 2.0], False),
+])
+def test_normalize_and_format_share_the_link_rule(value, is_link):
+    workflow = _normalize_workflow({"1": _node("KSampler", model=list(value))})
+    assert (type(workflow["1"]["inputs"]["model"]) is Connection) == is_link
+    assert format_parameter_value(list(value)).startswith("**→ Node") == is_link
+
+def test_db_connection_count_of_image_extracted_workflow(tmp_path):
+    PngImagePlugin = pytest.importorskip("PIL.PngImagePlugin")
+    Image = pytest.importorskip("PIL.Image")
+    pytest.importorskip("sqlalchemy")
+    from database.database import WorkflowFileManager
+    from database.incremental_ingestion import IncrementalIngestionManager
+
+    raw = SAMPLE_WORKFLOW.read_text()
+    expected = sum(
+        1 for node in json.loads(raw).values() for value in node.get("inputs", {}).values()
+        if isinstance(value, list) and len(value) == 2
+    )
+
+    info = PngImagePlugin.PngInfo()
+    info.add_text("prompt", raw)
+    image_path = tmp_path / "sample.png"
+    Image.new("RGB", (8, 8)).save(image_path, pnginfo=info)
+
+    # The extractor normalizes links to Connection tuples; both DB counters must still see them
+    workflow = extract_workflow_from_image(image_path)
+    assert WorkflowFileManager(None)._analyze_workflow(workflow)["connection_count"] == expected
+    assert IncrementalIngestionManager(None)._analyze_workflow(workflow)["connection_count"] == expected
+
+
+def test_batch_analysis_error_keeps_file_stats(tmp_path, monkeypatch):
+    import scripts.workflow_catalog as catalog
+
+    image_path = tmp_path / "broken.png"
+    image_path.write_bytes(b"x" * 100)
+
+    # Fail after stat() succeeded, inside the per-file try block
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(catalog.mimetypes, "guess_type", fail)
+
+    results, _ = catalog.comprehensive_batch_analysis([image_path], {})
+    assert not results[0].success
+    assert results[0].file_size == 100
+    assert results[0].modified_time == image_path.stat().st_mtime
+
+
+def test_reused_catalog_page_gets_this_runs_timestamp(tmp_path, monkeypatch):
+    import datetime as real_datetime
+    import scripts.workflow_catalog as catalog
+
+    runs = iter([real_datetime.datetime(2024, 1, 1, 9, 0), real_datetime.datetime(2024, 1, 2, 9, 0)])
+
+    class FakeDatetime(real_datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return next(runs)
+    monkeypatch.setattr(catalog, "datetime", FakeDatetime)
+
+    image_path = tmp_path / "sample.png"
+    image_path.write_bytes(b"")
+    workflow = json.loads(SAMPLE_WORKFLOW.read_text())
+    page = tmp_path / "workflows" / "sample_workflow.html"
+
+    def run():
+        images = [catalog.WorkflowImageData(image_path=image_path, workflow=workflow, metadata={})]
+        catalog.generate_individual_catalogs(images, tmp_path)
+        return page.read_text(encoding="utf-8")
+
+    first = run()
+
+    # The second run must come from the page cache, not a fresh render
+    def no_render(job):
+        raise AssertionError("unchanged page was re-rendered")
+    monkeypatch.setattr(catalog, "_render_one", no_render)
+    second = run()
+
+    assert "Generated: 2024-01-01 09:00:00" in first
+    assert "Generated: 2024-01-02 09:00:00" in second
+    assert second == first.replace("2024-01-01 09:00:00", "2024-01-02 09:00:00")
@@ -10,6 +10,8 @@ analyze, and understand your ComfyUI workflows with clarity and ease.
 """
 
 import asyncio
+import hashlib
+import html as html_escape
 import json
 import logging
 import os
@@ -21,19 +23,32 @@ from typing import Dict, List, Optional
 import uvicorn
 from fastapi import FastAPI, File, UploadFile, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, Response
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from markupsafe import Markup
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 # Import our existing ComfyREST functionality
-import sys
-sys.path.append('scripts')
-from workflow_catalog import (
+from scripts.workflow_catalog import (
     extract_workflow_from_image, 
     analyze_workflow, 
     generate_html_visual,
-    ui_to_api_format
+    ui_to_api_format,
+    _is_connection,
+    _loads,
+    _sorted_node_ids,
+    _KNOWN_DROPDOWNS,
+    _HINT_SUFFIXES
 )
 
+# Import orjson for fast workflow content hashing if available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,1098 +56,216 @@ logger = logging.getLogger(__name__)
 # Import database functionality
 try:
     from database.database import get_database_manager, WorkflowFileManager
-    from database.models import WorkflowFile, Tag, Collection, Client, Project
+    from database.models import WorkflowFile, Tag, Collection, Client, Project, file_collections
+    from sqlalchemy.orm import joinedload
     DATABASE_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"Database not available: {e}")
     DATABASE_AVAILABLE = False
 
-def generate_workflow_detail_html(workflow, workflow_json, checkpoints, loras):
-    """Generate detailed HTML page for a workflow with rich editing features."""
-    import html as html_escape
-    
-    # Build tags from proper relationship + legacy JSON field
-    tags = []
-    
-    # Get tags from proper Tag relationship (preferred)
-    if hasattr(workflow, 'tags') and workflow.tags:
-        tags.extend([tag.name for tag in workflow.tags])
-    
-    # Also check legacy style_tags JSON field for backwards compatibility
-    elif workflow.style_tags:  # Only use if no proper tags exist
-        try:
-            if isinstance(workflow.style_tags, str):
-                import json
-                style_tags = json.loads(workflow.style_tags)
-            else:
-                style_tags = workflow.style_tags
-            tags.extend(style_tags)
-        except Exception:
-            pass
-    
-    # Add checkpoint and lora tags (but only if not already present)
-    for checkpoint in checkpoints:
-        checkpoint_tag = f"checkpoint:{checkpoint}"
-        if checkpoint_tag not in tags:
-            tags.append(checkpoint_tag)
-    for lora in loras:
-        lora_tag = f"lora:{lora}"
-        if lora_tag not in tags:
-            tags.append(lora_tag)
-    
-    # Format file size
-    file_size_str = f"{workflow.file_size / 1024:.1f} KB" if workflow.file_size else "Unknown"
-    
-    # Check if has image
-    has_image = (workflow.image_width is not None and workflow.image_height is not None) or (
-        workflow.filename and workflow.filename.lower().endswith(('.png', '.jpg', '.jpeg', '.webp'))
-    )
-    
-    html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Workflow: {html_escape.escape(workflow.filename or "Unknown")}</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        :root {{
-            --nasa-red: #fc3d21;
-            --nasa-blue: #105bd8;
-            --nasa-gray: #aeb0b5;
-            --nasa-white: #ffffff;
-            --nasa-dark: #212121;
-            --nasa-orange: #ff9d1e;
-        }}
-        
-        * {{
-            font-family: '3270 Nerd Font Mono', 'SF Mono', 'Monaco', 'Inconsolata', 'Roboto Mono', 'Source Code Pro', 'Menlo', 'Consolas', monospace;
-        }}
-        
-        body {{
-            background: var(--nasa-white);
-            color: var(--nasa-dark);
-            font-weight: 400;
-        }}
-        
-        .neo-brutalist-card {{
-            background: var(--nasa-white);
-            color: var(--nasa-dark);
-            border: 1px solid var(--nasa-dark);
-            font-weight: 400;
-            border-radius: 2px;
-        }}
-        
-        .node-card {{ 
-            background: var(--nasa-white);
-            border: 1px solid var(--nasa-dark);
-            border-radius: 2px;
-        }}
-        .copy-btn {{ 
-            font-size: 10px;
-            background: transparent;
-            color: var(--nasa-dark);
-            border: 1px solid var(--nasa-dark);
-            font-weight: 400;
-            padding: 0.2rem 0.4rem;
-            border-radius: 2px;
-            cursor: pointer;
-            transition: all 0.1s ease;
-        }}
-        
-        .copy-btn:hover {{
-            background: var(--nasa-dark);
-            color: var(--nasa-white);
-        }}
-        
-        .copy-btn.shift-hover:hover {{
-            background: var(--nasa-orange);
-            color: var(--nasa-white);
-            border-color: var(--nasa-orange);
-        }}
-        
-        .tag-custom {{
-            background: transparent;
-            color: var(--nasa-dark);
-            border: 1px solid var(--nasa-dark);
-            font-weight: 400;
-            padding: 0.2rem 0.4rem;
-            font-size: 0.65rem;
-            border-radius: 2px;
-        }}
-        
-        .tag-collection {{
-            background: transparent;
-            color: var(--nasa-blue);
-            border: 1px solid var(--nasa-blue);
-            font-weight: 400;
-            padding: 0.2rem 0.4rem;
-            font-size: 0.65rem;
-            border-radius: 2px;
-            display: inline-block;
-            margin-right: 0.25rem;
-            margin-bottom: 0.25rem;
-        }}
-        
-        .btn-primary {{
-            background: transparent;
-            color: var(--nasa-orange);
-            border: 1px solid var(--nasa-orange);
-            font-weight: 400;
-            padding: 0.5rem 1rem;
-            font-size: 0.75rem;
-            border-radius: 2px;
-            text-transform: uppercase;
-            letter-spacing: 0.025em;
-            cursor: pointer;
-            transition: all 0.1s ease;
-        }}
-        
-        .btn-primary:hover {{
-            background: var(--nasa-orange);
-            color: var(--nasa-white);
-            border-color: var(--nasa-orange);
-        }}
-        
-        .btn-secondary {{
-            background: transparent;
-            color: var(--nasa-blue);
-            border: 1px solid var(--nasa-dark);
-            font-weight: 400;
-            padding: 0.5rem 1rem;
-            font-size: 0.75rem;
-            border-radius: 2px;
-            text-transform: uppercase;
-            letter-spacing: 0.025em;
-            cursor: pointer;
-            transition: all 0.1s ease;
-        }}
-        
-        .btn-secondary:hover {{
-            background: var(--nasa-blue);
-            color: var(--nasa-white);
-            border-color: var(--nasa-blue);
-        }}
-        
-        .btn-path {{
-            background: transparent;
-            color: var(--nasa-dark);
-            border: 1px solid var(--nasa-dark);
-            font-weight: 400;
-            padding: 0.25rem 0.5rem;
-            border-radius: 2px;
-            cursor: pointer;
-            font-size: 0.45rem;
-            transition: all 0.1s ease;
-        }}
-        
-        .btn-path:hover {{
-            background: var(--nasa-dark);
-            color: var(--nasa-white);
-            border-color: var(--nasa-dark);
-        }}
-        
-        .filename-truncated {{
-            max-width: 400px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-        }}
-    </style>
-</head>
-<body class="min-h-screen" style="background: var(--nasa-white); color: var(--nasa-dark);">
-    <!-- Header -->
-    <header class="neo-brutalist-card sticky top-0 z-40" style="border-radius: 0; border-left: none; border-right: none; border-top: none;">
-        <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
-            <div class="flex justify-between items-center py-4">
-                <div class="flex items-center space-x-4">
-                    <a href="/catalog" class="btn-secondary" style="text-decoration: none;">← Back to Catalog</a>
-                    <h1 class="text-xl font-bold filename-truncated" style="color: var(--nasa-dark);" title="{html_escape.escape(workflow.filename or 'Unknown Workflow')}">{html_escape.escape(workflow.filename or "Unknown Workflow")}</h1>
-                    <div class="flex items-center space-x-2">
-                        <button onclick="copyToClipboard('{workflow.file_path.replace("'", "\\'")}', this)" class="btn-path" title="Copy file path">CPY</button>
-                        <button onclick="openFileLocation('{workflow.file_path.replace("'", "\\'")}', this)" class="btn-path" title="Open file location">GTO</button>
-                    </div>
-                </div>
-                <div class="flex items-center space-x-4">
-                    {f'<a href="/api/workflows/{workflow.id}/thumbnail" target="_blank" class="btn-primary" style="text-decoration: none;">View Image</a>' if has_image else ''}
-                    <a href="/api/workflows/{workflow.id}" class="btn-secondary" style="text-decoration: none;">Download JSON</a>
-                </div>
-            </div>
-        </div>
-    </header>
-
-    <div class="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
-        <!-- Workflow Info -->
-        <div class="neo-brutalist-card p-6 mb-8">
-            <div class="grid grid-cols-1 md:grid-cols-2 gap-6">
-                <div>
-                    <h2 class="text-xl font-semibold mb-4" style="color: var(--nasa-dark);">Workflow Information</h2>
-                    <div class="space-y-3">
-                        <div class="flex justify-between">
-                            <span class="font-medium" style="color: var(--nasa-gray);">File:</span>
-                            <span style="color: var(--nasa-dark);">{html_escape.escape(workflow.filename or "Unknown")}</span>
-                        </div>
-                        <div class="flex justify-between">
-                            <span class="font-medium" style="color: var(--nasa-gray);">Size:</span>
-                            <span style="color: var(--nasa-dark);">{file_size_str}</span>
-                        </div>
-                        <div class="flex justify-between">
-                            <span class="font-medium" style="color: var(--nasa-gray);">Nodes:</span>
-                            <span style="color: var(--nasa-dark);">{workflow.node_count or 0}</span>
-                        </div>
-                        <div class="flex justify-between">
-                            <span class="font-medium" style="color: var(--nasa-gray);">File Date:</span>
-                            <span style="color: var(--nasa-dark);">{workflow.file_modified_at.strftime("%Y-%m-%d %H:%M") if workflow.file_modified_at else "Unknown"}</span>
-                        </div>
-                        <div class="flex justify-between">
-                            <span class="font-medium" style="color: var(--nasa-gray);">Ingested:</span>
-                            <span class="text-xs" style="color: var(--nasa-dark);">{workflow.created_at.strftime("%Y-%m-%d %H:%M") if workflow.created_at else "Unknown"}</span>
-                        </div>
-                    </div>
-                    
-                    <!-- Editable Description -->
-                    <div class="mt-6">
-                        <label class="block font-medium mb-2" style="color: var(--nasa-gray);">Description:</label>
-                        <textarea id="description" class="w-full px-3 py-2 border focus:outline-none" 
-                                  style="border-color: var(--nasa-gray); border-radius: 2px; background: var(--nasa-white); color: var(--nasa-dark);"
-                                  rows="3" placeholder="Add a description for this workflow...">{html_escape.escape(workflow.notes or "")}</textarea>
-                        <button onclick="saveDescription()" class="mt-2 btn-secondary" style="text-decoration: none;">
-                            Save Description
-                        </button>
-                    </div>
-                </div>
-                
-                <div>
-                    <!-- Workflow Image -->
-                    {f'''
-                    <div class="mb-6">
-                        <h3 class="text-lg font-medium mb-3" style="color: var(--nasa-dark);">Workflow Output</h3>
-                        <div class="neo-brutalist-card overflow-hidden">
-                            <img src="/api/workflows/{workflow.id}/thumbnail" alt="Workflow output" 
-                                 class="w-full h-auto max-h-64 object-contain"
-                                 style="background: var(--nasa-white);"
-                                 onerror="this.style.display='none'; this.nextElementSibling.style.display='block';">
-                            <div class="text-center text-sm p-8 hidden" style="color: var(--nasa-gray);">
-                                No image available
-                            </div>
-                        </div>
-                    </div>''' if has_image else '''
-                    <div class="mb-6">
-                        <div class="neo-brutalist-card p-8 text-center" style="color: var(--nasa-gray);">
-                            <span class="text-4xl" style="color: var(--nasa-gray);">[IMG]</span>
-                            <p class="text-sm mt-2">No image available</p>
-                        </div>
-                    </div>'''}
-                    
-                    <!-- RUN WORKFLOW Button -->
-                    <div class="mb-6">
-                        <button onclick="runWorkflow()" class="w-full btn-primary flex items-center justify-center gap-2" style="text-decoration: none; padding: 0.75rem 1.5rem;">
-                            RUN WORKFLOW
-                        </button>
-                        <p class="text-xs mt-2 text-center" style="color: var(--nasa-gray);">Execute this workflow in ComfyUI</p>
-                    </div>
-
-                    <!-- REMOVE WORKFLOW Button -->
-                    <div class="mb-6">
-                        <button onclick="removeWorkflow()" class="w-full btn-danger flex items-center justify-center gap-2" style="text-decoration: none; padding: 0.75rem 1.5rem;">
-                            REMOVE FROM DATABASE
-                        </button>
-                        <p class="text-xs mt-2 text-center" style="color: var(--nasa-gray);">Remove catalog entry (files preserved)</p>
-                    </div>
-                    
-                    <!-- Checkpoints & LoRAs -->
-                    <h3 class="text-lg font-medium mb-3" style="color: var(--nasa-dark);">Resources</h3>
-                    {f'''
-                    <div class="mb-4">
-                        <h4 class="font-medium mb-2" style="color: var(--nasa-gray);">Checkpoints ({len(checkpoints)}):</h4>
-                        <div class="space-y-1">
-                            {chr(10).join(f'<div class="neo-brutalist-card px-3 py-2 text-sm" style="border-color: var(--nasa-blue); color: var(--nasa-blue);">{html_escape.escape(cp)}</div>' for cp in checkpoints)}
-                        </div>
-                    </div>''' if checkpoints else ''}
-                    
-                    {f'''
-                    <div class="mb-4">
-                        <h4 class="font-medium mb-2" style="color: var(--nasa-gray);">LoRAs ({len(loras)}):</h4>
-                        <div class="space-y-1">
-                            {chr(10).join(f'<div class="neo-brutalist-card px-3 py-2 text-sm" style="border-color: var(--nasa-orange); color: var(--nasa-orange);">{html_escape.escape(lora)}</div>' for lora in loras)}
-                        </div>
-                    </div>''' if loras else ''}
-                    
-                    <!-- Tags with editing capabilities -->
-                    <div class="mb-4">
-                        <div class="flex justify-between items-center mb-2">
-                            <h4 class="font-medium" style="color: var(--nasa-gray);">Tags ({len(tags)}):</h4>
-                            <button onclick="addNewTag()" class="btn-primary" style="text-decoration: none; padding: 0.25rem 0.5rem; font-size: 0.75rem;">
-                                Add Tag
-                            </button>
-                        </div>
-                        <div id="tags-container" class="flex flex-wrap gap-2 mb-2">
-                            {' '.join(f'''
-                            <span class="tag-item-wrapper relative">
-                                <span class="tag-custom flex items-center gap-1 group">
-                                    <span class="tag-text cursor-pointer" onclick="editTag(this, '{html_escape.escape(tag)}')" title="Click to edit">{html_escape.escape(tag)}</span>
-                                    <button onclick="showDeleteConfirm(this, '{html_escape.escape(tag)}')" class="opacity-0 group-hover:opacity-100 transition-opacity ml-1" style="color: var(--nasa-red);" title="Delete tag">×</button>
-                                </span>
-                                <div class="delete-confirm hidden absolute top-full left-0 mt-1 neo-brutalist-card p-2 z-10 whitespace-nowrap">
-                                    <div class="text-xs mb-2" style="color: var(--nasa-dark);">Delete "{html_escape.escape(tag)}"?</div>
-                                    <div class="flex gap-1">
-                                        <button onclick="confirmDelete(this, '{html_escape.escape(tag)}')" class="btn-secondary" style="text-decoration: none; padding: 0.25rem 0.5rem; font-size: 0.75rem; background: var(--nasa-red); color: var(--nasa-white); border-color: var(--nasa-red);">Delete</button>
-                                        <button onclick="cancelDelete(this)" class="btn-secondary" style="text-decoration: none; padding: 0.25rem 0.5rem; font-size: 0.75rem;">Cancel</button>
-                                    </div>
-                                </div>
-                            </span>
-                            ''' for tag in tags)}
-                        </div>
-                        <div id="add-tag-form" class="hidden">
-                            <input type="text" id="new-tag-input" placeholder="Enter new tag..." class="px-2 py-1 text-xs mr-2" style="border: 1px solid var(--nasa-gray); border-radius: 2px; background: var(--nasa-white); color: var(--nasa-dark);">
-                            <button onclick="saveNewTag()" class="btn-secondary" style="text-decoration: none; padding: 0.25rem 0.5rem; font-size: 0.75rem;">Save</button>
-                            <button onclick="cancelAddTag()" class="bg-gray-500 text-white px-2 py-1 rounded text-xs hover:bg-gray-600 ml-1">Cancel</button>
-                        </div>
-                    </div>
-                    
-                    <!-- Collections -->
-                    <div class="mb-4">
-                        <h4 class="font-medium mb-2" style="color: var(--nasa-gray);">Collections:</h4>
-                        <div id="workflow-collections" class="mb-2">
-                            {''.join(f'''<span class="tag-collection" style="margin-right: 0.25rem; margin-bottom: 0.25rem; display: inline-flex; align-items: center; gap: 4px;">
-                                {html_escape.escape(collection.name)}
-                                <button onclick="removeFromCollection('{collection.id}', '{html_escape.escape(collection.name)}')" class="text-xs" style="color: var(--nasa-white); background: transparent; border: none; cursor: pointer;" title="Remove from collection">×</button>
-                            </span>''' 
-                                    for collection in workflow.collections) if workflow.collections else '<span class="text-xs" style="color: var(--nasa-gray);">No collections assigned</span>'}
-                        </div>
-                        <button onclick="addToCollections()" class="btn-secondary" style="text-decoration: none; padding: 0.25rem 0.75rem; font-size: 0.75rem;">
-                            📚 Add to Collections
-                        </button>
-                    </div>
-                    
-                    <!-- Client and Project Fields -->
-                    <div class="mb-4">
-                        <h4 class="font-medium mb-2" style="color: var(--nasa-gray);">Project Information:</h4>
-                        <div class="space-y-2">
-                            <div>
-                                <label class="block text-xs font-medium" style="color: var(--nasa-gray);">Client:</label>
-                                <input type="text" id="client-name" placeholder="Enter client name..." 
-                                       class="w-full px-2 py-1 text-xs focus:outline-none"
-                                       style="border: 1px solid var(--nasa-gray); border-radius: 2px; background: var(--nasa-white); color: var(--nasa-dark);"
-                                       value="{html_escape.escape('TODO: Load from database')}">
-                            </div>
-                            <div>
-                                <label class="block text-xs font-medium" style="color: var(--nasa-gray);">Project:</label>
-                                <input type="text" id="project-name" placeholder="Enter project name..." 
-                                       class="w-full px-2 py-1 text-xs focus:outline-none"
-                                       style="border: 1px solid var(--nasa-gray); border-radius: 2px; background: var(--nasa-white); color: var(--nasa-dark);"
-                                       value="{html_escape.escape('TODO: Load from database')}">
-                            </div>
-                            <button onclick="saveProjectInfo()" class="btn-secondary" style="text-decoration: none; padding: 0.25rem 0.75rem; font-size: 0.75rem;">
-                                Save Project Info
-                            </button>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>'''
-    
-    # Generate node details if we have workflow JSON
-    if workflow_json:
-        html_content += generate_nodes_section_html(workflow_json)
-    
-    # Add JavaScript and closing tags
-    html_content += '''
-    </div>
-
-    <!-- Copy Success Toast -->
-    <div id="copyToast" class="fixed top-4 right-4 bg-green-500 text-white px-4 py-2 rounded shadow-lg transform translate-x-full transition-transform duration-300 z-50">
-        <div class="flex items-center gap-2">
-            <span>✓</span>
-            <span>Copied to clipboard!</span>
-        </div>
-    </div>
-
-    <script>
-        // Define workflow ID for JavaScript
-        const workflowId = '{{WORKFLOW_ID_PLACEHOLDER}}';
-        
-        // Copy functionality
-        document.addEventListener('DOMContentLoaded', function() {
-            document.querySelectorAll('.copy-btn').forEach(button => {
-                button.addEventListener('click', function(event) {
-                    let copyText;
-                    let copyMode;
-                    
-                    if (event.shiftKey) {
-                        // SHIFT + Click: Copy full CLI command
-                        copyText = this.getAttribute('data-copy-text');
-                        copyMode = 'command';
-                    } else {
-                        // Normal Click: Copy just the value
-                        copyText = this.getAttribute('data-value') || this.getAttribute('data-copy-text');
-                        copyMode = 'value';
-                    }
-                    
-                    copyToClipboard(copyText, this, copyMode);
-                });
-            });
-            
-            // Hide delete confirmations when clicking outside
-            document.addEventListener('click', function(event) {
-                if (!event.target.closest('.tag-item-wrapper')) {
-                    document.querySelectorAll('.delete-confirm').forEach(confirm => {
-                        confirm.classList.add('hidden');
-                    });
-                }
-            });
-            
-            // Shift key detection for copy buttons hover state
-            document.addEventListener('keydown', function(event) {
-                if (event.key === 'Shift') {
-                    document.querySelectorAll('.copy-btn').forEach(button => {
-                        button.classList.add('shift-hover');
-                    });
-                }
-            });
-            
-            document.addEventListener('keyup', function(event) {
-                if (event.key === 'Shift') {
-                    document.querySelectorAll('.copy-btn').forEach(button => {
-                        button.classList.remove('shift-hover');
-                    });
-                }
-            });
-        });
-
-        function copyToClipboard(text, button, copyMode) {
-            if (navigator.clipboard && navigator.clipboard.writeText) {
-                navigator.clipboard.writeText(text).then(() => {
-                    showCopySuccess(button, copyMode);
-                }).catch((err) => {
-                    console.error('Clipboard API failed:', err);
-                    fallbackCopy(text, button, copyMode);
-                });
-            } else {
-                fallbackCopy(text, button, copyMode);
-            }
-        }
-        
-        function fallbackCopy(text, button, copyMode) {
-            const textArea = document.createElement('textarea');
-            textArea.value = text;
-            textArea.style.position = 'fixed';
-            textArea.style.left = '-999999px';
-            textArea.style.top = '-999999px';
-            document.body.appendChild(textArea);
-            textArea.focus();
-            textArea.select();
-            
-            try {
-                const successful = document.execCommand('copy');
-                if (successful) {
-                    showCopySuccess(button, copyMode);
-                } else {
-                    showCopyError(button);
-                }
-            } catch (err) {
-                console.error('Fallback copy failed:', err);
-                showCopyError(button);
-            }
-            
-            document.body.removeChild(textArea);
-        }
-        
-        function showCopySuccess(button, copyMode) {
-            const originalText = button.innerHTML;
-            const originalClass = button.className;
-            
-            button.innerHTML = '✓';
-            button.className = button.className.replace('bg-gray-200', 'bg-green-500 text-white');
-            
-            // Show toast with different messages based on copy mode
-            const toast = document.getElementById('copyToast');
-            if (toast) {
-                const messageSpan = toast.querySelector('span:last-child');
-                if (copyMode === 'command') {
-                    messageSpan.textContent = 'CLI command copied!';
-                } else if (copyMode === 'value') {
-                    messageSpan.textContent = 'Parameter value copied!';
-                } else {
-                    messageSpan.textContent = 'Copied to clipboard!';
-                }
-                
-                toast.style.transform = 'translateX(0)';
-                setTimeout(() => {
-                    toast.style.transform = 'translateX(100%)';
-                }, 2000);
-            }
-            
-            setTimeout(() => {
-                button.innerHTML = originalText;
-                button.className = originalClass;
-            }, 2000);
-        }
-
-        function showCopyError(button) {
-            const originalText = button.innerHTML;
-            const originalClass = button.className;
-            
-            button.innerHTML = '✗';
-            button.className = button.className.replace('bg-gray-200', 'bg-red-500 text-white');
-            
-            setTimeout(() => {
-                button.innerHTML = originalText;
-                button.className = originalClass;
-            }, 2000);
-        }
-
-        // Save description functionality  
-        async function saveDescription() {
-            const description = document.getElementById('description').value;
-            await updateWorkflowField('description', description, event.target);
-        }
-
-        // Tag management functions
-        function addNewTag() {
-            document.getElementById('add-tag-form').classList.remove('hidden');
-            document.getElementById('new-tag-input').focus();
-        }
-
-        function cancelAddTag() {
-            document.getElementById('add-tag-form').classList.add('hidden');
-            document.getElementById('new-tag-input').value = '';
-        }
-
-        async function saveNewTag() {
-            const tagInput = document.getElementById('new-tag-input');
-            const tagValue = tagInput.value.trim();
-            
-            if (!tagValue) return;
-            
-            try {
-                const response = await fetch(`/api/workflows/${workflowId}/tags`, {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ tag: tagValue })
-                });
-                
-                if (response.ok) {
-                    // Add tag to UI
-                    addTagToUI(tagValue);
-                    cancelAddTag();
-                    showSuccessToast('Tag added successfully');
-                } else {
-                    alert('Failed to add tag');
-                }
-            } catch (error) {
-                console.error('Error adding tag:', error);
-                alert('Error adding tag');
-            }
-        }
-
-        function showDeleteConfirm(button, tagValue) {
-            // Hide any other open confirmations
-            document.querySelectorAll('.delete-confirm').forEach(confirm => {
-                confirm.classList.add('hidden');
-            });
-            
-            // Show confirmation for this tag
-            const tagWrapper = button.closest('.tag-item-wrapper');
-            const confirmDiv = tagWrapper.querySelector('.delete-confirm');
-            confirmDiv.classList.remove('hidden');
-        }
-
-        function cancelDelete(button) {
-            const confirmDiv = button.closest('.delete-confirm');
-            confirmDiv.classList.add('hidden');
-        }
-
-        async function confirmDelete(button, tagValue) {
-            try {
-                const response = await fetch(`/api/workflows/${workflowId}/tags`, {
-                    method: 'DELETE',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ tag: tagValue })
-                });
-                
-                if (response.ok) {
-                    // Remove tag from UI
-                    removeTagFromUI(tagValue);
-                    showSuccessToast('Tag deleted successfully');
-                } else {
-                    alert('Failed to delete tag');
-                }
-            } catch (error) {
-                console.error('Error deleting tag:', error);
-                alert('Error deleting tag');
-            }
-        }
-
-        function editTag(tagElement, originalTag) {
-            const input = document.createElement('input');
-            input.type = 'text';
-            input.value = originalTag;
-            input.className = 'px-1 text-xs border border-gray-300 rounded';
-            input.style.width = Math.max(50, originalTag.length * 8) + 'px';
-            
-            const saveEdit = async () => {
-                const newTag = input.value.trim();
-                if (newTag && newTag !== originalTag) {
-                    try {
-                        const response = await fetch(`/api/workflows/${workflowId}/tags`, {
-                            method: 'PUT',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: JSON.stringify({ oldTag: originalTag, newTag: newTag })
-                        });
-                        
-                        if (response.ok) {
-                            tagElement.textContent = newTag;
-                            tagElement.onclick = () => editTag(tagElement, newTag);
-                            showSuccessToast('Tag updated successfully');
-                        } else {
-                            alert('Failed to update tag');
-                            tagElement.textContent = originalTag;
-                        }
-                    } catch (error) {
-                        console.error('Error updating tag:', error);
-                        alert('Error updating tag');
-                        tagElement.textContent = originalTag;
-                    }
-                } else {
-                    tagElement.textContent = originalTag;
-                }
-                tagElement.style.display = 'inline';
-            };
-            
-            input.addEventListener('blur', saveEdit);
-            input.addEventListener('keypress', (e) => {
-                if (e.key === 'Enter') {
-                    e.preventDefault();
-                    saveEdit();
-                }
-            });
-            
-            tagElement.style.display = 'none';
-            tagElement.parentNode.insertBefore(input, tagElement.nextSibling);
-            input.focus();
-            input.select();
-        }
-
-        // Project info saving
-        async function saveProjectInfo() {
-            const clientName = document.getElementById('client-name').value.trim();
-            const projectName = document.getElementById('project-name').value.trim();
-            
-            try {
-                const response = await fetch(`/api/workflows/${workflowId}`, {
-                    method: 'PUT',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        client_name: clientName,
-                        project_name: projectName
-                    })
-                });
-                
-                if (response.ok) {
-                    showSuccessMessage('Project information saved successfully');
-                } else {
-                    alert('Failed to save project information');
-                }
-            } catch (error) {
-                console.error('Error saving project info:', error);
-                alert('Error saving project information');
-            }
-        }
-
-        // Workflow execution (placeholder)
-        function runWorkflow() {
-            alert('🚀 Workflow execution feature coming soon!\\n\\nThis will integrate with ComfyUI API to run the workflow with current parameters.');
-        }
-
-        // Remove workflow from database
-        async function removeWorkflow() {
-            const workflowName = document.querySelector('h1').textContent;
-            
-            if (!confirm(`Remove "${workflowName}" from the database?\\n\\nThis will delete the catalog entry but preserve all original files.`)) {
-                return;
-            }
-            
-            try {
-                const response = await fetch(`/api/workflows/${workflowId}`, {
-                    method: 'DELETE'
-                });
-                
-                if (response.ok) {
-                    const result = await response.json();
-                    alert(result.message + '\\n\\n' + result.note);
-                    // Redirect to catalog
-                    window.location.href = '/catalog';
-                } else {
-                    const error = await response.json();
-                    alert('Failed to remove workflow: ' + (error.detail || 'Unknown error'));
-                }
-            } catch (error) {
-                console.error('Error removing workflow:', error);
-                alert('Failed to remove workflow: Network error');
-            }
-        }
-
-        // Utility functions
-        async function updateWorkflowField(field, value, button) {
-            try {
-                const response = await fetch(`/api/workflows/${workflowId}`, {
-                    method: 'PUT',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ [field]: value })
-                });
-                
-                if (response.ok) {
-                    showSuccessMessage('Saved successfully', button);
-                } else {
-                    alert(`Failed to save ${field}`);
-                }
-            } catch (error) {
-                console.error(`Error saving ${field}:`, error);
-                alert(`Error saving ${field}`);
-            }
-        }
-
-        function showSuccessMessage(message, button = null) {
-            if (button) {
-                const originalText = button.textContent;
-                const originalClass = button.className;
-                button.textContent = '✓ Saved!';
-                button.className = button.className.replace('bg-blue-500', 'bg-green-500');
-                
-                setTimeout(() => {
-                    button.textContent = originalText;
-                    button.className = originalClass;
-                }, 2000);
-            } else {
-                showSuccessToast(message);
-            }
-        }
-
-        function showSuccessToast(message) {
-            const toast = document.getElementById('copyToast');
-            const messageSpan = toast.querySelector('span:last-child');
-            messageSpan.textContent = message;
-            toast.style.transform = 'translateX(0)';
-            setTimeout(() => {
-                toast.style.transform = 'translateX(100%)';
-            }, 2000);
-        }
-
-        function addTagToUI(tagValue) {
-            const container = document.getElementById('tags-container');
-            const tagHtml = `
-                <span class="tag-item-wrapper relative">
-                    <span class="tag-item bg-gray-200 text-gray-800 px-2 py-1 rounded text-xs flex items-center gap-1 group">
-                        <span class="tag-text cursor-pointer" onclick="editTag(this, '${tagValue.replace(/'/g, "\\'")}')" title="Click to edit">${tagValue}</span>
-                        <button onclick="showDeleteConfirm(this, '${tagValue.replace(/'/g, "\\'")}')" class="text-red-500 hover:text-red-700 opacity-0 group-hover:opacity-100 transition-opacity ml-1" title="Delete tag">×</button>
-                    </span>
-                    <div class="delete-confirm hidden absolute top-full left-0 mt-1 bg-white border border-red-300 rounded-md shadow-lg p-2 z-10 whitespace-nowrap">
-                        <div class="text-xs text-gray-700 mb-2">Delete "${tagValue}"?</div>
-                        <div class="flex gap-1">
-                            <button onclick="confirmDelete(this, '${tagValue.replace(/'/g, "\\'")}')" class="bg-red-500 text-white px-2 py-1 rounded text-xs hover:bg-red-600">Delete</button>
-                            <button onclick="cancelDelete(this)" class="bg-gray-300 text-gray-700 px-2 py-1 rounded text-xs hover:bg-gray-400">Cancel</button>
-                        </div>
-                    </div>
-                </span>
-            `;
-            container.insertAdjacentHTML('beforeend', tagHtml);
-        }
-
-        function removeTagFromUI(tagValue) {
-            const tagWrappers = document.querySelectorAll('.tag-item-wrapper');
-            tagWrappers.forEach(wrapper => {
-                const textSpan = wrapper.querySelector('.tag-text');
-                if (textSpan && textSpan.textContent === tagValue) {
-                    wrapper.remove();
-                }
-            });
-        }
-
-        function openFileLocation(filePath) {
-            if (!filePath) {
-                const toast = document.createElement('div');
-                toast.style.cssText = 'position:fixed;top:20px;right:20px;background:var(--nasa-orange);color:white;padding:8px 16px;border-radius:4px;z-index:1000;font-size:12px;';
-                toast.textContent = 'No file path available';
-                document.body.appendChild(toast);
-                setTimeout(() => document.body.removeChild(toast), 2000);
-                return;
-            }
+# Workflow detail page skeleton, compiled once at import (bytecode cached across restarts); autoescape replaces per-field html.escape calls
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(str(Path(__file__).parent / "templates")),
+    autoescape=True,
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+_WORKFLOW_DETAIL_TEMPLATE = _TEMPLATE_ENV.get_template("workflow_detail.html.j2")
 
-            // Try different methods based on platform/browser
-            if (navigator.platform.indexOf('Mac') !== -1) {
-                // macOS - try to open in Finder
-                fetch('/api/open-file-location', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({ file_path: filePath })
-                }).then(response => {
-                    if (response.ok) {
-                        const toast = document.createElement('div');
-                        toast.style.cssText = 'position:fixed;top:20px;right:20px;background:var(--nasa-blue);color:white;padding:8px 16px;border-radius:4px;z-index:1000;font-size:12px;';
-                        toast.textContent = 'Opening file location...';
-                        document.body.appendChild(toast);
-                        setTimeout(() => document.body.removeChild(toast), 2000);
-                    } else {
-                        throw new Error('Failed to open file location');
-                    }
-                }).catch(error => {
-                    // Fallback: copy path to clipboard
-                    copyToClipboard(filePath);
-                    const toast = document.createElement('div');
-                    toast.style.cssText = 'position:fixed;top:20px;right:20px;background:var(--nasa-orange);color:white;padding:8px 16px;border-radius:4px;z-index:1000;font-size:12px;';
-                    toast.textContent = 'Could not open location, path copied instead';
-                    document.body.appendChild(toast);
-                    setTimeout(() => document.body.removeChild(toast), 3000);
-                });
-            } else {
-                // For other platforms, just copy to clipboard for now
-                copyToClipboard(filePath);
-                const toast = document.createElement('div');
-                toast.style.cssText = 'position:fixed;top:20px;right:20px;background:var(--nasa-blue);color:white;padding:8px 16px;border-radius:4px;z-index:1000;font-size:12px;';
-                toast.textContent = 'File path copied to clipboard';
-                document.body.appendChild(toast);
-                setTimeout(() => document.body.removeChild(toast), 2000);
-            }
-        }
+# CSS/JS shared by every detail page, served once and cached by the browser
+STATIC_DIR = Path(__file__).parent / "static"
 
-        function addToCollections() {
-            const workflowId = '{{WORKFLOW_ID_PLACEHOLDER}}';
-            // Open collection picker for this single workflow
-            openCollectionPicker([workflowId]);
-        }
+def _static_version() -> str:
+    """Short content hash of the static assets; changes the asset URLs whenever a file changes."""
+    digest = hashlib.sha1()
+    for path in sorted(STATIC_DIR.iterdir()):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
 
-        async function removeFromCollection(collectionId, collectionName) {
-            if (!confirm(`Remove this workflow from collection "${collectionName}"?`)) {
-                return;
-            }
-            
-            const workflowId = '{{WORKFLOW_ID_PLACEHOLDER}}';
-            
-            try {
-                // Get current collections for this workflow
-                const response = await fetch(`/api/workflows/${workflowId}`);
-                if (!response.ok) throw new Error('Failed to fetch workflow');
-                
-                const workflow = await response.json();
-                const currentCollectionIds = workflow.collections?.map(c => c.id) || [];
-                
-                // Remove the specified collection
-                const updatedCollectionIds = currentCollectionIds.filter(id => id !== collectionId);
-                
-                // Update workflow collections
-                const updateResponse = await fetch(`/api/workflows/${workflowId}/collections`, {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ collection_ids: updatedCollectionIds })
-                });
-                
-                if (!updateResponse.ok) throw new Error('Failed to update collections');
-                
-                // Reload page to show updated collections
-                location.reload();
-                
-            } catch (error) {
-                console.error('Error removing from collection:', error);
-                alert('Failed to remove from collection');
-            }
-        }
+_TEMPLATE_ENV.globals["static_version"] = _static_version()
 
-        // Collection Picker Functions (same as catalog page)
-        let collectionPickerWorkflows = [];
+def generate_workflow_detail_html(workflow, workflow_json, checkpoints, loras):
+    """Generate detailed HTML page for a workflow with rich editing features."""
+    # Tags come from the proper Tag relationship (preferred)
+    tags = [tag.name for tag in workflow.tags or ()]
+    
+    # Legacy style_tags JSON field is only parsed when no proper tags exist (migrated workflows supersede it)
+    if not tags and workflow.style_tags:
+        try:
+            if isinstance(workflow.style_tags, (str, bytes)):
+                tags = list(_loads(workflow.style_tags))
+            else:
+                tags = list(workflow.style_tags)
+        except Exception:
+            pass
+    
+    # Add checkpoint and lora tags (but only if not already present)
+    seen_tags = set(tags)
+    for checkpoint in checkpoints:
+        checkpoint_tag = f"checkpoint:{checkpoint}"
+        if checkpoint_tag not in seen_tags:
+            seen_tags.add(checkpoint_tag)
+            tags.append(checkpoint_tag)
+    for lora in loras:
+        lora_tag = f"lora:{lora}"
+        if lora_tag not in seen_tags:
+            seen_tags.add(lora_tag)
+            tags.append(lora_tag)
+    
+    # Format file size
+    file_size_str = f"{workflow.file_size / 1024:.1f} KB" if workflow.file_size else "Unknown"
+    
+    # Format dates and escape the filename once; the template uses them in several places
+    file_date = workflow.file_modified_at.strftime("%Y-%m-%d %H:%M") if workflow.file_modified_at else "Unknown"
+    ingested_date = workflow.created_at.strftime("%Y-%m-%d %H:%M") if workflow.created_at else "Unknown"
+    filename = Markup.escape(workflow.filename) if workflow.filename else ""
+    
+    # Check if has image
+    has_image = (workflow.image_width is not None and workflow.image_height is not None) or (
+        workflow.filename and workflow.filename.lower().endswith(('.png', '.jpg', '.jpeg', '.webp'))
+    )
+    
+    nodes_html = Markup(_cached_nodes_section_html(workflow_json)) if workflow_json else ""
+    
+    return _WORKFLOW_DETAIL_TEMPLATE.render(
+        workflow=workflow,
+        checkpoints=checkpoints,
+        loras=loras,
+        tags=tags,
+        file_size_str=file_size_str,
+        file_date=file_date,
+        ingested_date=ingested_date,
+        filename=filename,
+        has_image=has_image,
+        nodes_html=nodes_html,
+    )
 
-        function openCollectionPicker(workflowIds) {
-            collectionPickerWorkflows = workflowIds;
-            
-            // Create modal if it doesn't exist
-            if (!document.getElementById('collection-picker-modal')) {
-                const modal = document.createElement('div');
-                modal.id = 'collection-picker-modal';
-                modal.className = 'fixed inset-0 z-50 hidden';
-                modal.innerHTML = `
-                    <div class="fixed inset-0 bg-black bg-opacity-50" onclick="closeCollectionPicker()"></div>
-                    <div class="fixed top-1/2 left-1/2 transform -translate-x-1/2 -translate-y-1/2 w-full max-w-lg">
-                        <div class="confirmation-dialog p-6 m-4">
-                            <div class="flex justify-between items-center mb-4">
-                                <h2 class="text-xl font-bold" style="color: var(--nasa-dark);">📚 ADD TO COLLECTIONS</h2>
-                                <button onclick="closeCollectionPicker()" class="text-gray-500 hover:text-gray-700 text-2xl">&times;</button>
-                            </div>
-                            
-                            <div class="mb-4 p-3 border border-gray-200 rounded" style="border-color: var(--nasa-gray);">
-                                <div class="flex space-x-2">
-                                    <input type="text" id="quick-collection-name" class="search-input flex-1" placeholder="Create new collection...">
-                                    <button onclick="createQuickCollection()" class="btn-primary" style="padding: 0.5rem;">➕</button>
-                                </div>
-                            </div>
-                            
-                            <div class="mb-4">
-                                <div id="collection-picker-list" class="space-y-2 max-h-60 overflow-y-auto">
-                                    <!-- Collections will be loaded here -->
-                                </div>
-                            </div>
-                            
-                            <div class="flex justify-end space-x-2">
-                                <button onclick="closeCollectionPicker()" class="btn-secondary">Cancel</button>
-                                <button onclick="saveCollectionAssignments()" class="btn-primary">Save</button>
-                            </div>
-                        </div>
-                    </div>
-                `;
-                document.body.appendChild(modal);
-            }
-            
-            document.getElementById('collection-picker-modal').classList.remove('hidden');
-            loadCollectionPickerList();
-        }
 
-        function closeCollectionPicker() {
-            const modal = document.getElementById('collection-picker-modal');
-            if (modal) {
-                modal.classList.add('hidden');
-                const quickName = document.getElementById('quick-collection-name');
-                if (quickName) quickName.value = '';
-            }
-            collectionPickerWorkflows = [];
-        }
+# Rendered nodes sections by workflow content hash; tag and notes edits re-render the page but not this
+_NODES_SECTION_CACHE: Dict[bytes, str] = {}
+NODES_SECTION_CACHE_MAX_ENTRIES = 256
 
-        async function loadCollectionPickerList() {
-            try {
-                const response = await fetch('/api/collections');
-                if (!response.ok) return;
-                
-                const data = await response.json();
-                const collections = data.collections || [];
-                
-                const container = document.getElementById('collection-picker-list');
-                if (!container) return;
-                
-                container.innerHTML = '';
-                
-                if (collections.length === 0) {
-                    container.innerHTML = '<p class="filter-label text-center py-4">No collections yet. Create one above.</p>';
-                    return;
-                }
-                
-                collections.forEach(collection => {
-                    const item = document.createElement('div');
-                    item.className = 'collection-picker-item';
-                    item.setAttribute('data-collection-id', collection.id);
-                    
-                    item.innerHTML = `
-                        <div class="collection-color-dot" style="background-color: ${collection.color || '#105bd8'}"></div>
-                        <div class="flex-1">
-                            <div class="filter-label">${collection.name}</div>
-                            ${collection.description ? `<div class="text-xs" style="color: var(--nasa-gray);">${collection.description}</div>` : ''}
-                        </div>
-                        <div class="text-xs" style="color: var(--nasa-gray);">${collection.file_count || 0} workflows</div>
-                    `;
-                    
-                    item.addEventListener('click', function() {
-                        item.classList.toggle('selected');
-                    });
-                    
-                    container.appendChild(item);
-                });
-                
-            } catch (error) {
-                console.error('Error loading collections:', error);
-            }
-        }
+# Parsed workflows by the same digest, so opening a node's parameters needs no query or re-parse
+_PARSED_WORKFLOW_CACHE: Dict[bytes, dict] = {}
 
-        async function createQuickCollection() {
-            const nameInput = document.getElementById('quick-collection-name');
-            if (!nameInput) return;
-            
-            const name = nameInput.value.trim();
-            if (!name) return;
-            
-            try {
-                const response = await fetch('/api/collections', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ 
-                        name: name,
-                        description: '',
-                        color: '#105bd8'
-                    })
-                });
-                
-                if (!response.ok) {
-                    const error = await response.json();
-                    alert(error.detail || 'Failed to create collection');
-                    return;
-                }
-                
-                nameInput.value = '';
-                await loadCollectionPickerList();
-                
-            } catch (error) {
-                console.error('Error creating collection:', error);
-                alert('Failed to create collection');
-            }
-        }
+def _workflow_digest(workflow_json) -> bytes:
+    """Content hash of a parsed workflow, keeping its key order (it decides the rendered order)."""
+    data = None
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(workflow_json)
+        except TypeError:  # e.g. integers beyond 64 bits
+            pass
+    if data is None:
+        data = json.dumps(workflow_json).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def _cached_nodes_section_html(workflow_json) -> str:
+    """generate_nodes_section_html, reusing the last render of identical workflow content."""
+    digest = _workflow_digest(workflow_json)
+    _remember_parsed_workflow(digest, workflow_json)
+    html = _NODES_SECTION_CACHE.get(digest)
+    if html is None:
+        html = generate_nodes_section_html(workflow_json, digest.hex())
+        if len(_NODES_SECTION_CACHE) >= NODES_SECTION_CACHE_MAX_ENTRIES:
+            del _NODES_SECTION_CACHE[next(iter(_NODES_SECTION_CACHE))]
+        _NODES_SECTION_CACHE[digest] = html
+    return html
 
-        async function saveCollectionAssignments() {
-            const selectedCollectionIds = Array.from(
-                document.querySelectorAll('.collection-picker-item.selected')
-            ).map(item => item.getAttribute('data-collection-id'));
-            
-            if (collectionPickerWorkflows.length === 0) {
-                closeCollectionPicker();
-                return;
-            }
-            
-            try {
-                for (const workflowId of collectionPickerWorkflows) {
-                    const response = await fetch(`/api/workflows/${workflowId}/collections`, {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ collection_ids: selectedCollectionIds })
-                    });
-                    
-                    if (!response.ok) {
-                        console.error(`Failed to update workflow ${workflowId}`);
-                    }
-                }
-                
-                closeCollectionPicker();
-                
-                // Reload page to show updated collections
-                location.reload();
-                
-            } catch (error) {
-                console.error('Error saving collection assignments:', error);
-                alert('Failed to update collections');
-            }
-        }
-    </script>
-</body>
-</html>'''
+def _remember_parsed_workflow(digest: bytes, workflow_json) -> None:
+    """Keep a parsed workflow for get_node_params_html, bounded like the nodes section cache."""
+    _PARSED_WORKFLOW_CACHE.pop(digest, None)
+    if len(_PARSED_WORKFLOW_CACHE) >= NODES_SECTION_CACHE_MAX_ENTRIES:
+        del _PARSED_WORKFLOW_CACHE[next(iter(_PARSED_WORKFLOW_CACHE))]
+    _PARSED_WORKFLOW_CACHE[digest] = workflow_json
+
+_DROPDOWN_HINT_HTML = ' <span class="text-xs text-orange-600 cursor-help" title="Dropdown parameter - values depend on installed models">⚠️</span>'
+_OPTIONS_HINT_HTML = ' <span class="text-xs text-orange-600 cursor-help" title="Parameter likely has predefined options">⚠️</span>'
+
+def generate_node_params_html(node_id, node_data):
+    """Generate one node's "All parameters & CLI commands" rows, loaded when its <details> is opened."""
+    connections = []
+    params = []
+    for param_name, param_value in node_data.get("inputs", {}).items():
+        if _is_connection(param_value):
+            connections.append((param_name, param_value))
+        else:
+            params.append((param_name, param_value))
     
-    # Replace the workflow ID placeholder
-    html_content = html_content.replace('{{WORKFLOW_ID_PLACEHOLDER}}', workflow.id)
+    parts = []
     
-    return html_content
-
+    # Add all parameters with copy functionality
+    for param_name, param_value in params:
+        if isinstance(param_value, (str, int, float, bool)):
+            full_value_str = str(param_value)
+            
+            # Escape values for HTML attributes; short values display as-is
+            escaped_value = html_escape.escape(full_value_str)
+            if len(full_value_str) > 30:
+                escaped_display = html_escape.escape(full_value_str[:27] + "...")
+            else:
+                escaped_display = escaped_value
+            copy_command = f'--node {node_id} --param {param_name} "{full_value_str}"'
+            escaped_copy_command = html_escape.escape(copy_command)
+            
+            # Parameter type hints
+            dropdown_hint = ""
+            if param_name in _KNOWN_DROPDOWNS:
+                dropdown_hint = _DROPDOWN_HINT_HTML
+            elif param_name.endswith(_HINT_SUFFIXES):
+                dropdown_hint = _OPTIONS_HINT_HTML
+            
+            copy_id = f"copy_{node_id}_{param_name.replace(' ', '_')}"
+            parts.append(f'''
+                    <div class="bg-gray-50 p-2 rounded">
+                        <div class="flex justify-between items-center">
+                            <span class="font-medium">{html_escape.escape(param_name)}:</span>
+                            <div class="flex items-center gap-1">
+                                <span class="text-gray-600 break-all" title="{escaped_value}">{escaped_display}</span>{dropdown_hint}
+                                <button class="copy-btn ml-1" 
+                                        data-copy-text="{escaped_copy_command}"
+                                        data-value="{escaped_value}"
+                                        id="{copy_id}"
+                                        title="Copy value (SHIFT+Click for CLI command)"
+                                        aria-label="Copy parameter value or command">
+                                    CPY
+                                </button>
+                            </div>
+                        </div>
+                    </div>
+            ''')
+    
+    # Add connection parameters
+    for param_name, param_value in connections:
+        source_node, output_index = param_value
+        parts.append(f'''
+                    <div class="bg-blue-50 p-2 rounded">
+                        <div class="flex justify-between">
+                            <span class="text-blue-700 font-medium">{html_escape.escape(param_name)}:</span>
+                            <span class="text-blue-600">→ Node {source_node}[{output_index}]</span>
+                        </div>
+                    </div>
+        ''')
+    
+    return "".join(parts)
 
-def generate_nodes_section_html(workflow_json):
-    """Generate the detailed nodes analysis section HTML."""
-    import html as html_escape
+def generate_nodes_section_html(workflow_json, digest: str = ""):
+    """Generate the detailed nodes analysis section HTML.
     
+    digest (hex, from _workflow_digest) lets the page ask for parameter rows of this exact content.
+    """
     if not workflow_json:
         return '<div class="neo-brutalist-card p-6"><p style="color: var(--nasa-gray);">No workflow data available.</p></div>'
     
     # Sort nodes by ID for consistent display
-    sorted_nodes = sorted(workflow_json.keys(), key=lambda x: int(x) if x.isdigit() else float('inf'))
+    sorted_nodes = _sorted_node_ids(workflow_json)
     
-    html = '''
+    parts = [f'''
         <!-- Node Analysis -->
-        <div class="neo-brutalist-card p-6 mb-8">
+        <div class="neo-brutalist-card p-6 mb-8" data-workflow-digest="{digest}">
             <h2 class="text-xl font-semibold mb-6" style="color: var(--nasa-dark);">Node Analysis</h2>
             <div class="grid grid-cols-1 lg:grid-cols-2 gap-6">
-    '''
+    ''']
     
     for node_id in sorted_nodes:
         node_data = workflow_json[node_id]
@@ -1149,15 +282,17 @@ def generate_nodes_section_html(workflow_json):
         key_params = []
         
         for param_name, param_value in inputs.items():
-            if isinstance(param_value, list) and len(param_value) == 2:
+            if _is_connection(param_value):
                 connections.append((param_name, param_value))
             else:
                 params.append((param_name, param_value))
-                # Mark key parameters (shorter values, commonly modified)
-                if isinstance(param_value, (int, float, str)) and len(str(param_value)) <= 20:
-                    key_params.append((param_name, param_value))
+                # Mark key parameters (shorter values, commonly modified); only the first 3 are shown
+                if len(key_params) < 3 and isinstance(param_value, (int, float, str)):
+                    value_str = str(param_value)
+                    if len(value_str) <= 20:
+                        key_params.append((param_name, value_str))
         
-        html += f'''
+        parts.append(f'''
             <div class="node-card p-4">
                 <div class="flex items-center gap-2 mb-3">
                     <div>
@@ -1171,92 +306,33 @@ def generate_nodes_section_html(workflow_json):
                 <div class="text-xs mb-3" style="color: var(--nasa-gray);">
                     {len(connections)} inputs • {len(params)} params
                 </div>
-        '''
+        ''')
         
         # Show key parameters
         if key_params:
-            html += '<div class="neo-brutalist-card p-2 text-xs mb-3" style="border: 1px solid var(--nasa-gray);"><div class="font-medium mb-1" style="color: var(--nasa-dark);">Key Parameters:</div>'
-            for param_name, param_value in key_params[:3]:  # Show first 3
-                value_str = str(param_value)
-                if len(value_str) > 20:
-                    value_str = value_str[:17] + "..."
-                html += f'<div style="color: var(--nasa-dark);">{html_escape.escape(param_name)}: {html_escape.escape(value_str)}</div>'
-            html += '</div>'
-        
-        # Expandable all parameters section
-        html += '''
-                <details class="mt-3">
+            parts.append('<div class="neo-brutalist-card p-2 text-xs mb-3" style="border: 1px solid var(--nasa-gray);"><div class="font-medium mb-1" style="color: var(--nasa-dark);">Key Parameters:</div>')
+            for param_name, value_str in key_params:
+                parts.append(f'<div style="color: var(--nasa-dark);">{html_escape.escape(param_name)}: {html_escape.escape(value_str)}</div>')
+            parts.append('</div>')
+        
+        # Expandable all parameters section; rows are fetched on first open (generate_node_params_html)
+        parts.append(f'''
+                <details class="mt-3" data-node-id="{html_escape.escape(node_id)}">
                     <summary class="text-xs cursor-pointer" style="color: var(--nasa-gray);">All parameters & CLI commands</summary>
-                    <div class="mt-2 text-xs space-y-1">
-        '''
-        
-        # Add all parameters with copy functionality
-        for param_name, param_value in params:
-            if isinstance(param_value, (str, int, float, bool)):
-                value_str = str(param_value)
-                full_value_str = value_str
-                if len(value_str) > 30:
-                    value_str = value_str[:27] + "..."
-                
-                # Escape values for HTML attributes
-                escaped_value = html_escape.escape(str(full_value_str))
-                copy_command = f'--node {node_id} --param {param_name} "{full_value_str}"'
-                escaped_copy_command = html_escape.escape(copy_command)
-                
-                # Parameter type hints
-                dropdown_hint = ""
-                if param_name.endswith('_name') and param_name in ['sampler_name', 'scheduler', 'model_name', 'vae_name', 'lora_name']:
-                    dropdown_hint = ' <span class="text-xs text-orange-600 cursor-help" title="Dropdown parameter - values depend on installed models">⚠️</span>'
-                elif param_name.endswith(('_mode', '_method', '_type')):
-                    dropdown_hint = ' <span class="text-xs text-orange-600 cursor-help" title="Parameter likely has predefined options">⚠️</span>'
-                
-                copy_id = f"copy_{node_id}_{param_name.replace(' ', '_')}"
-                html += f'''
-                        <div class="bg-gray-50 p-2 rounded">
-                            <div class="flex justify-between items-center">
-                                <span class="font-medium">{html_escape.escape(param_name)}:</span>
-                                <div class="flex items-center gap-1">
-                                    <span class="text-gray-600 break-all" title="{escaped_value}">{html_escape.escape(value_str)}</span>{dropdown_hint}
-                                    <button class="copy-btn ml-1" 
-                                            data-copy-text="{escaped_copy_command}"
-                                            data-value="{escaped_value}"
-                                            id="{copy_id}"
-                                            title="Copy value (SHIFT+Click for CLI command)"
-                                            aria-label="Copy parameter value or command">
-                                        CPY
-                                    </button>
-                                </div>
-                            </div>
-                        </div>
-                '''
-        
-        # Add connection parameters
-        for param_name, param_value in connections:
-            source_node, output_index = param_value
-            html += f'''
-                        <div class="bg-blue-50 p-2 rounded">
-                            <div class="flex justify-between">
-                                <span class="text-blue-700 font-medium">{html_escape.escape(param_name)}:</span>
-                                <span class="text-blue-600">→ Node {source_node}[{output_index}]</span>
-                            </div>
-                        </div>
-            '''
-        
-        html += '''
-                    </div>
+                    <div class="mt-2 text-xs space-y-1 params-slot"></div>
                 </details>
             </div>
-        '''
+        ''')
     
     # Add command line reference
-    html += f'''
+    parts.append(f'''
             </div>
             
             <!-- Command Line Reference -->
             <div class="mt-8 p-6 bg-blue-50 rounded-lg">
                 <h3 class="text-xl font-semibold mb-4" style="color: var(--nasa-dark);">Command Line Reference</h3>
                 
-    '''
+    ''')
     
     # Show example commands for first few nodes
     for node_id in sorted_nodes[:6]:
@@ -1265,26 +341,26 @@ def generate_nodes_section_html(workflow_json):
         inputs = node_data.get("inputs", {})
         
         # Get non-connection parameters
-        params = [k for k, v in inputs.items() if not (isinstance(v, list) and len(v) == 2)]
+        params = [k for k, v in inputs.items() if not _is_connection(v)]
         
         if params:
             first_param = params[0]
-            html += f'''
+            parts.append(f'''
                 <div class="bg-white p-3 rounded shadow-sm">
                     <div class="text-gray-900 font-bold mb-1">Node {node_id}</div>
                     <div class="text-blue-600 text-xs">--node {node_id} --param {first_param} value</div>
                     <div class="text-xs text-gray-500 mt-1">{html_escape.escape(class_type)}</div>
                     <div class="text-xs text-gray-400 mt-1">Params: {", ".join(params[:3])}</div>
                 </div>
-            '''
+            ''')
     
-    html += '''
+    parts.append('''
                 </div>
             </div>
         </div>
-    '''
+    ''')
     
-    return html
+    return "".join(parts)
 
 app = FastAPI(
     title="Comfy Light Table",
@@ -1321,12 +397,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress HTML/JSON responses; detail pages and catalogs are repetitive markup
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount static files (for generated catalogs)
 import os
 catalogs_dir = Path("./catalogs")
 if catalogs_dir.exists():
     app.mount("/catalogs", StaticFiles(directory="catalogs"), name="catalogs")
 
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+
+@app.middleware("http")
+async def cache_static_assets(request: Request, call_next):
+    """Mark versioned /static/ responses immutable; a content change gives them a new ?v= URL."""
+    response = await call_next(request)
+    if request.url.path.startswith("/static/") and "v" in request.query_params and response.status_code == 200:
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+# Rendered workflow detail pages by workflow id, in LRU order: (_detail_page_key, html, etag)
+_DETAIL_PAGE_CACHE: Dict[str, tuple] = {}
+DETAIL_PAGE_CACHE_MAX_ENTRIES = 256
+
 # Global state for managing processing tasks
 processing_tasks: Dict[str, Dict] = {}
 connected_clients: List[WebSocket] = []
@@ -1735,7 +828,7 @@ async def process_file_async(task_id: str, file_path: Path):
             "analysis": {
                 "total_nodes": analysis["total_nodes"],
                 "node_types": len(analysis["node_types"]),
-                "connections": len(analysis["connections"]),
+                "connections": analysis["connections_count"],
                 "input_nodes": len(analysis["input_nodes"]),
                 "output_nodes": len(analysis["output_nodes"])
             }
@@ -1893,7 +986,7 @@ async def process_file_path_async(task_id: str, file_path: Path):
             "analysis": {
                 "total_nodes": analysis["total_nodes"],
                 "node_types": len(analysis["node_types"]),
-                "connections": len(analysis["connections"]),
+                "connections": analysis["connections_count"],
                 "input_nodes": len(analysis["input_nodes"]),
                 "output_nodes": len(analysis["output_nodes"])
             }
@@ -2343,8 +1436,64 @@ async def get_workflow_detail(workflow_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _parse_workflow_data(workflow, workflow_id: str):
+    """Return a stored workflow's JSON as a dict, or None if it is missing or unparseable."""
+    if workflow.workflow_data:
+        try:
+            if isinstance(workflow.workflow_data, (str, bytes)):
+                return _loads(workflow.workflow_data)
+            return workflow.workflow_data
+        except Exception as e:
+            logger.error(f"Error parsing workflow JSON for {workflow_id}: {e}")
+    return None
+
+def _render_workflow_detail_page(workflow, workflow_id: str) -> str:
+    """Parse a stored workflow and render its detail page."""
+    workflow_json = _parse_workflow_data(workflow, workflow_id)
+
+    # Extract checkpoints and LoRAs
+    checkpoints = []
+    loras = []
+    if workflow_json:
+        for node_id, node in workflow_json.items():
+            if isinstance(node, dict) and "inputs" in node:
+                inputs = node.get("inputs", {})
+                class_type = node.get("class_type", "")
+
+                # Extract checkpoints
+                if class_type in ["CheckpointLoaderSimple", "CheckpointLoader"]:
+                    if "ckpt_name" in inputs:
+                        checkpoints.append(inputs["ckpt_name"])
+                elif class_type in ["UnetLoaderGGUF", "UNETLoader"]:
+                    if "input_0" in inputs:
+                        checkpoints.append(inputs["input_0"])
+
+                # Extract LoRAs
+                elif class_type in ["LoraLoader", "LoRALoader"]:
+                    if "lora_name" in inputs:
+                        loras.append(inputs["lora_name"])
+                elif class_type == "Power Lora Loader (rgthree)":
+                    if "input_2" in inputs and isinstance(inputs["input_2"], dict):
+                        lora_config = inputs["input_2"]
+                        if "lora" in lora_config and lora_config.get("on", True):
+                            loras.append(lora_config["lora"])
+
+    # Generate the HTML page
+    return generate_workflow_detail_html(workflow, workflow_json, checkpoints, loras)
+
+
+def _detail_page_key(workflow) -> tuple:
+    """What a rendered detail page depends on; tag and collection links do not bump updated_at."""
+    return (
+        workflow.updated_at,
+        workflow.file_hash,
+        tuple(tag.name for tag in workflow.tags),
+        tuple((collection.id, collection.name) for collection in workflow.collections),
+    )
+
+
 @app.get("/workflows/{workflow_id}")
-async def get_workflow_detail_html(workflow_id: str):
+async def get_workflow_detail_html(workflow_id: str, request: Request):
     """Get workflow detail as HTML page with rich editing features."""
     if not DATABASE_AVAILABLE:
         raise HTTPException(status_code=503, detail="Database not available")
@@ -2352,54 +1501,36 @@ async def get_workflow_detail_html(workflow_id: str):
     try:
         db_manager = get_database_manager()
         with db_manager.get_session() as session:
-            workflow = session.query(WorkflowFile).filter(WorkflowFile.id == workflow_id).first()
+            # Tags and collections are needed for the cache key and the page; load them in the same query
+            workflow = (
+                session.query(WorkflowFile)
+                .options(joinedload(WorkflowFile.tags), joinedload(WorkflowFile.collections))
+                .filter(WorkflowFile.id == workflow_id)
+                .first()
+            )
             
             if not workflow:
                 raise HTTPException(status_code=404, detail="Workflow not found")
             
-            # Get workflow JSON
-            workflow_json = None
-            if workflow.workflow_data:
-                try:
-                    if isinstance(workflow.workflow_data, str):
-                        workflow_json = json.loads(workflow.workflow_data)
-                    else:
-                        workflow_json = workflow.workflow_data
-                except Exception as e:
-                    logger.error(f"Error parsing workflow JSON for {workflow_id}: {e}")
-            
-            # Extract checkpoints and LoRAs
-            checkpoints = []
-            loras = []
-            if workflow_json:
-                for node_id, node in workflow_json.items():
-                    if isinstance(node, dict) and "inputs" in node:
-                        inputs = node.get("inputs", {})
-                        class_type = node.get("class_type", "")
-                        
-                        # Extract checkpoints
-                        if class_type in ["CheckpointLoaderSimple", "CheckpointLoader"]:
-                            if "ckpt_name" in inputs:
-                                checkpoints.append(inputs["ckpt_name"])
-                        elif class_type in ["UnetLoaderGGUF", "UNETLoader"]:
-                            if "input_0" in inputs:
-                                checkpoints.append(inputs["input_0"])
-                        
-                        # Extract LoRAs
-                        elif class_type in ["LoraLoader", "LoRALoader"]:
-                            if "lora_name" in inputs:
-                                loras.append(inputs["lora_name"])
-                        elif class_type == "Power Lora Loader (rgthree)":
-                            if "input_2" in inputs and isinstance(inputs["input_2"], dict):
-                                lora_config = inputs["input_2"]
-                                if "lora" in lora_config and lora_config.get("on", True):
-                                    loras.append(lora_config["lora"])
-            
-            # Generate the HTML page
-            html_content = generate_workflow_detail_html(workflow, workflow_json, checkpoints, loras)
-            
-            from fastapi.responses import HTMLResponse
-            return HTMLResponse(content=html_content)
+            # Reuse the rendered page unless something it shows has changed
+            key = _detail_page_key(workflow)
+            cached = _DETAIL_PAGE_CACHE.get(workflow_id)
+            if cached is None or cached[0] != key:
+                html_content = _render_workflow_detail_page(workflow, workflow_id)
+                etag = f'W/"{hashlib.blake2b(html_content.encode(), digest_size=16).hexdigest()}"'
+                _DETAIL_PAGE_CACHE.pop(workflow_id, None)
+                if len(_DETAIL_PAGE_CACHE) >= DETAIL_PAGE_CACHE_MAX_ENTRIES:
+                    del _DETAIL_PAGE_CACHE[next(iter(_DETAIL_PAGE_CACHE))]
+                cached = _DETAIL_PAGE_CACHE[workflow_id] = (key, html_content, etag)
+            else:
+                # Move the hit to the end so eviction drops the least recently used page
+                _DETAIL_PAGE_CACHE[workflow_id] = _DETAIL_PAGE_CACHE.pop(workflow_id)
+            
+            _, html_content, etag = cached
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if etag in request.headers.get("if-none-match", ""):
+                return Response(status_code=304, headers=headers)
+            return HTMLResponse(content=html_content, headers=headers)
             
     except HTTPException:
         raise
@@ -2408,6 +1539,46 @@ async def get_workflow_detail_html(workflow_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/workflows/{workflow_id}/nodes/{node_id}/params-html")
+async def get_node_params_html(workflow_id: str, node_id: str, v: str = ""):
+    """Get one node's parameter rows for the detail page, fetched when its <details> is opened.
+    
+    v is the workflow digest the page was rendered from; while that workflow is
+    cached in memory no query or parse is needed.
+    """
+    try:
+        workflow_json = _PARSED_WORKFLOW_CACHE.get(bytes.fromhex(v))
+    except ValueError:
+        workflow_json = None
+    
+    try:
+        if workflow_json is None:
+            if not DATABASE_AVAILABLE:
+                raise HTTPException(status_code=503, detail="Database not available")
+            
+            db_manager = get_database_manager()
+            with db_manager.get_session() as session:
+                workflow = session.query(WorkflowFile).filter(WorkflowFile.id == workflow_id).first()
+                if not workflow:
+                    raise HTTPException(status_code=404, detail="Workflow not found")
+                
+                workflow_json = _parse_workflow_data(workflow, workflow_id) or {}
+                if workflow_json:
+                    _remember_parsed_workflow(_workflow_digest(workflow_json), workflow_json)
+        
+        node_data = workflow_json.get(node_id)
+        if not isinstance(node_data, dict):
+            raise HTTPException(status_code=404, detail="Node not found")
+        
+        return HTMLResponse(content=generate_node_params_html(node_id, node_data))
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating parameters for node {node_id} of {workflow_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.put("/api/workflows/{workflow_id}")
 async def update_workflow_metadata(workflow_id: str, request: dict):
     """Update workflow metadata (description, tags, etc.)."""
@@ -2545,6 +1716,7 @@ async def delete_workflow(workflow_id: str):
             # Delete the workflow record (cascading will handle relationships)
             session.delete(workflow)
             session.commit()
+            _DETAIL_PAGE_CACHE.pop(workflow_id, None)
             
             return {
                 "success": True, 
@@ -3177,6 +2349,76 @@ async def assign_workflow_to_collection(workflow_id: str, request: Request):
         raise HTTPException(status_code=500, detail="Failed to assign collections")
 
 
+@app.delete("/api/workflows/{workflow_id}/collections/{collection_id}")
+async def remove_workflow_from_collection(workflow_id: str, collection_id: str):
+    """Remove one workflow from one collection with a single DELETE on the link table."""
+    if not DATABASE_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Database not available")
+    
+    try:
+        db_manager = get_database_manager()
+        with db_manager.get_session() as session:
+            result = session.execute(
+                file_collections.delete().where(
+                    (file_collections.c.file_id == workflow_id)
+                    & (file_collections.c.collection_id == collection_id)
+                )
+            )
+            if result.rowcount == 0:
+                raise HTTPException(status_code=404, detail="Workflow is not in that collection")
+            session.commit()
+            
+            return {"success": True}
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error removing workflow {workflow_id} from collection {collection_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to remove from collection")
+
+
+@app.post("/api/workflows/collections/bulk")
+async def assign_workflows_to_collections(request: Request):
+    """Assign the same collections to many workflows in one transaction."""
+    if not DATABASE_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Database not available")
+    
+    try:
+        data = await request.json()
+        workflow_ids = data.get("workflow_ids", [])
+        collection_ids = data.get("collection_ids", [])
+        
+        db_manager = get_database_manager()
+        with db_manager.get_session() as session:
+            workflows = (
+                session.query(WorkflowFile)
+                .options(joinedload(WorkflowFile.collections))
+                .filter(WorkflowFile.id.in_(workflow_ids))
+                .all()
+            )
+            collections = session.query(Collection).filter(Collection.id.in_(collection_ids)).all() if collection_ids else []
+            
+            # Same replace semantics as the single-workflow endpoint
+            for workflow in workflows:
+                workflow.collections = list(collections)
+            
+            session.commit()
+            
+            found_ids = {workflow.id for workflow in workflows}
+            return {
+                "success": True,
+                "updated": len(workflows),
+                "missing": [workflow_id for workflow_id in workflow_ids if workflow_id not in found_ids],
+                "collections": [{"id": collection.id, "name": collection.name} for collection in collections]
+            }
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error bulk-assigning workflows to collections: {e}")
+        raise HTTPException(status_code=500, detail="Failed to assign collections")
+
+
 # Temporarily disabled until schema sync is fixed
 # @app.get("/api/clients")
 # async def get_clients():
@@ -4008,6 +3250,28 @@ async def catalog_page():
             };
             let hasMore = true;
 
+            // Share identical in-flight GETs and reuse recent responses for a short TTL
+            const _inflightRequests = new Map();
+            const _responseCache = new Map();
+
+            function fetchCached(url, ttl = 5000) {
+                const hit = _responseCache.get(url);
+                if (hit && Date.now() - hit.time < ttl) return Promise.resolve(hit.response.clone());
+
+                if (!_inflightRequests.has(url)) {
+                    const request = fetch(url).then(response => {
+                        if (response.ok) _responseCache.set(url, { time: Date.now(), response: response.clone() });
+                        return response;
+                    }).finally(() => _inflightRequests.delete(url));
+                    _inflightRequests.set(url, request);
+                }
+                return _inflightRequests.get(url).then(response => response.clone());
+            }
+
+            function invalidateFetchCache(url) {
+                _responseCache.delete(url);
+            }
+
             // Initialize page
             document.addEventListener('DOMContentLoaded', function() {
                 initializeCustomDropdowns(); // Initialize custom dropdowns
@@ -4860,7 +4124,7 @@ async def catalog_page():
                     });
                     
                     if (response.ok) {
-                        removeTagFromUICatalog(workflowId, tagValue);
+                        removeTagFromUICatalog(workflowId, button.closest('.tag-item-wrapper-catalog'));
                         showToast('Tag deleted successfully', 'success');
                     } else {
                         alert('Failed to delete tag');
@@ -4898,16 +4162,9 @@ async def catalog_page():
                 container.insertAdjacentHTML('beforeend', tagHtml);
             }
 
-            function removeTagFromUICatalog(workflowId, tagValue) {
+            function removeTagFromUICatalog(workflowId, tagWrapper) {
                 const container = document.getElementById(`tags-container-${workflowId}`);
-                const tagWrappers = container.querySelectorAll('.tag-item-wrapper-catalog');
-                
-                tagWrappers.forEach(wrapper => {
-                    const textSpan = wrapper.querySelector('.tag-text');
-                    if (textSpan && textSpan.textContent === `🏷️ ${tagValue}`) {
-                        wrapper.remove();
-                    }
-                });
+                tagWrapper.remove();
                 
                 // Add "No tags" placeholder if container is empty
                 if (container.children.length === 0) {
@@ -5105,7 +4362,7 @@ async def catalog_page():
 
             async function loadCollectionPickerList() {
                 try {
-                    const response = await fetch(`${API_BASE}/collections`);
+                    const response = await fetchCached(`${API_BASE}/collections`);
                     if (!response.ok) return;
                     
                     const data = await response.json();
@@ -5167,6 +4424,7 @@ async def catalog_page():
                     }
                     
                     document.getElementById('quick-collection-name').value = '';
+                    invalidateFetchCache(`${API_BASE}/collections`);
                     await loadCollectionPickerList();
                     
                     // Also reload the main collections dropdown and the collection filter
@@ -5195,33 +4453,30 @@ async def catalog_page():
                 }
                 
                 try {
-                    let successCount = 0;
-                    let failedCount = 0;
+                    // Assign collections to all selected workflows in one request
+                    const response = await fetch(`${API_BASE}/workflows/collections/bulk`, {
+                        method: 'POST',
+                        headers: { 'Content-Type': 'application/json' },
+                        body: JSON.stringify({
+                            workflow_ids: collectionPickerWorkflows,
+                            collection_ids: selectedCollectionIds
+                        })
+                    });
                     
-                    // Assign collections to each workflow
-                    for (const workflowId of collectionPickerWorkflows) {
-                        console.log(`Assigning collections ${selectedCollectionIds} to workflow ${workflowId}`);
-                        
-                        const response = await fetch(`${API_BASE}/workflows/${workflowId}/collections`, {
-                            method: 'POST',
-                            headers: { 'Content-Type': 'application/json' },
-                            body: JSON.stringify({ collection_ids: selectedCollectionIds })
-                        });
-                        
-                        if (response.ok) {
-                            successCount++;
-                        } else {
-                            failedCount++;
-                            const errorData = await response.json();
-                            console.error(`Failed to update workflow ${workflowId}:`, errorData);
-                        }
+                    if (!response.ok) {
+                        const errorData = await response.json();
+                        console.error('Failed to update workflows:', errorData);
+                        showToast('Failed to update collections', 'error');
+                        return;
                     }
                     
-                    if (failedCount > 0) {
-                        showToast(`Updated ${successCount} workflows, failed ${failedCount}`, 'error');
+                    const result = await response.json();
+                    if (result.missing.length > 0) {
+                        showToast(`Updated ${result.updated} workflows, failed ${result.missing.length}`, 'error');
                         return;
                     }
                     
+                    invalidateFetchCache(`${API_BASE}/collections`);
                     closeCollectionPicker();
                     clearSelection();
                     toggleBulkSelectMode(); // Exit bulk mode
@@ -5240,7 +4495,7 @@ async def catalog_page():
             // Collections Management Functions
             async function loadCollections() {
                 try {
-                    const response = await fetch(`${API_BASE}/collections`);
+                    const response = await fetchCached(`${API_BASE}/collections`);
                     if (!response.ok) return;
                     
                     const data = await response.json();
@@ -6036,7 +5291,7 @@ def get_interface_html() -> str:
                 });
                 
                 if (response.ok) {
-                    removeTagFromUICatalog(workflowId, tagValue);
+                    removeTagFromUICatalog(workflowId, button.closest('.tag-item-wrapper-catalog'));
                     showToast('Tag deleted successfully', 'success');
                 } else {
                     alert('Failed to delete tag');
@@ -6074,16 +5329,9 @@ def get_interface_html() -> str:
             container.insertAdjacentHTML('beforeend', tagHtml);
         }
 
-        function removeTagFromUICatalog(workflowId, tagValue) {
+        function removeTagFromUICatalog(workflowId, tagWrapper) {
             const container = document.getElementById(`tags-container-${workflowId}`);
-            const tagWrappers = container.querySelectorAll('.tag-item-wrapper-catalog');
-            
-            tagWrappers.forEach(wrapper => {
-                const textSpan = wrapper.querySelector('.tag-text');
-                if (textSpan && textSpan.textContent === tagValue) {
-                    wrapper.remove();
-                }
-            });
+            tagWrapper.remove();
             
             // Add "No tags" placeholder if container is empty
             if (container.children.length === 0) {